@@ -0,0 +1,72 @@
+"""
+bench_money.py
+
+Compares the float-backed Money class with the integer-backed FixedMoney class on the operations PyActy leans on the
+most: building values, accumulating them, and comparing them (which is what _validate_depreciation and check_bs do).
+
+Run it from the root of the repository:
+    python -m benchmarks.bench_money
+"""
+
+import timeit
+from typing import Callable
+
+from src.pyacty.fundamentals.FixedMoney import FixedMoney
+from src.pyacty.fundamentals.Money import Money
+
+NUMBER: int = 100_000
+
+
+def bench(money_type: type[Money]) -> dict[str:float]:
+    """
+    Times each operation for the given Money type.
+    :param money_type: Money or FixedMoney.
+    :return: The seconds each operation took, in {operation: seconds} format.
+    """
+    left: Money = money_type(10_000.554555)
+    right: Money = money_type(9_999.995)
+
+    operations: dict[str:Callable[[], object]] = {
+        "construct": lambda: money_type(1_234.5678),
+        "add": lambda: left + right,
+        "multiply": lambda: left * 1.5,
+        "divide": lambda: left / 12,
+        "compare (<=)": lambda: left <= right,
+        "compare (==)": lambda: left == right,
+        "rounded_value": lambda: left.rounded_value,
+        "str": lambda: str(left),
+    }
+
+    return {name: timeit.timeit(operation, number=NUMBER) for name, operation in operations.items()}
+
+
+def drift(money_type: type[Money], iterations: int = 1_000_000) -> float:
+    """
+    Adds a cent to a running total over and over and measures how far the total drifts away from the true value.
+    :param money_type: Money or FixedMoney.
+    :param iterations: How many cents to add.
+    :return: How far the total is from the true value.
+    """
+    running_total: Money = money_type()
+
+    for _ in range(iterations):
+        running_total += 0.01
+
+    return abs(running_total.value - iterations / 100)
+
+
+def main() -> None:
+    float_times: dict[str:float] = bench(Money)
+    fixed_times: dict[str:float] = bench(FixedMoney)
+
+    print(f"{"operation":<16}{"Money (s)":>12}{"FixedMoney (s)":>16}{"ratio":>8}")
+
+    for name, float_time in float_times.items():
+        print(f"{name:<16}{float_time:>12.4f}{fixed_times[name]:>16.4f}{fixed_times[name] / float_time:>8.2f}")
+
+    print()
+    print(f"Drift after 1,000,000 cent additions: Money = {drift(Money):.10f}, FixedMoney = {drift(FixedMoney):.10f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+bench_render.py
+
+Compares rendering statements with thousands of accounts through string.Template (how FsSkeleton rendered every line
+before layouts were compiled) with the compiled layouts FsSkeleton uses now (see Layout.py). Both render the exact same
+elements, and the outputs are checked against each other.
+
+The Template side substitutes each element twice, once for its width and once for its line, like the old renderer did,
+but it leaves out the debug print the old width property made, so it's a generous baseline.
+
+Run it from the root of the repository:
+    python -m benchmarks.bench_render
+"""
+
+import timeit
+from string import Template
+
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.skeletons.FsSkeleton import FsSkeleton
+
+ACCOUNT_COUNTS: list[int] = [1_000, 5_000, 10_000]
+NUMBER: int = 5
+
+
+def build_statement(accounts: int) -> BalanceSheet:
+    """
+    :param accounts: How many accounts the statement should have.
+    :return: A balance sheet with the accounts split between the three categories.
+    """
+    bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+
+    for index in range(accounts):
+        bal_sheet.add_account(f"Account {index:05}", ["asset", "liability", "equity"][index % 3], index * 1.25)
+
+    return bal_sheet
+
+
+def template_render(skeleton: FsSkeleton) -> str:
+    """
+    Renders every element of a skeleton with string.Template.substitute().
+    :param skeleton: The skeleton, after auto_render().
+    :return: The output, in the same format as auto_render().
+    """
+    output: list[str] = []
+    min_width: int = skeleton._min_width
+
+    for element in skeleton.elements.values():
+        template: Template = element.template
+        indent: str = " " * element.total_indent
+        width: int = len(template.substitute(element.mappings, end="", divider="", indent=indent, spacer="",
+                                             left_spacer="", central_spacer="", right_spacer=""))
+        width_diff: int = max(min_width - width, 0)
+        output.append(template.substitute(
+            element.mappings,
+            end="+" if element.edge else "|",
+            divider="-" * (min_width - 2),
+            indent=indent,
+            spacer=" " * width_diff,
+            left_spacer=" " * (width_diff // 2),
+            central_spacer="·" * width_diff,
+            right_spacer=" " * (width_diff - width_diff // 2)
+        ) + "\n")
+
+    return "".join(output)
+
+
+def layout_render(skeleton: FsSkeleton) -> str:
+    """
+    Renders every element of a skeleton with its compiled layout. The cached widths and lines are cleared first, so
+    everything is worked out again like it is for a new skeleton.
+    :param skeleton: The skeleton, after auto_render().
+    :return: The output, in the same format as auto_render().
+    """
+    for element in skeleton.elements.values():
+        element._width = None
+        element._rendered_width = None
+
+    return "".join(f"{line}\n" for line in skeleton.lines())
+
+
+def main() -> None:
+    print(f"{"accounts":>10}{"Template (s)":>15}{"Layout (s)":>13}{"speedup":>10}{"auto_render (s)":>18}")
+
+    for accounts in ACCOUNT_COUNTS:
+        bal_sheet: BalanceSheet = build_statement(accounts)
+        skeleton: FsSkeleton = FsSkeleton(bal_sheet.fs, bal_sheet.company, bal_sheet.fs_name, bal_sheet.date)
+        output: str = skeleton.auto_render()
+
+        if template_render(skeleton) != output or layout_render(skeleton) != output:
+            raise AssertionError("The outputs don't match.")
+
+        template_time: float = timeit.timeit(lambda: template_render(skeleton), number=NUMBER) / NUMBER
+        layout_time: float = timeit.timeit(lambda: layout_render(skeleton), number=NUMBER) / NUMBER
+        # The whole thing, including building the elements from the statement. str(bal_sheet) would reuse the
+        # statement's skeleton instead.
+        auto_time: float = timeit.timeit(lambda: FsSkeleton(bal_sheet.fs, bal_sheet.company, bal_sheet.fs_name,
+                                                            bal_sheet.date).auto_render(), number=NUMBER) / NUMBER
+
+        print(f"{accounts:>10,}{template_time:>15.4f}{layout_time:>13.4f}{template_time / layout_time:>9.1f}x"
+              f"{auto_time:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
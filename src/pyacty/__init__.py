@@ -2,4 +2,5 @@ from .analytics import *
 from .assets import *
 from .deductions import *
 from .entities import *
+from .ledger import *
 from .statements import *
@@ -0,0 +1,177 @@
+"""
+AmortizationEngine.py
+
+The AmortizationEngine amortizes an entire register of intangible assets at once, the same way DepreciationEngine
+depreciates tangible assets (see BatchEngine.py). A 30-year monthly annuity schedule for every asset in the register is
+360 rounds of array operations, instead of 360 calls to IntangibleAsset.amortize() per asset.
+
+The math is done in the same order as IntangibleAsset.amortize(), so the results match amortize() exactly.
+"""
+
+from typing import Iterable, Self
+
+import numpy as np
+
+from .BatchEngine import BatchEngine
+from .IntangibleAsset import IntangibleAsset
+from ..constants import (AMORTIZATION_METHODS, ANNUITY, BALLOON, BULLET, DECLINING_BALANCE, NEGATIVE_AMORTIZATION,
+                         STRAIGHT_LINE)
+from ..fundamentals.MoneyArray import MoneyArray
+
+
+class AmortizationEngine(BatchEngine):
+    methods = AMORTIZATION_METHODS
+    method_type = "amortization"
+
+    def __init__(self, value: Iterable[float] | np.ndarray, life: Iterable[int] | np.ndarray,
+                 method: int | Iterable[int] | np.ndarray, decline: float | Iterable[float] | np.ndarray = 1.0,
+                 rate: float | Iterable[float] | np.ndarray = 0.0, balloon: float | Iterable[float] | np.ndarray = 0.0,
+                 payment: float | Iterable[float] | np.ndarray = 0.0,
+                 total_amort: float | Iterable[float] | np.ndarray = 0.0,
+                 rem_life: Iterable[int] | np.ndarray | None = None) -> None:
+        """
+        Amortizes many intangible assets at once. Every argument is either a single value, which is used for every
+        asset, or one value per asset.
+        :param value: The value of each asset.
+        :param life: The life of each asset (in months).
+        :param method: The amortization method of each asset (see IntangibleAsset.amortize()).
+        :param decline: The decline used when amortizing with the Declining Balance Method.
+        :param rate: The annual interest rate used by the Annuity and Negative Amortization Methods.
+        :param balloon: The value left for the final period by the Balloon Method.
+        :param payment: The payment made each period with the Negative Amortization Method.
+        :param total_amort: The total value already amortized for each asset.
+        :param rem_life: The remaining life of each asset (in months). Defaults to the life of the asset.
+        """
+        super().__init__(value, life, method, total_amort, rem_life)
+        self.decline: np.ndarray = self.column(decline, np.float64)
+        self.rate: np.ndarray = self.column(rate, np.float64)
+        self.balloon: np.ndarray = self.column(balloon, np.float64)
+        self.payment: np.ndarray = self.column(payment, np.float64)
+        # The discount factors used by the Annuity Method, in {periods: (rate, life, factors)} format. See
+        # _discount_factors().
+        self._factors: dict[int:tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[IntangibleAsset], method: int | Iterable[int] | np.ndarray,
+                    decline: float | Iterable[float] | np.ndarray = 1.0,
+                    rate: float | Iterable[float] | np.ndarray = 0.0,
+                    balloon: float | Iterable[float] | np.ndarray = 0.0,
+                    payment: float | Iterable[float] | np.ndarray = 0.0) -> Self:
+        """
+        Creates an engine from the current state of existing IntangibleAsset objects. The assets themselves aren't
+        changed by the engine. See __init__() for the rest of the arguments.
+        :param assets: The assets to amortize.
+        :return: The new engine.
+        """
+        assets = list(assets)
+
+        return cls(
+            value=[asset.value.value for asset in assets],
+            life=[asset.life for asset in assets],
+            method=method,
+            decline=decline,
+            rate=rate,
+            balloon=balloon,
+            payment=payment,
+            total_amort=[asset.total_amort.value for asset in assets],
+            rem_life=[asset.rem_life for asset in assets]
+        )
+
+    # Properties
+    @property
+    def total_amort(self) -> np.ndarray:
+        """
+        :return: The total value amortized for each asset.
+        """
+        return self.total
+
+    @total_amort.setter
+    def total_amort(self, new_total: np.ndarray) -> None:
+        self.total = new_total
+
+    # Methods
+    def _check_denominators(self) -> None:
+        """
+        IntangibleAsset.amortize() raises a ZeroDivisionError when an asset has a life of 0, except with the Bullet and
+        Negative Amortization Methods, which never divide by it. NumPy would quietly return inf or nan instead, so this
+        raises the error ahead of time.
+        :return: Nothing.
+        """
+        if ((self.life == 0) & ~np.isin(self.method, [BULLET, NEGATIVE_AMORTIZATION])).any():
+            raise ZeroDivisionError("An asset has a life of 0.")
+
+    def _discount_factors(self, periods: int) -> np.ndarray:
+        """
+        Finds (1 + rate) ** -payments for every asset, which is what the Annuity Method uses to find the level payment.
+        NumPy's ** doesn't always give the same last digit as Python's, so Python's is used to match amortize()
+        exactly. That's slow, but the factors only depend on the rate and life, so they're only found again when one
+        of those changes.
+        :param periods: How many periods are being amortized (in months).
+        :return: The discount factor of each asset.
+        """
+        cached: tuple[np.ndarray, np.ndarray, np.ndarray] | None = self._factors.get(periods)
+
+        if cached is None or not (np.array_equal(cached[0], self.rate) and np.array_equal(cached[1], self.life)):
+            factors: np.ndarray = np.array([(1 + rate * periods / 12) ** -(life / periods)
+                                            for rate, life in zip(self.rate.tolist(), self.life.tolist())],
+                                           dtype=np.float64)
+            cached = self._factors[periods] = (self.rate.copy(), self.life.copy(), factors)
+
+        return cached[2]
+
+    def amortize(self, periods: int = 12) -> MoneyArray:
+        """
+        Amortizes every asset once, exactly as IntangibleAsset.amortize() would.
+        :param periods: How many periods to amortize (in months).
+        :return: The dollar value amortized for each asset.
+        """
+        self._check_denominators()
+        return MoneyArray._from_array(self._amortize(periods))
+
+    def _amortize(self, periods: int) -> np.ndarray:
+        """
+        The actual amortization, without the checks done by amortize().
+        :param periods: How many periods to amortize (in months).
+        :return: The dollar value amortized for each asset.
+        """
+        net_value: np.ndarray = self.net_value
+        period_rate: np.ndarray = self.rate * periods / 12
+        final_period: np.ndarray = self.rem_life <= periods
+        amort_amts: dict[int:np.ndarray] = {}
+
+        # See DepreciationEngine._depreciate().
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if (self.method == STRAIGHT_LINE).any():
+                amort_amts[STRAIGHT_LINE] = (self.value / self.life) * periods
+
+            if (self.method == DECLINING_BALANCE).any():
+                amort_amts[DECLINING_BALANCE] = ((net_value / self.life) * self.decline) * periods
+
+            if (self.method == ANNUITY).any():
+                payments: np.ndarray = self.life / periods
+                level_payment: np.ndarray = np.where(period_rate == 0, self.value / payments,
+                                                     (self.value * period_rate) / (1 - self._discount_factors(periods)))
+                amort_amts[ANNUITY] = level_payment - net_value * period_rate
+
+            if (self.method == BULLET).any():
+                amort_amts[BULLET] = np.where(final_period, net_value, 0.0)
+
+            if (self.method == BALLOON).any():
+                amort_amts[BALLOON] = np.where(final_period, net_value,
+                                               ((self.value - self.balloon) / self.life) * periods)
+
+            if (self.method == NEGATIVE_AMORTIZATION).any():
+                amort_amts[NEGATIVE_AMORTIZATION] = self.payment - net_value * period_rate
+
+        return self._book(amort_amts, net_value, periods)
+
+    def schedule(self, steps: int | None = None, periods: int = 12) -> MoneyArray:
+        """
+        Amortizes every asset over and over, recording each period's amortization.
+        :param steps: How many times to amortize each asset. Defaults to enough times to cover the longest remaining
+        life.
+        :param periods: How many periods to amortize each time (in months).
+        :return: A (number of assets x steps) array of the dollar value amortized each time.
+        """
+        self._check_denominators()
+        return self._run(steps, periods, lambda step: self._amortize(periods))
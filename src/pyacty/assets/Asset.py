@@ -2,6 +2,7 @@
 Asset.py
 """
 
+import copy
 from typing import override
 
 from ..fundamentals.Money import Money
@@ -19,15 +20,22 @@ class Asset:
         self.name: str = name
         self._life: int = life
         self._rem_life: int = life
-        self._value: Money = value if type(value) == Money else Money(value)
+        # Money objects passed in are copied, since the in-place operators (like +=) would otherwise change the
+        # caller's object too.
+        self._value: Money = copy.copy(value) if isinstance(value, Money) else Money(value)
 
-        # Stored for later use.
+        # Stored for later use. Money objects are copied because the in-place operators (like +=) would otherwise
+        # change the stored values too.
         self.init_values: dict[str:str | int | float | Money] = {
             "name": self.name,
             "life": self._life,
-            "value": self._value
+            "value": copy.copy(self._value)
         }
 
+        # Schedules created by schedule() in TangibleAsset and IntangibleAsset, in {arguments: Schedule} format. They're
+        # thrown away whenever an estimate (life, value, etc.) changes, since they'd be out of date.
+        self._schedules: dict = {}
+
     @override
     def __str__(self) -> str:
         pass
@@ -49,6 +57,7 @@ class Asset:
         """
         self._rem_life += new_life - self._life
         self._life = new_life
+        self._schedules.clear()
 
     @property
     def rem_life(self) -> int:
@@ -74,7 +83,8 @@ class Asset:
         :return: Nothing.
         """
         # I don't know if this should happen, but I can't think of any reason why it shouldn't...
-        self._value = new_value if type(new_value) == Money else Money(new_value)
+        self._value = copy.copy(new_value) if isinstance(new_value, Money) else Money(new_value)
+        self._schedules.clear()
 
     # Methods
     def reset(self) -> None:
@@ -0,0 +1,597 @@
+"""
+AssetRegister.py
+
+An AssetRegister stores many tangible and intangible assets as parallel NumPy arrays (one array per field) instead of
+one object per asset. Each TangibleAsset carries its own __dict__, an init_values dict, and several Money objects, which
+adds up to several hundred bytes per asset, while a row of the register is under a hundred bytes plus its name.
+
+Indexing the register (register[5] or register["Forklift"]) returns a view of that row, which behaves like a
+TangibleAsset or IntangibleAsset but reads and writes the register's arrays directly. The saving comes from the arrays,
+not the views: a view is still a full Python object (Asset doesn't use __slots__, so it even gets an empty __dict__),
+but it's cheap to create and doesn't need to be kept around. The Money objects views return are copies, so changing
+one with an in-place operator doesn't change the register, but assigning it back (view.value = new_value, or
+view.total_depr += 100) does.
+
+close() runs a whole period (month-end, usually) for every asset in the register at once. The register is split into
+chunks of assets, and each chunk can be handed to a process or thread pool. Since every asset is depreciated or
+amortized on its own, the chunks never depend on each other, and the results are the same no matter how many workers
+are used.
+"""
+
+import concurrent.futures as cf
+import math
+from typing import Iterable, Iterator, override, Self
+
+import numpy as np
+
+from .AmortizationEngine import AmortizationEngine
+from .Asset import Asset
+from .DepreciationEngine import DepreciationEngine
+from .IntangibleAsset import IntangibleAsset
+from .TangibleAsset import TangibleAsset
+from ..constants import AMORTIZATION_METHODS, DEPRECIATION_METHODS
+from ..fundamentals.Money import Money
+from ..fundamentals.MoneyArray import MoneyArray
+
+# The columns that close() needs, which are the only ones sent to the workers.
+CLOSE_COLUMNS: list[str] = ["tangible", "life", "rem_life", "value", "slvg_value", "prod_cap", "total_depr",
+                            "total_amort"]
+
+
+def _close_chunk(columns: dict[str:np.ndarray], options: dict[str:np.ndarray], periods: int) -> dict[str:np.ndarray]:
+    """
+    Closes a period for one chunk of a register. This is a plain function (instead of a method) so that it can be sent
+    to a process pool.
+    :param columns: The chunk's slice of each column in CLOSE_COLUMNS.
+    :param options: The chunk's slice of each of close()'s per asset arguments, in {argument: values} format.
+    :param periods: How many periods to depreciate and amortize (in months).
+    :return: The expense of each asset, along with the new total_depr, total_amort, and rem_life columns.
+    """
+    tangible: np.ndarray = columns["tangible"]
+    intangible: np.ndarray = ~tangible
+    expenses: np.ndarray = np.zeros(len(tangible), dtype=np.float64)
+    total_depr: np.ndarray = columns["total_depr"].copy()
+    total_amort: np.ndarray = columns["total_amort"].copy()
+    rem_life: np.ndarray = columns["rem_life"].copy()
+
+    if tangible.any():
+        depr_engine: DepreciationEngine = DepreciationEngine(
+            columns["value"][tangible], columns["life"][tangible], options["depr_method"][tangible],
+            columns["slvg_value"][tangible], options["decline"][tangible], columns["prod_cap"][tangible],
+            total_depr[tangible], rem_life[tangible]
+        )
+
+        expenses[tangible] = depr_engine.depreciate(periods, options["units_prod"][tangible]).value
+        total_depr[tangible] = depr_engine.total_depr
+        rem_life[tangible] = depr_engine.rem_life
+
+    if intangible.any():
+        amort_engine: AmortizationEngine = AmortizationEngine(
+            columns["value"][intangible], columns["life"][intangible], options["amort_method"][intangible],
+            options["decline"][intangible], options["rate"][intangible], options["balloon"][intangible],
+            options["payment"][intangible], total_amort[intangible], rem_life[intangible]
+        )
+
+        expenses[intangible] = amort_engine.amortize(periods).value
+        total_amort[intangible] = amort_engine.total_amort
+        rem_life[intangible] = amort_engine.rem_life
+
+    return {"expenses": expenses, "total_depr": total_depr, "total_amort": total_amort, "rem_life": rem_life}
+
+
+class AssetRegister:
+    # The name of every column, and the type of its array. init_* columns are what each row goes back to when reset.
+    columns: dict[str:type] = {
+        "tangible": np.bool_,
+        "life": np.int64,
+        "rem_life": np.int64,
+        "value": np.float64,
+        "slvg_value": np.float64,
+        "prod_cap": np.int64,
+        "total_depr": np.float64,
+        "total_amort": np.float64,
+        "init_life": np.int64,
+        "init_value": np.float64,
+        "init_slvg_value": np.float64,
+        "init_prod_cap": np.int64
+    }
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        An empty register of assets.
+        :param capacity: How many assets to make room for up front. The register grows on its own when it runs out of
+        room, so this only avoids copying the arrays when the size of the register is known ahead of time.
+        """
+        self.names: list[str] = []
+        # Finds the row of an asset from its name, in {name: row} format.
+        self._index: dict[str:int] = {}
+        self._size: int = 0
+        self._arrays: dict[str:np.ndarray] = {column: np.zeros(max(capacity, 1), dtype=dtype)
+                                              for column, dtype in self.columns.items()}
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[Asset]) -> Self:
+        """
+        Creates a register from existing TangibleAsset and IntangibleAsset objects, in their current state. The assets
+        themselves aren't changed, and aren't linked to the register afterward.
+        :param assets: The assets to store.
+        :return: The new register.
+        """
+        assets = list(assets)
+        register: AssetRegister = cls(len(assets))
+
+        for asset in assets:
+            register.add(asset)
+
+        return register
+
+    # Dunders
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __getitem__(self, key: int | str) -> "TangibleAssetView | IntangibleAssetView":
+        """
+        :param key: The row (starting at 0) or name of an asset.
+        :return: A view of the asset.
+        """
+        row: int = self.row(key) if isinstance(key, str) else key
+
+        if row < 0:
+            row += self._size
+
+        if not 0 <= row < self._size:
+            raise IndexError("Row out of range.")
+
+        if self._arrays["tangible"][row]:
+            return TangibleAssetView(self, row)
+
+        return IntangibleAssetView(self, row)
+
+    def __iter__(self) -> Iterator["TangibleAssetView | IntangibleAssetView"]:
+        for row in range(self._size):
+            yield self[row]
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Properties
+    # Each of these is a view of the part of the array that's in use, so changing it changes the register. They're
+    # replaced whenever the register grows, so they shouldn't be held onto while adding assets.
+    @property
+    def life(self) -> np.ndarray:
+        """
+        :return: The life of each asset (in months).
+        """
+        return self.column("life")
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: The memory used by the arrays of the register, not counting the names.
+        """
+        return sum(array.nbytes for array in self._arrays.values())
+
+    @property
+    def prod_cap(self) -> np.ndarray:
+        """
+        :return: The estimated maximum production of each asset (0 for intangible assets).
+        """
+        return self.column("prod_cap")
+
+    @property
+    def rem_life(self) -> np.ndarray:
+        """
+        :return: The remaining life of each asset (in months).
+        """
+        return self.column("rem_life")
+
+    @property
+    def slvg_value(self) -> np.ndarray:
+        """
+        :return: The salvage value of each asset (0 for intangible assets).
+        """
+        return self.column("slvg_value")
+
+    @property
+    def tangible(self) -> np.ndarray:
+        """
+        :return: Whether each asset is tangible (True) or intangible (False).
+        """
+        return self.column("tangible")
+
+    @property
+    def total_amort(self) -> np.ndarray:
+        """
+        :return: The total amortized for each asset (0 for tangible assets).
+        """
+        return self.column("total_amort")
+
+    @property
+    def total_depr(self) -> np.ndarray:
+        """
+        :return: The total depreciated for each asset (0 for intangible assets).
+        """
+        return self.column("total_depr")
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        :return: The value of each asset.
+        """
+        return self.column("value")
+
+    # Methods
+    def _append(self, name: str, tangible: bool, life: int, value: float, slvg_value: float, prod_cap: int,
+                init_values: dict[str:str | int | float | Money] | None = None) -> int:
+        """
+        Adds a row to the register, growing the arrays if needed.
+        :param name: The name of the asset.
+        :param tangible: Whether the asset is tangible.
+        :param life: The life of the asset (in months).
+        :param value: The value of the asset.
+        :param slvg_value: The salvage value of the asset.
+        :param prod_cap: The estimated maximum production of the asset.
+        :param init_values: The post-initialization state of the asset, if it's different from the values above.
+        :return: The row of the new asset.
+        """
+        if name in self._index:
+            raise ValueError(f"An asset named '{name}' is already in the register.")
+
+        capacity: int = len(self._arrays["life"])
+
+        # Doubling the capacity means the arrays are only copied a handful of times, even for huge registers.
+        if self._size == capacity:
+            for column, array in self._arrays.items():
+                grown: np.ndarray = np.zeros(capacity * 2, dtype=array.dtype)
+                grown[:capacity] = array
+                self._arrays[column] = grown
+
+        if init_values is None:
+            init_values = {"life": life, "value": value, "slvg_value": slvg_value, "prod_cap": prod_cap}
+
+        row: int = self._size
+        arrays: dict[str:np.ndarray] = self._arrays
+
+        arrays["tangible"][row] = tangible
+        arrays["life"][row] = life
+        arrays["rem_life"][row] = life
+        arrays["value"][row] = float(value)
+        arrays["slvg_value"][row] = float(slvg_value)
+        arrays["prod_cap"][row] = prod_cap
+        arrays["total_depr"][row] = 0.0
+        arrays["total_amort"][row] = 0.0
+        arrays["init_life"][row] = init_values["life"]
+        arrays["init_value"][row] = float(init_values["value"])
+        arrays["init_slvg_value"][row] = float(init_values.get("slvg_value", 0.0))
+        arrays["init_prod_cap"][row] = init_values.get("prod_cap", 0)
+
+        self.names.append(name)
+        self._index[name] = row
+        self._size += 1
+
+        return row
+
+    def add(self, asset: Asset) -> int:
+        """
+        Copies the current state of an existing TangibleAsset or IntangibleAsset into the register.
+        :param asset: The asset to copy.
+        :return: The row of the new asset.
+        """
+        row: int
+
+        if isinstance(asset, TangibleAsset):
+            row = self._append(asset.name, True, asset.life, asset.value, asset.slvg_value, asset.prod_cap,
+                               asset.init_values)
+            self._arrays["total_depr"][row] = float(asset.total_depr)
+
+        elif isinstance(asset, IntangibleAsset):
+            row = self._append(asset.name, False, asset.life, asset.value, 0.0, 0, asset.init_values)
+            self._arrays["total_amort"][row] = float(asset.total_amort)
+
+        else:
+            raise TypeError("Only TangibleAsset and IntangibleAsset objects can be added to a register.")
+
+        self._arrays["rem_life"][row] = asset.rem_life
+
+        return row
+
+    def add_intangible(self, name: str, life: int, value: Money | float | int) -> int:
+        """
+        Adds a new intangible asset. The arguments are the same as IntangibleAsset.
+        :return: The row of the new asset.
+        """
+        return self._append(name, False, life, value, 0.0, 0)
+
+    def add_tangible(self, name: str, life: int, value: Money | float | int, slvg_value: Money | float | int = 0.0,
+                     prod_cap: int = 0) -> int:
+        """
+        Adds a new tangible asset. The arguments are the same as TangibleAsset.
+        :return: The row of the new asset.
+        """
+        return self._append(name, True, life, value, slvg_value, prod_cap)
+
+    def close(self, depr_method: int | Iterable[int] | np.ndarray = 0,
+              amort_method: int | Iterable[int] | np.ndarray = 0, periods: int = 1,
+              decline: float | Iterable[float] | np.ndarray = 1.0, units_prod: int | Iterable[int] | np.ndarray = 0,
+              rate: float | Iterable[float] | np.ndarray = 0.0, balloon: float | Iterable[float] | np.ndarray = 0.0,
+              payment: float | Iterable[float] | np.ndarray = 0.0, workers: int = 1, use_threads: bool = False,
+              chunk_size: int | None = None) -> tuple[MoneyArray, Money]:
+        """
+        Closes a period for the entire register, depreciating every tangible asset and amortizing every intangible
+        asset exactly as depreciate() and amortize() would. Every argument that takes one value per asset also accepts
+        a single value, which is used for every asset.
+        :param depr_method: The depreciation method of each asset (see TangibleAsset.depreciate()). Ignored for
+        intangible assets.
+        :param amort_method: The amortization method of each asset (see IntangibleAsset.amortize()). Ignored for
+        tangible assets.
+        :param periods: How many periods to close (in months).
+        :param decline: The decline used by the Declining Balance Method.
+        :param units_prod: The number of units produced by each asset, used by the Units of Production Method.
+        :param rate: The annual interest rate used by the Annuity and Negative Amortization Methods.
+        :param balloon: The value left for the final period by the Balloon Method.
+        :param payment: The payment made each period with the Negative Amortization Method.
+        :param workers: How many processes (or threads) to spread the work across. With 1 worker, the chunks are
+        processed one after another in the current process, which gives the exact same results.
+        :param use_threads: Whether to use a thread pool instead of a process pool. Threads skip the cost of copying
+        each chunk to another process, but only run in parallel while NumPy is doing the math.
+        :param chunk_size: How many assets are in each chunk. Defaults to splitting the register into four chunks per
+        worker.
+        :return: The expense of each asset, and the total expense of the register.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        size: int = self._size
+
+        def per_asset(values: int | float | Iterable[int | float] | np.ndarray, dtype: type) -> np.ndarray:
+            """
+            :param values: A single value, or one value per asset.
+            :param dtype: The type of the array.
+            :return: An array with one value per asset.
+            """
+            return np.broadcast_to(np.asarray(values, dtype=dtype), (size,))
+
+        options: dict[str:np.ndarray] = {
+            "depr_method": per_asset(depr_method, np.int64),
+            "amort_method": per_asset(amort_method, np.int64),
+            "decline": per_asset(decline, np.float64),
+            "units_prod": per_asset(units_prod, np.float64),
+            "rate": per_asset(rate, np.float64),
+            "balloon": per_asset(balloon, np.float64),
+            "payment": per_asset(payment, np.float64)
+        }
+
+        # The engines would raise these too, but only after some of the chunks had already been processed.
+        if not np.isin(options["depr_method"][self.tangible], DEPRECIATION_METHODS).all():
+            raise ValueError("Invalid depreciation method.")
+
+        if not np.isin(options["amort_method"][~self.tangible], AMORTIZATION_METHODS).all():
+            raise ValueError("Invalid amortization method.")
+
+        if chunk_size is None:
+            chunk_size = max(math.ceil(size / (workers * 4)), 1)
+
+        columns: dict[str:np.ndarray] = {column: self.column(column) for column in CLOSE_COLUMNS}
+        starts: range = range(0, size, chunk_size)
+        chunks: list[tuple] = [({column: array[start:start + chunk_size] for column, array in columns.items()},
+                                {option: array[start:start + chunk_size] for option, array in options.items()}, periods)
+                               for start in starts]
+        results: list[dict[str:np.ndarray]]
+
+        if workers == 1:
+            results = [_close_chunk(*chunk) for chunk in chunks]
+
+        else:
+            pool_type: type = cf.ThreadPoolExecutor if use_threads else cf.ProcessPoolExecutor
+
+            with pool_type(max_workers=workers) as pool:
+                # map() returns the results in the same order as the chunks, no matter which worker finishes first.
+                results = list(pool.map(_close_chunk, *zip(*chunks)))
+
+        expenses: np.ndarray = np.empty(size, dtype=np.float64)
+
+        # Nothing is written back until every chunk has finished, so an error in any chunk leaves the register as it
+        # was.
+        for start, result in zip(starts, results):
+            end: int = start + chunk_size
+            expenses[start:end] = result["expenses"]
+            self.total_depr[start:end] = result["total_depr"]
+            self.total_amort[start:end] = result["total_amort"]
+            self.rem_life[start:end] = result["rem_life"]
+
+        # The total is added up from the merged array, so it doesn't depend on how the register was chunked.
+        return MoneyArray._from_array(expenses), Money(float(expenses.sum()))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        :param name: The name of the column (see AssetRegister.columns).
+        :return: A view of the part of the column that's in use.
+        """
+        return self._arrays[name][:self._size]
+
+    def reset(self) -> None:
+        """
+        Resets every asset in the register to its post-initialization state.
+        :return: Nothing.
+        """
+        self.life[:] = self.column("init_life")
+        self.rem_life[:] = self.column("init_life")
+        self.value[:] = self.column("init_value")
+        self.slvg_value[:] = self.column("init_slvg_value")
+        self.prod_cap[:] = self.column("init_prod_cap")
+        self.total_depr[:] = 0.0
+        self.total_amort[:] = 0.0
+
+    def row(self, name: str) -> int:
+        """
+        :param name: The name of an asset.
+        :return: The row of the asset.
+        """
+        try:
+            return self._index[name]
+
+        except KeyError:
+            raise KeyError(f"There is no asset named '{name}' in the register.") from None
+
+
+class _RowView:
+    # Only the register and row are stored. TangibleAsset and IntangibleAsset don't define __slots__, so views still
+    # get a __dict__, but nothing is ever stored in it unless someone adds their own attributes.
+    __slots__ = ("_register", "_row")
+
+    def __init__(self, register: AssetRegister, row: int) -> None:
+        """
+        A view of a single row of an AssetRegister. Asset's private attributes are replaced with properties that read
+        and write the register's arrays, so every method inherited from Asset works on the register directly.
+        :param register: The register.
+        :param row: The row of the asset.
+        """
+        # Asset.__init__ isn't called because it would try to store everything on the view.
+        self._register: AssetRegister = register
+        self._row: int = row
+
+    # Dunders
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _RowView):
+            return NotImplemented
+
+        return self._register is other._register and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._register), self._row))
+
+    # Properties
+    @property
+    def init_values(self) -> dict[str:str | int | Money]:
+        register: AssetRegister = self._register
+
+        return {
+            "name": self.name,
+            "life": int(register._arrays["init_life"][self._row]),
+            "value": Money(float(register._arrays["init_value"][self._row]))
+        }
+
+    @property
+    def name(self) -> str:
+        return self._register.names[self._row]
+
+    @name.setter
+    def name(self, new_name: str) -> None:
+        register: AssetRegister = self._register
+
+        if new_name in register._index and register._index[new_name] != self._row:
+            raise ValueError(f"An asset named '{new_name}' is already in the register.")
+
+        del register._index[register.names[self._row]]
+        register.names[self._row] = new_name
+        register._index[new_name] = self._row
+
+    @property
+    def row(self) -> int:
+        """
+        :return: The row of the asset in its register.
+        """
+        return self._row
+
+    @property
+    def _life(self) -> int:
+        return int(self._register._arrays["life"][self._row])
+
+    @_life.setter
+    def _life(self, new_life: int) -> None:
+        self._register._arrays["life"][self._row] = new_life
+
+    @property
+    def _rem_life(self) -> int:
+        return int(self._register._arrays["rem_life"][self._row])
+
+    @_rem_life.setter
+    def _rem_life(self, new_rem_life: int) -> None:
+        self._register._arrays["rem_life"][self._row] = new_rem_life
+
+    # Views are created and thrown away all the time, so they don't cache schedules. Every call gets an empty dict,
+    # which means schedule() always builds a fresh (and therefore up to date) schedule.
+    @property
+    def _schedules(self) -> dict:
+        return {}
+
+    @property
+    def _value(self) -> Money:
+        return Money(float(self._register._arrays["value"][self._row]))
+
+    @_value.setter
+    def _value(self, new_value: Money | float | int) -> None:
+        self._register._arrays["value"][self._row] = float(new_value)
+
+
+class TangibleAssetView(_RowView, TangibleAsset):
+    __slots__ = ()
+
+    # Properties
+    @override
+    @property
+    def init_values(self) -> dict[str:str | int | Money]:
+        register: AssetRegister = self._register
+        init_values: dict[str:str | int | Money] = super().init_values
+        init_values["slvg_value"] = Money(float(register._arrays["init_slvg_value"][self._row]))
+        init_values["prod_cap"] = int(register._arrays["init_prod_cap"][self._row])
+        return init_values
+
+    @property
+    def prod_cap(self) -> int:
+        return int(self._register._arrays["prod_cap"][self._row])
+
+    @prod_cap.setter
+    def prod_cap(self, new_prod_cap: int) -> None:
+        self._register._arrays["prod_cap"][self._row] = new_prod_cap
+
+    @property
+    def _slvg_value(self) -> Money:
+        return Money(float(self._register._arrays["slvg_value"][self._row]))
+
+    @_slvg_value.setter
+    def _slvg_value(self, new_value: Money | float | int) -> None:
+        self._register._arrays["slvg_value"][self._row] = float(new_value)
+
+    @property
+    def _total_depr(self) -> Money:
+        return Money(float(self._register._arrays["total_depr"][self._row]))
+
+    @_total_depr.setter
+    def _total_depr(self, new_value: Money | float | int) -> None:
+        self._register._arrays["total_depr"][self._row] = float(new_value)
+
+    # Methods
+    @override
+    def reset(self) -> None:
+        init_values: dict[str:str | int | Money] = self.init_values
+
+        self._life = init_values["life"]
+        self._rem_life = init_values["life"]
+        self._value = init_values["value"]
+        self._slvg_value = init_values["slvg_value"]
+        self.prod_cap = init_values["prod_cap"]
+        self._total_depr = 0.0
+
+
+class IntangibleAssetView(_RowView, IntangibleAsset):
+    __slots__ = ()
+
+    # Properties
+    @property
+    def _total_amort(self) -> Money:
+        return Money(float(self._register._arrays["total_amort"][self._row]))
+
+    @_total_amort.setter
+    def _total_amort(self, new_value: Money | float | int) -> None:
+        self._register._arrays["total_amort"][self._row] = float(new_value)
+
+    # Methods
+    @override
+    def reset(self) -> None:
+        init_values: dict[str:str | int | Money] = self.init_values
+
+        self._life = init_values["life"]
+        self._rem_life = init_values["life"]
+        self._value = init_values["value"]
+        self._total_amort = 0.0
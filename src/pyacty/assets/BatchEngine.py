@@ -0,0 +1,119 @@
+"""
+BatchEngine.py
+
+The machinery shared by DepreciationEngine and AmortizationEngine. Each asset's values are stored in NumPy arrays, so
+every period is a handful of array operations instead of one call to depreciate() or amortize() per asset.
+
+Subclasses only need to calculate each period's amount for every method they support. Picking each asset's method,
+keeping the totals from passing their limit, and running whole schedules is all done here, the same way for both.
+"""
+
+from typing import Callable, Iterable
+
+import numpy as np
+
+from ..fundamentals.MoneyArray import MoneyArray, round_values
+
+
+class BatchEngine:
+    # The methods supported by the engine, and what they're called in error messages. Set by subclasses.
+    methods: list[int] = []
+    method_type: str = ""
+
+    def __init__(self, value: Iterable[float] | np.ndarray, life: Iterable[int] | np.ndarray,
+                 method: int | Iterable[int] | np.ndarray, total: float | Iterable[float] | np.ndarray = 0.0,
+                 rem_life: Iterable[int] | np.ndarray | None = None) -> None:
+        """
+        A partially abstract class. Every argument is either a single value, which is used for every asset, or one
+        value per asset.
+        :param value: The value of each asset.
+        :param life: The life of each asset (in months).
+        :param method: The method used by each asset.
+        :param total: The total value already depreciated or amortized for each asset.
+        :param rem_life: The remaining life of each asset (in months). Defaults to the life of the asset.
+        """
+        self.value: np.ndarray = np.array(value, dtype=np.float64, ndmin=1)
+        self.life: np.ndarray = self.column(life, np.int64)
+        self.method: np.ndarray = self.column(method, np.int64)
+        self.total: np.ndarray = self.column(total, np.float64)
+        self.rem_life: np.ndarray = self.column(self.life if rem_life is None else rem_life, np.int64)
+
+        if not np.isin(self.method, self.methods).all():
+            raise ValueError(f"Invalid {self.method_type} method.")
+
+        # Stored for later use.
+        self.init_values: dict[str:np.ndarray] = {
+            "total": self.total.copy(),
+            "rem_life": self.rem_life.copy()
+        }
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    # Properties
+    @property
+    def net_value(self) -> np.ndarray:
+        """
+        :return: Each asset's value net of accumulated depreciation or amortization.
+        """
+        return self.value - self.total
+
+    # Methods
+    def _book(self, amounts: dict[int:np.ndarray], limit: np.ndarray, periods: int) -> np.ndarray:
+        """
+        Picks out each asset's amount, keeps it from going past the limit, and adds it to the totals. This is the
+        vectorized version of _validate_depreciation() and _validate_amortization().
+        :param amounts: The amount for every asset under each method used in the register, in {method: amounts} format.
+        :param limit: The most that can be booked for each asset.
+        :param periods: How many periods were calculated (in months).
+        :return: The dollar value booked for each asset.
+        """
+        amount: np.ndarray
+
+        if len(amounts) == 1:
+            amount = np.broadcast_to(next(iter(amounts.values())), limit.shape)
+
+        else:
+            amount = np.select([self.method == method for method in amounts], list(amounts.values()))
+
+        actual: np.ndarray = np.where(round_values(amount) <= round_values(limit), amount, limit)
+
+        self.total += actual
+        self.rem_life -= periods
+
+        return actual
+
+    def column(self, values: float | int | Iterable[float | int] | np.ndarray, dtype: type) -> np.ndarray:
+        """
+        Turns a single value or one value per asset into an array with one value per asset.
+        :param values: The value(s) to turn into an array.
+        :param dtype: The type of the array.
+        :return: The array.
+        """
+        return np.array(np.broadcast_to(np.asarray(values, dtype=dtype), (len(self),)))
+
+    def _run(self, steps: int | None, periods: int, step: Callable[[int], np.ndarray]) -> MoneyArray:
+        """
+        Runs the engine over and over, recording each period.
+        :param steps: How many times to run. Defaults to enough times to cover the longest remaining life.
+        :param periods: How many periods each step covers (in months).
+        :param step: Runs a single step, given the number of the step.
+        :return: A (number of assets x steps) array of the dollar value booked each time.
+        """
+        if steps is None:
+            steps = max(int(-(-self.rem_life.max(initial=0) // periods)), 0)
+
+        booked: np.ndarray = np.empty((len(self), steps), dtype=np.float64)
+
+        for step_number in range(steps):
+            booked[:, step_number] = step(step_number)
+
+        return MoneyArray._from_array(booked)
+
+    def reset(self) -> None:
+        """
+        Resets every asset to its post-initialization state.
+        :return: Nothing.
+        """
+        self.total = self.init_values["total"].copy()
+        self.rem_life = self.init_values["rem_life"].copy()
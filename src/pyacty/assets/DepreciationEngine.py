@@ -0,0 +1,237 @@
+"""
+DepreciationEngine.py
+
+The DepreciationEngine depreciates an entire register of tangible assets at once. Each asset's values are stored in
+NumPy arrays, so every period is a handful of array operations instead of one call to TangibleAsset.depreciate() per
+asset.
+
+The math is done in the same order as TangibleAsset.depreciate(), and the salvage value is respected the same way as
+TangibleAsset._validate_depreciation(), so the results match depreciate() exactly. The parts shared with
+AmortizationEngine are in BatchEngine.py.
+"""
+
+from typing import Iterable, Self
+
+import numpy as np
+
+from .BatchEngine import BatchEngine
+from .TangibleAsset import TangibleAsset
+from ..constants import DECLINING_BALANCE, DEPRECIATION_METHODS, STRAIGHT_LINE, SUM_OF_YEARS, UNITS_OF_PRODUCTION
+from ..fundamentals.MoneyArray import MoneyArray
+
+
+class DepreciationEngine(BatchEngine):
+    methods = DEPRECIATION_METHODS
+    method_type = "depreciation"
+
+    def __init__(self, value: Iterable[float] | np.ndarray, life: Iterable[int] | np.ndarray,
+                 method: int | Iterable[int] | np.ndarray, slvg_value: float | Iterable[float] | np.ndarray = 0.0,
+                 decline: float | Iterable[float] | np.ndarray = 1.0, prod_cap: int | Iterable[int] | np.ndarray = 0,
+                 total_depr: float | Iterable[float] | np.ndarray = 0.0,
+                 rem_life: Iterable[int] | np.ndarray | None = None) -> None:
+        """
+        Depreciates many tangible assets at once. Every argument is either a single value, which is used for every
+        asset, or one value per asset.
+        :param value: The value of each asset.
+        :param life: The life of each asset (in months).
+        :param method: The depreciation method of each asset (see TangibleAsset.depreciate()).
+        :param slvg_value: The salvage value of each asset.
+        :param decline: The decline used when depreciating with the Declining Balance Method.
+        :param prod_cap: The estimated maximum production of each asset.
+        :param total_depr: The total value already depreciated for each asset.
+        :param rem_life: The remaining life of each asset (in months). Defaults to the life of the asset.
+        """
+        super().__init__(value, life, method, total_depr, rem_life)
+        self.slvg_value: np.ndarray = self.column(slvg_value, np.float64)
+        self.decline: np.ndarray = self.column(decline, np.float64)
+        self.prod_cap: np.ndarray = self.column(prod_cap, np.int64)
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[TangibleAsset], method: int | Iterable[int] | np.ndarray,
+                    decline: float | Iterable[float] | np.ndarray = 1.0) -> Self:
+        """
+        Creates an engine from the current state of existing TangibleAsset objects. The assets themselves aren't
+        changed by the engine.
+        :param assets: The assets to depreciate.
+        :param method: The depreciation method of each asset.
+        :param decline: The decline used when depreciating with the Declining Balance Method.
+        :return: The new engine.
+        """
+        assets = list(assets)
+
+        return cls(
+            value=[asset.value.value for asset in assets],
+            life=[asset.life for asset in assets],
+            method=method,
+            slvg_value=[asset.slvg_value.value for asset in assets],
+            decline=decline,
+            prod_cap=[asset.prod_cap for asset in assets],
+            total_depr=[asset.total_depr.value for asset in assets],
+            rem_life=[asset.rem_life for asset in assets]
+        )
+
+    # Properties
+    @property
+    def depreciable_allocation(self) -> np.ndarray:
+        """
+        :return: Each asset's value that is allowed to be depreciated.
+        """
+        return self.value - self.slvg_value
+
+    @property
+    def depreciable_value(self) -> np.ndarray:
+        """
+        :return: Each asset's value that can currently be depreciated.
+        """
+        return self.net_value - self.slvg_value
+
+    @property
+    def syd(self) -> np.ndarray:
+        """
+        :return: The denominator used when calculating depreciation using the Sum of the Years' Digits method.
+        """
+        years: np.ndarray = self.life // 12
+        return years * (years + 1) // 2
+
+    @property
+    def total_depr(self) -> np.ndarray:
+        """
+        :return: The total value depreciated for each asset.
+        """
+        return self.total
+
+    @total_depr.setter
+    def total_depr(self, new_total: np.ndarray) -> None:
+        self.total = new_total
+
+    # Methods
+    def _check_denominators(self) -> None:
+        """
+        TangibleAsset.depreciate() raises a ZeroDivisionError when an asset has a life or production capacity of 0 (or
+        less than a year of life for Sum of the Years' Digits). NumPy would quietly return inf or nan instead, so this
+        raises the error ahead of time.
+        :return: Nothing.
+        """
+        life_methods: np.ndarray = (self.method == STRAIGHT_LINE) | (self.method == DECLINING_BALANCE)
+
+        if ((life_methods & (self.life == 0)).any() or ((self.method == SUM_OF_YEARS) & (self.syd == 0)).any() or
+                ((self.method == UNITS_OF_PRODUCTION) & (self.prod_cap == 0)).any()):
+            raise ZeroDivisionError("An asset has a life or production capacity of 0.")
+
+    def accumulated_at(self, period: int | Iterable[int] | np.ndarray, periods: int = 12,
+                       units_prod: int | Iterable[int] | np.ndarray = 0) -> MoneyArray:
+        """
+        Finds each asset's total depreciation after the given number of calls to depreciate(), starting from the
+        beginning of its life, in the same amount of time for any period. This is the vectorized version of
+        TangibleAsset.accumulated_depr_at(), and the engine's current state isn't used or changed.
+        :param period: How many times each asset has been depreciated, either one number for every asset or one per
+        asset.
+        :param periods: How many periods each call to depreciate() covers (in months).
+        :param units_prod: The number of units produced by each asset every period.
+        :return: The total dollar value depreciated for each asset.
+        """
+        self._check_denominators()
+        period = np.broadcast_to(np.asarray(period, dtype=np.int64), (len(self),))
+
+        if (period < 0).any():
+            raise ValueError("period can't be negative.")
+
+        allocation: np.ndarray = self.depreciable_allocation
+        totals: dict[int:np.ndarray] = {}
+
+        # See TangibleAsset.accumulated_depr_at() for where each formula comes from.
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if (self.method == STRAIGHT_LINE).any():
+                totals[STRAIGHT_LINE] = ((allocation / self.life) * periods) * period
+
+            if (self.method == DECLINING_BALANCE).any():
+                remaining: np.ndarray = 1 - (self.decline / self.life) * periods
+                totals[DECLINING_BALANCE] = np.where(remaining <= 0, allocation,
+                                                     self.value * (1 - np.maximum(remaining, 0) ** period))
+
+            if (self.method == SUM_OF_YEARS).any():
+                syd_period: np.ndarray = np.minimum(period, -(-self.life // periods))
+                totals[SUM_OF_YEARS] = (allocation * (syd_period * self.life - periods * syd_period *
+                                                      (syd_period - 1) / 2) / (12 * self.syd))
+
+            if (self.method == UNITS_OF_PRODUCTION).any():
+                remaining: np.ndarray = 1 - np.asarray(units_prod, dtype=np.float64) / self.prod_cap
+                totals[UNITS_OF_PRODUCTION] = np.where(remaining <= 0, allocation,
+                                                       allocation * (1 - np.maximum(remaining, 0) ** period))
+
+        total: np.ndarray = np.select([self.method == method for method in totals], list(totals.values()))
+        return MoneyArray._from_array(np.where(period > 0, np.minimum(total, allocation), 0.0))
+
+    def depreciable_value_at(self, period: int | Iterable[int] | np.ndarray, periods: int = 12,
+                             units_prod: int | Iterable[int] | np.ndarray = 0) -> MoneyArray:
+        """
+        See accumulated_at().
+        :return: The value of each asset that can still be depreciated after the given period.
+        """
+        return self.depreciable_allocation - self.accumulated_at(period, periods, units_prod)
+
+    def net_value_at(self, period: int | Iterable[int] | np.ndarray, periods: int = 12,
+                     units_prod: int | Iterable[int] | np.ndarray = 0) -> MoneyArray:
+        """
+        See accumulated_at().
+        :return: The value of each asset net of accumulated depreciation after the given period.
+        """
+        return self.value - self.accumulated_at(period, periods, units_prod)
+
+    def depreciate(self, periods: int = 12, units_prod: int | Iterable[int] | np.ndarray = 0) -> MoneyArray:
+        """
+        Depreciates every asset once, exactly as TangibleAsset.depreciate() would.
+        :param periods: How many periods to depreciate (in months).
+        :param units_prod: The number of units produced by each asset, used when depreciating with the Units of
+        Production Method.
+        :return: The dollar value depreciated for each asset.
+        """
+        self._check_denominators()
+        return MoneyArray._from_array(self._depreciate(periods, np.asarray(units_prod, dtype=np.float64)))
+
+    def _depreciate(self, periods: int, units_prod: np.ndarray) -> np.ndarray:
+        """
+        The actual depreciation, without the checks done by depreciate().
+        :param periods: How many periods to depreciate (in months).
+        :param units_prod: The number of units produced by each asset.
+        :return: The dollar value depreciated for each asset.
+        """
+        net_value: np.ndarray = self.net_value
+        depreciable_value: np.ndarray = net_value - self.slvg_value
+        depr_amts: dict[int:np.ndarray] = {}
+
+        # Only the methods that are actually used in the register are calculated. Every one of them is calculated for
+        # every asset, and then the one each asset uses is picked out. The other methods may divide by zero, which is
+        # fine because those results are thrown away.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if (self.method == STRAIGHT_LINE).any():
+                depr_amts[STRAIGHT_LINE] = (self.depreciable_allocation / self.life) * periods
+
+            if (self.method == DECLINING_BALANCE).any():
+                depr_amts[DECLINING_BALANCE] = ((net_value / self.life) * self.decline) * periods
+
+            if (self.method == SUM_OF_YEARS).any():
+                depr_amts[SUM_OF_YEARS] = self.depreciable_allocation * ((self.rem_life / 12) / self.syd)
+
+            if (self.method == UNITS_OF_PRODUCTION).any():
+                depr_amts[UNITS_OF_PRODUCTION] = (depreciable_value / self.prod_cap) * units_prod
+
+        return self._book(depr_amts, depreciable_value, periods)
+
+    def schedule(self, steps: int | None = None, periods: int = 12,
+                 units_prod: int | Iterable[int] | np.ndarray = 0) -> MoneyArray:
+        """
+        Depreciates every asset over and over, recording each period's depreciation.
+        :param steps: How many times to depreciate each asset. Defaults to enough times to cover the longest remaining
+        life.
+        :param periods: How many periods to depreciate each time (in months).
+        :param units_prod: The number of units produced by each asset. This can either be one number per asset, which
+        is used every time, or a (number of assets x steps) array with the units produced each time.
+        :return: A (number of assets x steps) array of the dollar value depreciated each time.
+        """
+        self._check_denominators()
+
+        units_prod = np.asarray(units_prod, dtype=np.float64)
+
+        return self._run(steps, periods, lambda step: self._depreciate(periods, units_prod[:, step] if
+                                                                       units_prod.ndim == 2 else units_prod))
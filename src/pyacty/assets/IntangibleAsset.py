@@ -2,13 +2,18 @@
 IntangibleAsset.py
 
 Unlike hte TangibleAsset class, this class doesn't override the reset method inherited from Asset. I don't think it
-needs to because IntangibleAsset doesn't have any unique values, besides _total_amort, which always starts as a
-brand-new instance of Money (which is $0).
+needs to because IntangibleAsset doesn't have any unique values, besides _total_amort, which always starts as the shared
+$0 from Money.cached(). The first time something is added to it, += creates a new Money object for the asset.
 
 I'm not sure if Python actually behaves as I'm expecting it to, however.
 """
 
+import copy
+import math
+from typing import Iterator
+
 from .Asset import Asset
+from .Schedule import Schedule
 from ..fundamentals.Money import Money
 
 
@@ -17,7 +22,7 @@ class IntangibleAsset(Asset):
     def __init__(self, name: str, life: int, value: float):
         super().__init__(name, life, value)
         # Also known as accumulated amortization.
-        self._total_amort: Money = Money()
+        self._total_amort: Money = Money.cached(0)
 
     # Properties
     @property
@@ -30,33 +35,62 @@ class IntangibleAsset(Asset):
 
     @total_amort.setter
     def total_amort(self, new_value: Money | float | int):
-        self._total_amort = new_value if type(new_value) == Money else Money(new_value)
+        # Like TangibleAsset.total_depr, a Money object from somewhere else is copied so amortize() never changes it.
+        if new_value is not self._total_amort:
+            new_value = copy.copy(new_value) if isinstance(new_value, Money) else Money(new_value)
+
+        self._total_amort = new_value
 
     # Methods
+    def _fresh_copy(self) -> "IntangibleAsset":
+        """
+        :return: A new asset with the same estimates as this one, at the start of its life.
+        """
+        return IntangibleAsset(self.name, self.life, copy.copy(self.value))
+
     def _validate_amortization(self, amort_amt: Money) -> Money:
+        """
+        Validates the amount of amortization to ensure that the net value of the asset does not go below zero.
+        :param amort_amt: The amount being amortized.
+        :return: The amount that is permitted to be amortized.
+        """
         actual_amort: Money
 
         if amort_amt <= self.net_value:
-            self.total_amort += amort_amt
             actual_amort = amort_amt
 
         else:
-            self.total_amort += self.net_value
+            # net_value has to be stored before total_amort changes, otherwise it would always be $0.
             actual_amort = self.net_value
 
+        self.total_amort += actual_amort
+
         return actual_amort
 
-    def amortize(self, method: int, periods: int = 12, decline: float = 1.0) -> Money:
+    def amortize(self, method: int, periods: int = 12, decline: float = 1.0, rate: float = 0.0,
+                 balloon: Money | float | int = 0.0, payment: Money | float | int = 0.0) -> Money:
         """
         [Supported Amortization Methods] \n
         0: Straight Line Method \n
         1: Declining Balance Method \n
-        :param method:
-        :param periods:
-        :param decline:
-        :return:
+        2: Annuity Method, where the amortization is the principal portion of a level payment that pays the asset off
+        over its life at the given interest rate. \n
+        3: Bullet Method, where nothing is amortized until the final period, which amortizes everything. \n
+        4: Balloon Method, which amortizes everything but the balloon on a straight line, and then the balloon in the
+        final period. \n
+        5: Negative Amortization Method, where a fixed payment is made each period. When the payment doesn't cover the
+        interest, the difference is added to the asset and the amortization is negative. \n
+        :param method: The method of amortization to use.
+        :param periods: How many periods to amortize (in months).
+        :param decline: The decline used when amortizing with the Declining Balance Method.
+        :param rate: The annual interest rate used by the Annuity and Negative Amortization Methods.
+        :param balloon: The value left for the final period by the Balloon Method.
+        :param payment: The payment made each period with the Negative Amortization Method.
+        :return: The dollar value amortized.
         """
-        total_amortized: Money = Money()
+        total_amortized: Money = Money.cached(0)
+        # The interest rate over the periods being amortized.
+        period_rate: float = rate * periods / 12
 
         match method:
             # Straight Line
@@ -67,6 +101,79 @@ class IntangibleAsset(Asset):
             case 1:
                 total_amortized = self._validate_amortization(((self.net_value / self.life) * decline) * periods)
 
-            # Should other cases be added for annuity, bullet, balloon, and negative amortization?
+            # Annuity
+            case 2:
+                payments: float = self.life / periods
+                level_payment: Money
+
+                if period_rate == 0:
+                    level_payment = self.value / payments
+
+                else:
+                    level_payment = (self.value * period_rate) / (1 - (1 + period_rate) ** -payments)
+
+                total_amortized = self._validate_amortization(level_payment - self.net_value * period_rate)
+
+            # Bullet
+            case 3:
+                total_amortized = self._validate_amortization(self.net_value if self._rem_life <= periods else
+                                                              Money.cached(0))
+
+            # Balloon
+            case 4:
+                total_amortized = self._validate_amortization(self.net_value if self._rem_life <= periods else
+                                                              ((self.value - balloon) / self.life) * periods)
+
+            # Negative Amortization
+            case 5:
+                total_amortized = self._validate_amortization(payment - self.net_value * period_rate)
+
+        self._rem_life -= periods
 
         return total_amortized
+
+    def schedule(self, method: int, periods: int = 12, decline: float = 1.0, rate: float = 0.0,
+                 balloon: Money | float | int = 0.0, payment: Money | float | int = 0.0) -> Schedule:
+        """
+        Creates the full amortization schedule of the asset. See TangibleAsset.schedule(), and amortize() for the
+        arguments.
+        :return: The amortization schedule.
+        """
+        if periods <= 0:
+            raise ValueError("periods must be greater than 0.")
+
+        # Money objects can be changed in place after this, so the schedule (and its key) only ever sees their values.
+        balloon = float(balloon)
+        payment = float(payment)
+        key: tuple = (method, periods, decline, rate, balloon, payment)
+        schedules: dict = self._schedules
+
+        if key not in schedules:
+            schedules[key] = Schedule(
+                self._fresh_copy(),
+                lambda asset: asset.amortize(method, periods, decline, rate, balloon, payment),
+                "total_amort",
+                math.ceil(self.life / periods)
+            )
+
+        return schedules[key]
+
+    def stream_schedule(self, method: int, periods: int = 12, decline: float = 1.0, rate: float = 0.0,
+                        balloon: Money | float | int = 0.0,
+                        payment: Money | float | int = 0.0) -> Iterator[tuple[int, Money, Money, Money]]:
+        """
+        Generates the same periods as schedule() without keeping any of them. See TangibleAsset.stream_schedule(), and
+        amortize() for the arguments.
+        :return: The period (starting at 0), the expense, the accumulated amortization, and the net value of each
+        period.
+        """
+        if periods <= 0:
+            raise ValueError("periods must be greater than 0.")
+
+        balloon = float(balloon)
+        payment = float(payment)
+        asset: IntangibleAsset = self._fresh_copy()
+
+        for period in range(math.ceil(self.life / periods)):
+            yield (period, asset.amortize(method, periods, decline, rate, balloon, payment),
+                   copy.copy(asset.total_amort), asset.net_value)
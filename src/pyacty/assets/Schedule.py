@@ -0,0 +1,108 @@
+"""
+Schedule.py
+
+A Schedule is a read-only view of every period of an asset's depreciation (or amortization). Periods are only computed
+when they're first needed, and are remembered after that, so looking at schedule[37] computes periods 0 through 37 once
+and never again.
+
+Schedules work on their own private copy of the asset, so creating or reading one never changes the asset itself.
+"""
+
+from typing import Callable, Iterator
+
+from .Asset import Asset
+from ..fundamentals.Money import Money
+
+
+class Schedule:
+    __slots__ = ("_asset", "_step", "_total", "_length", "_expenses", "_accumulated", "_net_values")
+
+    def __init__(self, asset: Asset, step: Callable[[Asset], Money], total: str, length: int) -> None:
+        """
+        A lazily computed, read-only schedule.
+        :param asset: A private copy of the asset, in the state that the schedule starts from. It will be changed by
+        step, so it shouldn't be used anywhere else.
+        :param step: Computes a single period, for example by calling depreciate() on the asset.
+        :param total: The name of the asset's property holding the accumulated total (total_depr or total_amort).
+        :param length: The number of periods in the schedule.
+        """
+        self._asset: Asset = asset
+        self._step: Callable[[Asset], Money] = step
+        self._total: str = total
+        self._length: int = length
+        # Plain floats are stored instead of Money objects, since the in-place operators could be used to change a
+        # Money object that was handed out.
+        self._expenses: list[float] = []
+        self._accumulated: list[float] = []
+        self._net_values: list[float] = []
+
+    # Dunders
+    def __getitem__(self, period: int | slice) -> Money | list[Money]:
+        """
+        :param period: The period (starting at 0) or a slice of periods.
+        :return: The expense for the period, or a list of expenses for a slice.
+        """
+        if isinstance(period, slice):
+            return [Money(expense) for expense in self._expense_values(period)]
+
+        return Money(self._expenses[self._compute(period)])
+
+    def __iter__(self) -> Iterator[Money]:
+        for period in range(self._length):
+            yield Money(self._expenses[self._compute(period)])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Attributes can only be set once, by __init__.
+        if hasattr(self, name):
+            raise AttributeError("Schedules are read-only.")
+
+        super().__setattr__(name, value)
+
+    # Methods
+    def _compute(self, period: int) -> int:
+        """
+        Computes every period up to and including the given one, if they haven't been computed yet.
+        :param period: The period (starting at 0). Negative periods count back from the end of the schedule.
+        :return: The period, with negative periods converted to their positive equivalent.
+        """
+        if period < 0:
+            period += self._length
+
+        if not 0 <= period < self._length:
+            raise IndexError("Period out of range.")
+
+        while len(self._expenses) <= period:
+            self._expenses.append(self._step(self._asset).value)
+            self._accumulated.append(getattr(self._asset, self._total).value)
+            self._net_values.append(self._asset.net_value.value)
+
+        return period
+
+    def _expense_values(self, periods: slice) -> list[float]:
+        """
+        :param periods: A slice of periods.
+        :return: The expense for each period in the slice, as floats.
+        """
+        indices: range = range(*periods.indices(self._length))
+
+        if len(indices) > 0:
+            self._compute(max(indices[0], indices[-1]))
+
+        return [self._expenses[period] for period in indices]
+
+    def accumulated(self, period: int) -> Money:
+        """
+        :param period: The period (starting at 0).
+        :return: The total depreciated (or amortized) at the end of the period.
+        """
+        return Money(self._accumulated[self._compute(period)])
+
+    def net_value(self, period: int) -> Money:
+        """
+        :param period: The period (starting at 0).
+        :return: The value of the asset net of accumulated depreciation (or amortization) at the end of the period.
+        """
+        return Money(self._net_values[self._compute(period)])
@@ -0,0 +1,98 @@
+"""
+ScheduleExport.py
+
+Writes the depreciation and amortization schedules of many assets to a CSV or JSON Lines file. Rows are generated one
+at a time by stream_schedule() and written as they're generated, so only a single period of a single asset is ever held
+in memory, no matter how large the register or how long the schedules are.
+
+Each row is (asset, period, expense, accumulated, net_value), with the dollar values rounded to the nearest cent.
+"""
+
+import csv
+import itertools
+import json
+import os
+from typing import Iterable, Iterator, TextIO
+
+from .Asset import Asset
+from .IntangibleAsset import IntangibleAsset
+from .TangibleAsset import TangibleAsset
+from ..custom_exceptions import SupportError
+from ..storage import atomic_open
+
+SCHEDULE_HEADER: list[str] = ["asset", "period", "expense", "accumulated", "net_value"]
+
+
+def schedule_rows(assets: Iterable[Asset], method: int | Iterable[int] = 0, periods: int = 12, decline: float = 1.0,
+                  units_prod: int = 0, rate: float = 0.0, balloon: float = 0.0,
+                  payment: float = 0.0) -> Iterator[tuple[str, int, float, float, float]]:
+    """
+    Generates every period of every asset's schedule, one asset after another.
+    :param assets: The assets (TangibleAsset or IntangibleAsset objects, or the rows of an AssetRegister).
+    :param method: The method of depreciation or amortization to use, either one method for every asset or one per
+    asset. With one per asset, a ValueError is raised if there are more or fewer methods than assets.
+    :param periods: How many periods each row covers (in months).
+    :param decline: The decline used by the Declining Balance Method.
+    :param units_prod: The number of units produced each period, used by the Units of Production Method.
+    :param rate: The annual interest rate used by the Annuity and Negative Amortization Methods.
+    :param balloon: The value left for the final period by the Balloon Method.
+    :param payment: The payment made each period with the Negative Amortization Method.
+    :return: The rows of the schedules.
+    """
+    # The repeated method never runs out, so only a list of methods is checked against the number of assets.
+    pairs: Iterator[tuple[Asset, int]] = (zip(assets, itertools.repeat(method)) if isinstance(method, int) else
+                                          zip(assets, method, strict=True))
+
+    for asset, asset_method in pairs:
+        periods_iter: Iterator
+
+        if isinstance(asset, TangibleAsset):
+            periods_iter = asset.stream_schedule(asset_method, periods, decline, units_prod)
+
+        elif isinstance(asset, IntangibleAsset):
+            periods_iter = asset.stream_schedule(asset_method, periods, decline, rate, balloon, payment)
+
+        else:
+            raise TypeError("Only TangibleAsset and IntangibleAsset objects have schedules.")
+
+        for period, expense, accumulated, net_value in periods_iter:
+            yield asset.name, period, expense.rounded_value, accumulated.rounded_value, net_value.rounded_value
+
+
+def export_schedules(assets: Iterable[Asset], directory: str, file_name: str, file_type: str = "csv",
+                     method: int | Iterable[int] = 0, periods: int = 12, decline: float = 1.0, units_prod: int = 0,
+                     rate: float = 0.0, balloon: float = 0.0, payment: float = 0.0) -> int:
+    """
+    Streams the schedules of the given assets to a file. See schedule_rows() for the rest of the arguments.
+    :param assets: The assets to export.
+    :param directory: The directory to save the file to. It's created if it doesn't exist.
+    :param file_name: The name of the file, without an extension.
+    :param file_type: The type of file to save to (CSV or JSONL).
+    :return: How many rows were written, not counting the CSV header.
+    """
+    file_type = file_type.lower()
+
+    if file_type not in ["csv", "jsonl"]:
+        raise SupportError("PyActy only supports exporting schedules to .CSV and .JSONL files!")
+
+    rows: Iterator[tuple[str, int, float, float, float]] = schedule_rows(assets, method, periods, decline, units_prod,
+                                                                         rate, balloon, payment)
+    # Counts the rows as they pass through, since the generator can only be consumed once.
+    counter: itertools.count = itertools.count()
+    counted_rows: Iterator[tuple[str, int, float, float, float]] = (row for row, _ in zip(rows, counter))
+
+    outfile: TextIO
+
+    # Like save_fs(), the file is only replaced once every row has been written, so an error halfway through (like a
+    # list of methods that's too short) never leaves an incomplete export behind.
+    with atomic_open(os.path.join(directory, f"{file_name}.{file_type}")) as outfile:
+        if file_type == "csv":
+            csv_writer = csv.writer(outfile)
+            csv_writer.writerow(SCHEDULE_HEADER)
+            csv_writer.writerows(counted_rows)
+
+        else:
+            outfile.writelines(f"{json.dumps(dict(zip(SCHEDULE_HEADER, row)))}\n" for row in counted_rows)
+
+    # count() has already handed out one number per row, so the next number is the total.
+    return next(counter)
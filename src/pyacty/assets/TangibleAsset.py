@@ -1,9 +1,12 @@
 """
 TangibleAsset.py
 """
-from typing import override
+import copy
+import math
+from typing import Iterator, override
 
 from .Asset import Asset
+from .Schedule import Schedule
 from ..fundamentals.Money import Money
 
 
@@ -20,14 +23,14 @@ class TangibleAsset(Asset):
         :param prod_cap: The estimated maximum production of the asset.
         """
         super().__init__(name, life, value)
-        self._slvg_value: Money = slvg_value if type(slvg_value) == Money else Money(slvg_value)
+        self._slvg_value: Money = copy.copy(slvg_value) if isinstance(slvg_value, Money) else Money(slvg_value)
         # I don't think prod_cap needs any further considerations, since it's just a denominator in a single equation.
         self.prod_cap: int = prod_cap
         # Also known as accumulated depreciation.
-        self._total_depr: Money = Money()
+        self._total_depr: Money = Money.cached(0)
 
         # Stored for later use.
-        self.init_values["slvg_value"] = self._slvg_value
+        self.init_values["slvg_value"] = copy.copy(self._slvg_value)
         self.init_values["prod_cap"] = self.prod_cap
 
     # Properties
@@ -67,19 +70,17 @@ class TangibleAsset(Asset):
         :param new_value: The new salvage value of the asset.
         :return: Nothing.
         """
-        self._slvg_value = new_value if type(new_value) == Money else Money(new_value)
+        self._slvg_value = copy.copy(new_value) if isinstance(new_value, Money) else Money(new_value)
+        self._schedules.clear()
 
     @property
     def syd(self) -> int:
         """
         :return: The denominator used when calculating depreciation using the Sum of the Years' Digits method.
         """
-        running_total: int = 0
-
-        for i in range(1, self.life // 12 + 1):
-            running_total += i
-
-        return running_total
+        # 1 + 2 + ... + n is always n(n + 1) / 2, so there's no need to add up every year.
+        years: int = self.life // 12
+        return years * (years + 1) // 2
 
     @property
     def total_depr(self) -> Money:
@@ -97,9 +98,81 @@ class TangibleAsset(Asset):
         :param new_value: The new value of the asset which has been depreciated.
         :return: Nothing.
         """
-        self._total_depr = new_value if type(new_value) == Money else Money(new_value)
+        # A Money object from somewhere else is copied, so that depreciating the asset never changes it. The asset's own
+        # total (which += hands back here after changing it in place) is kept as it is.
+        if new_value is not self._total_depr:
+            new_value = copy.copy(new_value) if isinstance(new_value, Money) else Money(new_value)
+
+        self._total_depr = new_value
 
     # Methods
+    def accumulated_depr_at(self, method: int, period: int, periods: int = 12, decline: float = 1.0,
+                            units_prod: int = 0) -> Money:
+        """
+        Finds the total depreciated after the given number of calls to depreciate(), starting from the beginning of the
+        asset's life and using its current estimates. Every supported method has a formula for this, so it takes the
+        same amount of time for any period, and the asset itself isn't changed. The result matches depreciating period
+        by period (or schedule()), apart from floating point error far below a cent.
+        :param method: The method of depreciation to use (see depreciate()).
+        :param period: How many times the asset has been depreciated. 0 is the start of the asset's life.
+        :param periods: How many periods each call to depreciate() covers (in months).
+        :param decline: The decline used when depreciating with the Declining Balance Method.
+        :param units_prod: The number of units produced each period, used when depreciating with the Units of Production
+        Method.
+        :return: The total dollar value depreciated after the given period.
+        """
+        if period < 0:
+            raise ValueError("period can't be negative.")
+
+        allocation: float = self.depreciable_allocation.value
+        total: float = 0.0
+
+        match method:
+            # Straight Line
+            case 0:
+                total = ((allocation / self.life) * periods) * period
+
+            # Declining Balance, where each period leaves (1 - rate) of the net value behind.
+            case 1:
+                remaining: float = 1 - (decline / self.life) * periods
+                total = allocation if remaining <= 0 else self.value.value * (1 - remaining ** period)
+
+            # Sum of the Years' Digits, where each period takes (remaining life / 12) / syd of the allocation. The
+            # remaining life goes negative after the end of the asset's life, so the formula stops there.
+            case 2:
+                period = min(period, math.ceil(self.life / periods))
+                total = allocation * (period * self.life - periods * period * (period - 1) / 2) / (12 * self.syd)
+
+            # Units of Production, where each period takes units_prod / prod_cap of the remaining depreciable value.
+            case 3:
+                remaining: float = 1 - units_prod / self.prod_cap
+                total = allocation if remaining <= 0 else allocation * (1 - remaining ** period)
+
+        # _validate_depreciation() never lets the total go past the depreciable allocation.
+        return Money(min(total, allocation) if period > 0 else 0.0)
+
+    def depreciable_value_at(self, method: int, period: int, periods: int = 12, decline: float = 1.0,
+                             units_prod: int = 0) -> Money:
+        """
+        See accumulated_depr_at().
+        :return: The value that can still be depreciated after the given period.
+        """
+        return self.depreciable_allocation - self.accumulated_depr_at(method, period, periods, decline, units_prod)
+
+    def net_value_at(self, method: int, period: int, periods: int = 12, decline: float = 1.0,
+                     units_prod: int = 0) -> Money:
+        """
+        See accumulated_depr_at().
+        :return: The value of the asset net of accumulated depreciation after the given period.
+        """
+        return self.value - self.accumulated_depr_at(method, period, periods, decline, units_prod)
+
+    def _fresh_copy(self) -> "TangibleAsset":
+        """
+        :return: A new asset with the same estimates as this one, at the start of its life.
+        """
+        return TangibleAsset(self.name, self.life, copy.copy(self.value), copy.copy(self.slvg_value), self.prod_cap)
+
     def _validate_depreciation(self, depr_amt: Money) -> Money:
         """
         Validates the amount of depreciation to ensure that the net value of the asset does not go below zero or its
@@ -109,14 +182,16 @@ class TangibleAsset(Asset):
         """
         actual_depr: Money
 
-        if depr_amt <= self.net_value:
-            self.total_depr += depr_amt
+        # This is compared against depreciable_value instead of net_value so that the salvage value is respected.
+        if depr_amt <= self.depreciable_value:
             actual_depr = depr_amt
 
         else:
-            self.total_depr += self.depreciable_value
+            # depreciable_value has to be stored before total_depr changes, otherwise it would always be $0.
             actual_depr = self.depreciable_value
 
+        self.total_depr += actual_depr
+
         return actual_depr
 
     def depreciate(self, method: int, periods: int = 12, decline: float = 1.0, units_prod: int = 0) -> Money:
@@ -132,7 +207,7 @@ class TangibleAsset(Asset):
         :param units_prod: The number of units produced, used when depreciating with the Units of Production Method.
         :return: The dollar value depreciated.
         """
-        total_depreciated: Money = Money()
+        total_depreciated: Money = Money.cached(0)
 
         match method:
             # Straight Line
@@ -156,6 +231,63 @@ class TangibleAsset(Asset):
 
         return total_depreciated
 
+    def schedule(self, method: int, periods: int = 12, decline: float = 1.0, units_prod: int = 0) -> Schedule:
+        """
+        Creates the full depreciation schedule of the asset, from the start of its life, using its current estimates.
+        Each period of the schedule is the result of one call to depreciate() with the same arguments. Periods are only
+        computed when they're first accessed, and the asset itself isn't changed.
+
+        Schedules are cached, so calling this again with the same arguments returns the same object until the life,
+        value, or salvage value of the asset changes.
+        :param method: The method of depreciation to use (see depreciate()).
+        :param periods: How many periods each entry of the schedule covers (in months).
+        :param decline: The decline used when depreciating with the Declining Balance Method.
+        :param units_prod: The number of units produced each period, used when depreciating with the Units of Production
+        Method.
+        :return: The depreciation schedule.
+        """
+        if periods <= 0:
+            raise ValueError("periods must be greater than 0.")
+
+        # prod_cap isn't a property, so it's part of the key instead of clearing the cache when it changes.
+        key: tuple = (method, periods, decline, units_prod, self.prod_cap)
+
+        # The dict is looked up once, since AssetRegister's views hand out a new one every time.
+        schedules: dict = self._schedules
+
+        if key not in schedules:
+            schedules[key] = Schedule(
+                self._fresh_copy(),
+                lambda asset: asset.depreciate(method, periods, decline, units_prod),
+                "total_depr",
+                math.ceil(self.life / periods)
+            )
+
+        return schedules[key]
+
+    def stream_schedule(self, method: int, periods: int = 12, decline: float = 1.0,
+                        units_prod: int = 0) -> Iterator[tuple[int, Money, Money, Money]]:
+        """
+        Generates the same periods as schedule(), but nothing is kept once a period has been yielded, so the memory used
+        doesn't grow with the length of the schedule. This is meant for writing long schedules straight to a file (see
+        ScheduleExport.py). The asset itself isn't changed.
+        :param method: The method of depreciation to use (see depreciate()).
+        :param periods: How many periods each entry of the schedule covers (in months).
+        :param decline: The decline used when depreciating with the Declining Balance Method.
+        :param units_prod: The number of units produced each period, used when depreciating with the Units of Production
+        Method.
+        :return: The period (starting at 0), the expense, the accumulated depreciation, and the net value of each
+        period.
+        """
+        if periods <= 0:
+            raise ValueError("periods must be greater than 0.")
+
+        asset: TangibleAsset = self._fresh_copy()
+
+        for period in range(math.ceil(self.life / periods)):
+            yield (period, asset.depreciate(method, periods, decline, units_prod), copy.copy(asset.total_depr),
+                   asset.net_value)
+
     # Is there a more efficient way to override this?
     @override
     def reset(self) -> None:
@@ -1,3 +1,9 @@
+from .AmortizationEngine import *
 from .Asset import *
+from .AssetRegister import *
+from .BatchEngine import *
+from .DepreciationEngine import *
 from .IntangibleAsset import *
+from .Schedule import *
+from .ScheduleExport import *
 from .TangibleAsset import *
@@ -42,3 +42,30 @@ for category in BS_CATEGORIES:
 # Why is this done again?
 for category in IS_CATEGORIES:
     ALL_CATEGORIES.append(category)
+
+# Depreciation methods (see TangibleAsset.depreciate)
+STRAIGHT_LINE: Final[int] = 0
+DECLINING_BALANCE: Final[int] = 1
+SUM_OF_YEARS: Final[int] = 2
+UNITS_OF_PRODUCTION: Final[int] = 3
+DEPRECIATION_METHODS: Final[list[int]] = [
+    STRAIGHT_LINE,
+    DECLINING_BALANCE,
+    SUM_OF_YEARS,
+    UNITS_OF_PRODUCTION
+]
+
+# Amortization methods (see IntangibleAsset.amortize). Straight line and declining balance share their numbers with the
+# depreciation methods above.
+ANNUITY: Final[int] = 2
+BULLET: Final[int] = 3
+BALLOON: Final[int] = 4
+NEGATIVE_AMORTIZATION: Final[int] = 5
+AMORTIZATION_METHODS: Final[list[int]] = [
+    STRAIGHT_LINE,
+    DECLINING_BALANCE,
+    ANNUITY,
+    BULLET,
+    BALLOON,
+    NEGATIVE_AMORTIZATION
+]
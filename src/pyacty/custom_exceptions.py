@@ -6,3 +6,8 @@ custom_exceptions.py
 class SupportError(Exception):
     def __init__(self, message):
         super().__init__(message)
+
+
+class TotalsDriftError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
@@ -0,0 +1,354 @@
+"""
+FixedMoney.py
+
+FixedMoney is an alternate storage engine for Money. Instead of a float, it stores an exact integer count of "units",
+where a unit is a cent split into GUARD_DIGITS extra decimal places. Addition, subtraction, comparisons, and both
+rounding modes are done entirely with integers, so values never drift the way floats do after millions of operations.
+
+FixedMoney is a subclass of Money, so it can be passed anywhere a Money is expected and shares the "show_decimals" and
+"ieee_754_rounding" class attributes with it.
+"""
+
+from typing import Any, Final, override, Self
+
+from .Money import Money
+from .MoneyArray import MoneyArray
+
+# How many extra decimal places are kept past the cent. Four is enough to keep the rounding of multiplication and
+# division results from ever reaching the cent.
+GUARD_DIGITS: Final[int] = 4
+# Units per cent.
+CENT: Final[int] = 10 ** GUARD_DIGITS
+# Units per whole currency unit (dollar, peso, etc.).
+SCALE: Final[int] = 100 * CENT
+# Money rounds the fraction of a cent to the tenth of a cent before rounding it half-up, which means anything from
+# 0.45 of a cent up gets rounded up. See Money.rounded_value.
+HALF_UP_THRESHOLD: Final[int] = CENT * 45 // 100
+
+
+def to_units(other: Any) -> int:
+    """
+    Converts a FixedMoney, Money, integer, or float into units.
+    :param other: The value to convert.
+    :return: The value in units.
+    """
+    if type(other) == FixedMoney:
+        return other.units
+
+    if isinstance(other, Money):
+        other = other.value
+
+    if isinstance(other, int):
+        return other * SCALE
+
+    return round(other * SCALE)
+
+
+def to_rounded_units(other: Any) -> int:
+    """
+    Converts a FixedMoney, Money, integer, or float into units for a comparison. Money objects are rounded to the
+    nearest cent first, which is the same thing Money does when comparing two Money objects.
+    :param other: The value to convert.
+    :return: The value in units.
+    """
+    if type(other) == FixedMoney:
+        return other.rounded_units
+
+    if isinstance(other, Money):
+        return to_units(other.rounded_value)
+
+    return to_units(other)
+
+
+def div_round(numerator: int, denominator: int) -> int:
+    """
+    Integer division that rounds the result to the nearest integer instead of flooring it. Ties are rounded to the
+    nearest even number, which is the same thing Python's round() does.
+    :param numerator: The numerator.
+    :param denominator: The denominator.
+    :return: The rounded quotient.
+    """
+    # divmod() gives the remainder the same sign as the denominator, so flipping both signs keeps it positive.
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+
+    quotient, remainder = divmod(numerator, denominator)
+
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2 == 1):
+        quotient += 1
+
+    return quotient
+
+
+class FixedMoney(Money):
+    # The integer is stored in Money's _value slot, so no new slots are needed.
+    __slots__ = ()
+
+    # MoneyArray isn't a subclass of FixedMoney, so Python tries FixedMoney's dunders first when a FixedMoney is on the
+    # left side (FixedMoney(1) + MoneyArray([1, 2])). Every dunder that takes another value returns NotImplemented for
+    # a MoneyArray, which hands the operation to MoneyArray's reflected dunder, just like it does for Money.
+
+    def __init__(self, value: int | float | Money = 0, symbol: str = "$") -> None:
+        """
+        A Money object that stores its value as an exact integer instead of a float.
+        :param value: The value of the object.
+        :param symbol: The symbol that represents the desired currency.
+        """
+        # Money.__init__ isn't called because it would just store a float that gets replaced right away.
+        self._value: int = to_units(value)
+        self.symbol: str = symbol
+
+    @classmethod
+    def from_units(cls, units: int, symbol: str = "$") -> Self:
+        """
+        Creates a FixedMoney object directly from units, skipping any conversion.
+        :param units: The value in units.
+        :param symbol: The symbol that represents the desired currency.
+        :return: The new FixedMoney object.
+        """
+        new_money: FixedMoney = cls.__new__(cls)
+        new_money._value = units
+        new_money.symbol = symbol
+        return new_money
+
+    # Dunders
+    @override
+    def __add__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(self._value + to_units(other))
+
+    @override
+    def __radd__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(to_units(other) + self._value)
+
+    @override
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray) or not isinstance(other, int | float | Money):
+            return NotImplemented
+
+        return self.rounded_units == to_rounded_units(other)
+
+    @override
+    def __float__(self) -> float:
+        return self._value / SCALE
+
+    @override
+    def __floordiv__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units((self._value // to_units(other)) * SCALE)
+
+    @override
+    def __rfloordiv__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units((to_units(other) // self._value) * SCALE)
+
+    @override
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return self.rounded_units >= to_rounded_units(other)
+
+    @override
+    def __gt__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return self.rounded_units > to_rounded_units(other)
+
+    @override
+    def __hash__(self) -> int:
+        return hash(self.rounded_value)
+
+    @override
+    def __iadd__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        self._value += to_units(other)
+        return self
+
+    @override
+    def __imul__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        if isinstance(other, int):
+            self._value *= other
+
+        else:
+            self._value = div_round(self._value * to_units(other), SCALE)
+
+        return self
+
+    @override
+    def __int__(self) -> int:
+        # int() truncates towards zero, while // floors, so negative values need to be handled separately.
+        whole: int = abs(self._value) // SCALE
+        return whole if self._value >= 0 else -whole
+
+    @override
+    def __isub__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        self._value -= to_units(other)
+        return self
+
+    @override
+    def __itruediv__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        if isinstance(other, int):
+            self._value = div_round(self._value, other)
+
+        else:
+            self._value = div_round(self._value * SCALE, to_units(other))
+
+        return self
+
+    @override
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return self.rounded_units <= to_rounded_units(other)
+
+    @override
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return self.rounded_units < to_rounded_units(other)
+
+    @override
+    def __mod__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(self._value % to_units(other))
+
+    @override
+    def __mul__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        # Multiplying by an integer is exact, so there's no reason to round.
+        if isinstance(other, int):
+            return FixedMoney.from_units(self._value * other)
+
+        return FixedMoney.from_units(div_round(self._value * to_units(other), SCALE))
+
+    @override
+    def __rmul__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return self.__mul__(other)
+
+    @override
+    def __ne__(self, other: Any) -> bool:
+        if isinstance(other, MoneyArray) or not isinstance(other, int | float | Money):
+            return NotImplemented
+
+        return self.rounded_units != to_rounded_units(other)
+
+    # There's no exact way to raise a fixed-point number to a fractional power, so these fall back to floats.
+    @override
+    def __pow__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney(self.value ** float(other))
+
+    @override
+    def __rpow__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney(float(other) ** self.value)
+
+    @override
+    def __sub__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(self._value - to_units(other))
+
+    @override
+    def __rsub__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(to_units(other) - self._value)
+
+    @override
+    def __truediv__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        if isinstance(other, int):
+            return FixedMoney.from_units(div_round(self._value, other))
+
+        return FixedMoney.from_units(div_round(self._value * SCALE, to_units(other)))
+
+    @override
+    def __rtruediv__(self, other: Any) -> Self:
+        if isinstance(other, MoneyArray):
+            return NotImplemented
+
+        return FixedMoney.from_units(div_round(to_units(other) * SCALE, self._value))
+
+    # Properties
+    @property
+    def cents(self) -> int:
+        """
+        Rounds the value to the nearest cent using the same rules as Money.rounded_value.
+        :return: The rounded value, in cents.
+        """
+        if not self.ieee_754_rounding:
+            whole_cents, remainder = divmod(self._value, CENT)
+            return whole_cents + 1 if remainder >= HALF_UP_THRESHOLD else whole_cents
+
+        else:
+            return div_round(self._value, CENT)
+
+    @property
+    def rounded_units(self) -> int:
+        """
+        :return: The value rounded to the nearest cent, in units.
+        """
+        return self.cents * CENT
+
+    @property
+    def rounded_value(self) -> float:
+        """
+        :return: The value of FixedMoney, rounded to the nearest 100ths place.
+        """
+        return self.cents / 100
+
+    @property
+    def units(self) -> int:
+        """
+        :return: The exact value, in units.
+        """
+        return self._value
+
+    @property
+    def value(self) -> float:
+        return self._value / SCALE
+
+    @value.setter
+    def value(self, new_value: float | int | Money) -> None:
+        # Mirrors Money.value, which rounds to the second decimal when set.
+        self._value = div_round(to_units(new_value), CENT) * CENT
@@ -4,10 +4,18 @@ Money.py
 The Money class is a class that is designed to be used internally in PyActy to assist in formatting numbers when they
 are output to the console. The class attribute "show_decimals" can be changed to allow a user to either show or hide
 decimals across an entire project easily.
+
+Money uses __slots__ instead of a __dict__, since asset registers can hold tens of millions of them. The in-place
+operators (+=, -=, *=, /=) change the object itself instead of creating a new one, so be careful when the same Money
+object is shared between multiple places, or is being used as a dictionary key.
 """
 
 import math
-from typing import Any, override, Self
+from typing import Any, Final, override, Self
+
+# Whole amounts from 0 up to this number are cached by Money.cached().
+SMALL_VALUE_LIMIT: Final[int] = 100
+
 
 # Not sure if there's a better way to do this.
 def assure_type(other) -> float | int:
@@ -16,10 +24,22 @@ def assure_type(other) -> float | int:
     :param other: The other instance that math is being performed on.
     :return: The value to add or subtract.
     """
-    return other.value if type(other) == Money else other
+    return other.value if isinstance(other, Money) else other
+
+
+def assure_rounded(other) -> float | int:
+    """
+    Used when comparing an instance of Money with another Money, an integer, or a float. When both sides are Money, both
+    sides are rounded, which keeps comparisons consistent with __hash__.
+    :param other: The other instance that is being compared.
+    :return: The value to compare against.
+    """
+    return other.rounded_value if isinstance(other, Money) else other
 
 
 class Money:
+    __slots__ = ("_value", "symbol")
+
     show_decimals: bool = False
     # By default, Python uses IEEE 754 rounding rules. This standard results in 0.5 being rounded down to 0, which is
     # the opposite of what accountants are used to. By default, the Money class will round 0.5 up, but this can be
@@ -46,10 +66,10 @@ class Money:
     def __radd__(self, other: Any) -> Self:
         return Money(assure_type(other) + self.value)
 
-    # For comparisons, such as this one, should we figure out a way to compare self.value as well? Or would this be
-    # too confusing to use.
+    # Comparisons are done on the rounded values. When comparing against an integer or a float, the other side isn't
+    # rounded, so Money(10_000.101) != 10_000.101.
     def __eq__(self, other: Any) -> bool:
-        return self.rounded_value == assure_type(other)
+        return self.rounded_value == assure_rounded(other)
 
     def __float__(self) -> float:
         return float(self.value)
@@ -61,19 +81,53 @@ class Money:
         return Money(assure_type(other) // self.value)
 
     def __ge__(self, other: Any) -> bool:
-        return self.rounded_value >= assure_type(other)
+        return self.rounded_value >= assure_rounded(other)
 
     def __gt__(self, other: Any) -> bool:
-        return self.rounded_value > assure_type(other)
+        return self.rounded_value > assure_rounded(other)
+
+    # Equal Money objects (and numbers) always have the same rounded value, so they always have the same hash.
+    def __hash__(self) -> int:
+        return hash(self.rounded_value)
+
+    # Python falls back to the regular dunders when an in-place one returns NotImplemented. This is used whenever the
+    # other side is a subclass of Money (like MoneyArray), so that the result is the same as it would be for a + b.
+    def __iadd__(self, other: Any) -> Self:
+        if type(other) is not type(self) and isinstance(other, type(self)):
+            return NotImplemented
+
+        self._value += assure_type(other)
+        return self
+
+    def __imul__(self, other: Any) -> Self:
+        if type(other) is not type(self) and isinstance(other, type(self)):
+            return NotImplemented
+
+        self._value *= assure_type(other)
+        return self
 
     def __int__(self) -> int:
         return int(self.value)
 
+    def __isub__(self, other: Any) -> Self:
+        if type(other) is not type(self) and isinstance(other, type(self)):
+            return NotImplemented
+
+        self._value -= assure_type(other)
+        return self
+
+    def __itruediv__(self, other: Any) -> Self:
+        if type(other) is not type(self) and isinstance(other, type(self)):
+            return NotImplemented
+
+        self._value /= assure_type(other)
+        return self
+
     def __le__(self, other: Any) -> bool:
-        return self.rounded_value <= assure_type(other)
+        return self.rounded_value <= assure_rounded(other)
 
     def __lt__(self, other: Any) -> bool:
-        return self.rounded_value < assure_type(other)
+        return self.rounded_value < assure_rounded(other)
 
     def __mod__(self, other: Any) -> Self:
         return Money(self.value % assure_type(other))
@@ -85,7 +139,7 @@ class Money:
         return Money(assure_type(other) * self.value)
 
     def __ne__(self, other: Any) -> bool:
-        return self.rounded_value != assure_type(other)
+        return self.rounded_value != assure_rounded(other)
 
     def __pow__(self, other: Any) -> Self:
         return Money(self.value ** assure_type(other))
@@ -136,3 +190,57 @@ class Money:
     @value.setter
     def value(self, new_value: float | int) -> None:
         self._value = float(round(new_value, 2))
+
+    # Methods
+    @classmethod
+    def cached(cls, value: int | float = 0) -> Self:
+        """
+        Returns a shared, read-only Money object for whole amounts from 0 up to SMALL_VALUE_LIMIT (mainly $0), which
+        saves creating a new object every time one is needed. Any other amount, or any subclass of Money, gets a new
+        object.
+        :param value: The value of the object.
+        :return: The Money object.
+        """
+        if cls is Money:
+            try:
+                return _small_values[value]
+
+            except (KeyError, TypeError):
+                pass
+
+        return cls(value)
+
+
+class _CachedMoney(Money):
+    """
+    The read-only Money objects handed out by Money.cached(). Since they're shared, the in-place operators create a new
+    Money object instead of changing the shared one.
+    """
+    __slots__ = ()
+
+    @override
+    def __iadd__(self, other: Any) -> Money:
+        return self + other
+
+    @override
+    def __imul__(self, other: Any) -> Money:
+        return self * other
+
+    @override
+    def __isub__(self, other: Any) -> Money:
+        return self - other
+
+    @override
+    def __itruediv__(self, other: Any) -> Money:
+        return self / other
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, new_value: float | int) -> None:
+        raise AttributeError("Cached Money objects are shared and can't be changed.")
+
+
+_small_values: dict[int:Money] = {amount: _CachedMoney(amount) for amount in range(SMALL_VALUE_LIMIT + 1)}
@@ -0,0 +1,267 @@
+"""
+MoneyArray.py
+
+A MoneyArray holds many monetary values in a single NumPy array, so that math on an entire ledger happens in one
+operation instead of creating a new Money object for every value. It follows the same rules as Money: math is performed
+on the unrounded values, while comparisons and formatting use the rounded values. The "show_decimals" and
+"ieee_754_rounding" class attributes of Money apply to MoneyArray as well.
+
+MoneyArray is a subclass of Money. Besides sharing its class attributes, this makes Python call MoneyArray's reflected
+dunders first when a Money is on the left side of an operation (Money(1) + MoneyArray([1, 2])), so the result is a
+MoneyArray instead of a Money wrapped around an array.
+"""
+
+from typing import Any, Iterable, Iterator, override, Self
+
+import numpy as np
+
+from .Money import Money, assure_rounded, assure_type
+
+
+def round_values(values: np.ndarray) -> np.ndarray:
+    """
+    Rounds an array of values to the nearest 100ths place using the same rules as Money.rounded_value.
+    :param values: The values to round.
+    :return: The rounded values.
+    """
+    if not Money.ieee_754_rounding:
+        scaled: np.ndarray = values * 100
+        floored: np.ndarray = np.floor(scaled)
+        # Money rounds the fraction of a cent to one decimal place before checking if it's less than 0.5, which is the
+        # same as checking if the fraction is less than 0.45.
+        return np.where(scaled - floored < 0.45, floored, np.ceil(scaled)) / 100
+
+    else:
+        return np.round(values, 2)
+
+
+class MoneyArray(Money):
+    # The array is stored in Money's _value slot, so no new slots are needed.
+    __slots__ = ()
+    # Stops NumPy from handling operations like np.ndarray + MoneyArray itself, so that MoneyArray's reflected dunders
+    # are used instead.
+    __array_ufunc__ = None
+    # Comparisons return arrays, so a MoneyArray can't be hashed.
+    __hash__ = None
+
+    def __init__(self, values: Iterable[int | float | Money] | np.ndarray = (), symbol: str = "$") -> None:
+        """
+        An array of monetary values.
+        :param values: The values of the array. These can be numbers, Money objects, or a NumPy array.
+        :param symbol: The symbol that represents the desired currency.
+        """
+        # Money.__init__ isn't called because it would just store a float that gets replaced right away. NumPy calls
+        # __float__ on any Money objects in values, so they don't need to be converted first.
+        self._value: np.ndarray = np.array(assure_type(values), dtype=np.float64)
+        self.symbol: str = symbol
+
+    @classmethod
+    def _from_array(cls, values: np.ndarray, symbol: str = "$") -> Self:
+        """
+        Wraps an existing float64 array without copying it.
+        :param values: The array to wrap.
+        :param symbol: The symbol that represents the desired currency.
+        :return: The new MoneyArray.
+        """
+        new_array: MoneyArray = cls.__new__(cls)
+        new_array._value = values
+        new_array.symbol = symbol
+        return new_array
+
+    # Dunders
+    @override
+    def __str__(self) -> str:
+        return f"[{", ".join(self.formatted)}]"
+
+    @override
+    def __repr__(self) -> str:
+        return f"MoneyArray({self.formatted})"
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return self._value if dtype is None else self._value.astype(dtype)
+
+    def __getitem__(self, key: Any) -> Money | Self:
+        result: np.ndarray | np.float64 = self._value[key]
+
+        if isinstance(result, np.ndarray):
+            return MoneyArray._from_array(result, self.symbol)
+
+        return Money(float(result), self.symbol)
+
+    def __setitem__(self, key: Any, new_value: Any) -> None:
+        self._value[key] = assure_type(new_value)
+
+    def __iter__(self) -> Iterator[Money | Self]:
+        # Iterating over a multidimensional array yields each row as its own MoneyArray, just like NumPy does.
+        if self._value.ndim > 1:
+            for row in self._value:
+                yield MoneyArray._from_array(row, self.symbol)
+
+        else:
+            for value in self._value.tolist():
+                yield Money(value, self.symbol)
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    @override
+    def __add__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value + assure_type(other))
+
+    @override
+    def __radd__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) + self._value)
+
+    @override
+    def __eq__(self, other: Any) -> np.ndarray:
+        return self.rounded_value == assure_rounded(other)
+
+    @override
+    def __floordiv__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value // assure_type(other))
+
+    # The in-place operators write straight into the existing array.
+    @override
+    def __iadd__(self, other: Any) -> Self:
+        self._value += assure_type(other)
+        return self
+
+    @override
+    def __imul__(self, other: Any) -> Self:
+        self._value *= assure_type(other)
+        return self
+
+    @override
+    def __isub__(self, other: Any) -> Self:
+        self._value -= assure_type(other)
+        return self
+
+    @override
+    def __itruediv__(self, other: Any) -> Self:
+        self._value /= assure_type(other)
+        return self
+
+    @override
+    def __rfloordiv__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) // self._value)
+
+    @override
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self.rounded_value >= assure_rounded(other)
+
+    @override
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self.rounded_value > assure_rounded(other)
+
+    @override
+    def __le__(self, other: Any) -> np.ndarray:
+        return self.rounded_value <= assure_rounded(other)
+
+    @override
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self.rounded_value < assure_rounded(other)
+
+    @override
+    def __mod__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value % assure_type(other))
+
+    @override
+    def __mul__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value * assure_type(other))
+
+    @override
+    def __rmul__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) * self._value)
+
+    @override
+    def __ne__(self, other: Any) -> np.ndarray:
+        return self.rounded_value != assure_rounded(other)
+
+    @override
+    def __pow__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value ** assure_type(other))
+
+    @override
+    def __rpow__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) ** self._value)
+
+    @override
+    def __sub__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value - assure_type(other))
+
+    @override
+    def __rsub__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) - self._value)
+
+    @override
+    def __truediv__(self, other: Any) -> Self:
+        return MoneyArray._from_array(self._value / assure_type(other))
+
+    @override
+    def __rtruediv__(self, other: Any) -> Self:
+        return MoneyArray._from_array(assure_type(other) / self._value)
+
+    # Properties
+    @property
+    def formatted(self) -> list[str]:
+        """
+        :return: Each value (flattened) formatted the same way Money.__str__ formats a single value.
+        """
+        num_format: str = self.num_format
+        return [f"{self.symbol}{value:{num_format}}" for value in self.rounded_value.ravel().tolist()]
+
+    @property
+    def rounded_value(self) -> np.ndarray:
+        """
+        :return: The values of the array, rounded to the nearest 100ths place.
+        """
+        return round_values(self._value)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._value.shape
+
+    @property
+    def value(self) -> np.ndarray:
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Iterable[float | int] | np.ndarray) -> None:
+        # Mirrors Money.value, which rounds to the second decimal when set.
+        self._value = np.round(np.array(assure_type(new_value), dtype=np.float64), 2)
+
+    # Methods
+    def cumsum(self, axis: int | None = None) -> Self:
+        """
+        :param axis: The axis to accumulate along. The array is flattened if no axis is given.
+        :return: The running total of the values.
+        """
+        return MoneyArray._from_array(np.cumsum(self._value, axis=axis), self.symbol)
+
+    def max(self) -> Money:
+        """
+        :return: The largest value in the array.
+        """
+        return Money(float(self._value.max()), self.symbol)
+
+    def mean(self) -> Money:
+        """
+        :return: The average of the values in the array.
+        """
+        return Money(float(self._value.mean()), self.symbol)
+
+    def min(self) -> Money:
+        """
+        :return: The smallest value in the array.
+        """
+        return Money(float(self._value.min()), self.symbol)
+
+    def sum(self, axis: int | None = None) -> Money | Self:
+        """
+        :param axis: The axis to total along. Every value is totaled if no axis is given.
+        :return: A Money object if every value was totaled, otherwise a MoneyArray of the totals.
+        """
+        if axis is None:
+            return Money(float(self._value.sum()), self.symbol)
+
+        return MoneyArray._from_array(self._value.sum(axis=axis), self.symbol)
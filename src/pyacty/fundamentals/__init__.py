@@ -1,2 +1,4 @@
+from .Balance import *
+from .FixedMoney import *
 from .Money import *
-from .TrueBalance import *
+from .MoneyArray import *
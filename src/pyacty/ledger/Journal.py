@@ -0,0 +1,185 @@
+"""
+Journal.py
+
+A Journal collects balanced journal entries until they're posted to financial statements by a Ledger. Entries can be
+added one at a time with add_entry(), or millions of lines at once with add_batch(), which validates every entry with
+a handful of array operations.
+
+Each line is stored as an account code and an amount in units (see FixedMoney.py), where debits are positive and
+credits are negative. Using integers means an entry either balances exactly or it doesn't, and that the amounts posted
+to an account add up to exactly the same total in any order.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from ..constants import BAL_TYPES, CREDIT
+from ..fundamentals.FixedMoney import SCALE, to_units
+
+
+class Journal:
+    # Dunders
+    def __init__(self) -> None:
+        """
+        An empty journal.
+        """
+        # The name of each account, where the index of the name is the account's code.
+        self.accounts: list[str] = []
+        # The code of each account, in {name: code} format.
+        self._codes: dict[str:int] = {}
+        # Lines added by add_entry() are kept in lists until they're needed, since appending to a list is much cheaper
+        # than appending to an array.
+        self._pending_codes: list[int] = []
+        self._pending_units: list[int] = []
+        # Every other line, in [(codes, units)] format.
+        self._chunks: list[tuple[np.ndarray, np.ndarray]] = []
+        self._lines: int = 0
+        self.entries: int = 0
+
+    def __len__(self) -> int:
+        return self._lines
+
+    # Methods
+    def _code(self, account: str) -> int:
+        """
+        :param account: The name of the account.
+        :return: The account's code, which is assigned the first time the account is used.
+        """
+        code: int | None = self._codes.get(account)
+
+        if code is None:
+            code = self._codes[account] = len(self.accounts)
+            self.accounts.append(account)
+
+        return code
+
+    def add_entry(self, lines: Iterable[tuple[str, str, float | int]]) -> None:
+        """
+        Adds a single journal entry. Nothing is added if the entry is invalid.
+        :param lines: The lines of the entry, in (account, "debit" or "credit", amount) format.
+        :return: Nothing.
+        """
+        codes: list[int] = []
+        units: list[int] = []
+        balance: int = 0
+
+        for account, side, amount in lines:
+            if side.lower() not in BAL_TYPES:
+                raise ValueError("Invalid balance type.")
+
+            line_units: int = to_units(amount)
+
+            if line_units < 0:
+                raise ValueError("Journal entries can't have negative amounts.")
+
+            if side.lower() == CREDIT:
+                line_units = -line_units
+
+            codes.append(self._code(account))
+            units.append(line_units)
+            balance += line_units
+
+        if not codes:
+            raise ValueError("Journal entries need at least one line.")
+
+        if balance != 0:
+            raise ValueError(f"Debits and credits aren't equal. Debits exceed credits by {balance / SCALE}.")
+
+        self._pending_codes.extend(codes)
+        self._pending_units.extend(units)
+        self._lines += len(codes)
+        self.entries += 1
+
+    def add_entries(self, entries: Iterable[Iterable[tuple[str, str, float | int]]]) -> None:
+        """
+        Adds many journal entries, one at a time. See add_entry().
+        :param entries: The entries to add.
+        :return: Nothing.
+        """
+        for entry in entries:
+            self.add_entry(entry)
+
+    def add_batch(self, entry: Iterable[int] | np.ndarray, account: Iterable[str] | np.ndarray,
+                  amount: Iterable[float] | np.ndarray) -> None:
+        """
+        Adds many journal entries at once, with one value per line in each argument. Every entry is validated before
+        any of them are added, so nothing is added if a single entry doesn't balance.
+        :param entry: The entry each line belongs to. The lines of an entry don't need to be next to each other.
+        :param account: The account of each line.
+        :param amount: The amount of each line, where debits are positive and credits are negative.
+        :return: Nothing.
+        """
+        entry = np.asarray(entry)
+        account = np.asarray(account)
+        units: np.ndarray = np.rint(np.asarray(amount, dtype=np.float64) * SCALE).astype(np.int64)
+
+        if not (entry.shape == account.shape == units.shape) or entry.ndim != 1:
+            raise ValueError("Every line needs an entry, an account, and an amount.")
+
+        if len(units) == 0:
+            return
+
+        entry_ids: np.ndarray
+        entry_rows: np.ndarray
+        entry_ids, entry_rows = np.unique(entry, return_inverse=True)
+        balances: np.ndarray = np.zeros(len(entry_ids), dtype=np.int64)
+        np.add.at(balances, entry_rows, units)
+        unbalanced: np.ndarray = np.flatnonzero(balances)
+
+        if len(unbalanced) > 0:
+            raise ValueError(f"Debits and credits aren't equal in {len(unbalanced)} entries, starting with entry "
+                             f"{entry_ids[unbalanced[0]]}.")
+
+        # Only the distinct accounts are looked up one at a time, no matter how many lines there are.
+        names: np.ndarray
+        account_rows: np.ndarray
+        names, account_rows = np.unique(account, return_inverse=True)
+        codes: np.ndarray = np.array([self._code(name) for name in names.tolist()], dtype=np.int64)[account_rows]
+
+        self._chunks.append((codes, units))
+        self._lines += len(units)
+        self.entries += len(entry_ids)
+
+    def _flush(self) -> None:
+        """
+        Moves the lines added by add_entry() into an array.
+        :return: Nothing.
+        """
+        if self._pending_codes:
+            self._chunks.append((np.array(self._pending_codes, dtype=np.int64),
+                                 np.array(self._pending_units, dtype=np.int64)))
+            self._pending_codes = []
+            self._pending_units = []
+
+    def net_units(self) -> dict[str:int]:
+        """
+        Groups every line by account, so each account only has to be updated once when the journal is posted.
+        :return: The net debit of each account in units, in {account: units} format. Accounts that net to 0 are left
+        out.
+        """
+        self._flush()
+
+        if not self._chunks:
+            return {}
+
+        net: np.ndarray = np.zeros(len(self.accounts), dtype=np.int64)
+
+        for codes, units in self._chunks:
+            np.add.at(net, codes, units)
+
+        return {self.accounts[code]: int(net[code]) for code in np.flatnonzero(net).tolist()}
+
+    def net_changes(self) -> dict[str:float]:
+        """
+        See net_units().
+        :return: The net debit of each account, in {account: net debit} format. Net credits are negative.
+        """
+        return {account: units / SCALE for account, units in self.net_units().items()}
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the journal.
+        :return: Nothing.
+        """
+        self.__init__()
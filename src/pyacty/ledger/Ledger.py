@@ -0,0 +1,235 @@
+"""
+Ledger.py
+
+A Ledger posts journals into the accounts of one or more financial statements, usually a BalanceSheet and an
+IncomeStatement. Every line of a journal is grouped by account first (see Journal.net_units()), so posting a batch of
+millions of lines only updates each account once.
+
+A debit increases an account whose normal balance is a debit and decreases one whose normal balance is a credit, and
+the opposite is true for credits. The normal balance is the "d/c" attribute that add_account() set with
+Balance.find_default_balance().
+
+Closing a period rolls net income into retained earnings with a closing entry, which zeroes out every revenue and
+expense account. The balances left behind are the opening balances of the next period, so running many periods never
+means replaying earlier periods (see run_periods()).
+"""
+
+import time
+from typing import Iterable, Iterator
+
+from .Journal import Journal
+from .TrialBalance import TrialBalance
+from ..constants import CREDIT, DEBIT, IS_CATEGORIES
+from ..fundamentals.FixedMoney import SCALE, to_units
+from ..statements.BalanceSheet import BalanceSheet
+from ..statements.FinancialStatement import FinancialStatement
+
+
+class Ledger:
+    # Dunders
+    def __init__(self, *statements: FinancialStatement) -> None:
+        """
+        A ledger that posts to the given financial statements.
+        :param statements: The financial statements the accounts are in.
+        """
+        self.statements: list[FinancialStatement] = list(statements)
+
+        # Posting throughput counters. See reset_counters().
+        self.batches_posted: int = 0
+        self.entries_posted: int = 0
+        self.lines_posted: int = 0
+        self.accounts_updated: int = 0
+        self.posting_time: float = 0.0
+        self.periods_closed: int = 0
+
+    # Properties
+    @property
+    def lines_per_second(self) -> float:
+        """
+        :return: How many journal lines have been posted per second spent posting.
+        """
+        return self.lines_posted / self.posting_time if self.posting_time > 0 else 0.0
+
+    @property
+    def entries_per_second(self) -> float:
+        """
+        :return: How many journal entries have been posted per second spent posting.
+        """
+        return self.entries_posted / self.posting_time if self.posting_time > 0 else 0.0
+
+    # Methods
+    def statement_of(self, account: str) -> FinancialStatement:
+        """
+        :param account: The name of the account.
+        :return: The financial statement the account is in.
+        """
+        for statement in self.statements:
+            if self._has_account(statement, account):
+                return statement
+
+        raise KeyError("Account not found!")
+
+    def close_period(self, retained_earnings: str = "Retained Earnings") -> float:
+        """
+        Closes the period by posting a closing entry, which moves the balance of every revenue and expense account into
+        retained earnings. The closing entry isn't counted by the throughput counters (only periods_closed is).
+        :param retained_earnings: The equity account net income is rolled into. It's opened if it doesn't exist yet.
+        :return: The net income of the period.
+        """
+        lines: list[tuple[str, str, float]] = []
+        # Net income is credits minus debits, which is the opposite of how the units are signed.
+        net_income: int = 0
+
+        for statement in self.statements:
+            for category in IS_CATEGORIES:
+                for account, attributes in statement.fs.get(category, {}).items():
+                    units: int = to_units(attributes["bal"])
+
+                    if attributes["d/c"] != DEBIT:
+                        units = -units
+
+                    if units != 0:
+                        lines.append((account, CREDIT if units > 0 else DEBIT, abs(units) / SCALE))
+                        net_income -= units
+
+        if lines:
+            if not any(self._has_account(statement, retained_earnings) for statement in self.statements):
+                self.open_account(retained_earnings, "equity")
+
+            lines.append((retained_earnings, CREDIT if net_income >= 0 else DEBIT, abs(net_income) / SCALE))
+            journal: Journal = Journal()
+            journal.add_entry(lines)
+            # Closing entries are bookkeeping, not postings, so they're left out of the throughput counters.
+            self._apply(journal)
+
+        self.periods_closed += 1
+
+        return net_income / SCALE
+
+    def run_periods(self, journals: Iterable[Journal],
+                    retained_earnings: str = "Retained Earnings") -> Iterator[tuple[TrialBalance, float]]:
+        """
+        Posts and closes one period for each journal, in order. Each period starts from the balances the previous one
+        closed with.
+        :param journals: The journal of each period.
+        :param retained_earnings: See close_period().
+        :return: The trial balance of each period before it was closed, and its net income.
+        """
+        for journal in journals:
+            self.post(journal)
+            trial_balance: TrialBalance = self.trial_balance()
+
+            yield trial_balance, self.close_period(retained_earnings)
+
+    def trial_balance(self) -> TrialBalance:
+        """
+        :return: The trial balance of every account in the ledger's statements.
+        """
+        return TrialBalance.from_statements(self.statements)
+
+    def open_account(self, name: str, category: str, start_bal: float = 0.0, term: str = "current",
+                     contra: bool = False) -> None:
+        """
+        Adds an account to whichever financial statement has the given category.
+        :param name: The name of the account.
+        :param category: The category of the account.
+        :param start_bal: The beginning balance of the account.
+        :param term: The term of the account, which is only used by balance sheet accounts.
+        :param contra: If the account is a contra account.
+        :return: Nothing.
+        """
+        for statement in self.statements:
+            if category.lower() not in statement.fs:
+                continue
+
+            # The statement itself checks its own categories, but not the other statements.
+            if any(other is not statement and self._has_account(other, name) for other in self.statements):
+                raise ValueError(f"'{name}' is already in another financial statement.")
+
+            if isinstance(statement, BalanceSheet):
+                statement.add_account(name, category, start_bal, term, contra)
+
+            else:
+                statement.add_account(name, category, start_bal, contra=contra)
+
+            return
+
+        raise ValueError("Invalid category type.")
+
+    @staticmethod
+    def _has_account(statement: FinancialStatement, account: str) -> bool:
+        """
+        :param statement: The financial statement to check.
+        :param account: The name of the account.
+        :return: If the financial statement has the account.
+        """
+        try:
+            statement.category_of(account)
+            return True
+
+        except KeyError:
+            return False
+
+    def post(self, journal: Journal, clear: bool = True) -> int:
+        """
+        Posts every entry of a journal. Every account is found before any balances change, so nothing is posted if a
+        single account is missing.
+        :param journal: The journal to post.
+        :param clear: If True, the journal is emptied once it's posted.
+        :return: How many accounts were updated.
+        """
+        start: float = time.perf_counter()
+        updated: int = self._apply(journal)
+
+        self.batches_posted += 1
+        self.entries_posted += journal.entries
+        self.lines_posted += len(journal)
+        self.accounts_updated += updated
+        self.posting_time += time.perf_counter() - start
+
+        if clear:
+            journal.clear()
+
+        return updated
+
+    def _apply(self, journal: Journal) -> int:
+        """
+        Changes the balances for every entry of a journal, without touching the throughput counters. See post().
+        :param journal: The journal to apply.
+        :return: How many accounts were updated.
+        """
+        updates: list[tuple[dict[str:str | int | float], int]] = []
+        missing: list[str] = []
+
+        for account, units in journal.net_units().items():
+            try:
+                statement: FinancialStatement = self.statement_of(account)
+
+            except KeyError:
+                missing.append(account)
+                continue
+
+            updates.append((statement.fs[statement.category_of(account)][account], units))
+
+        if missing:
+            raise KeyError(f"Accounts not found: {", ".join(missing)}")
+
+        for attributes, units in updates:
+            if attributes["d/c"] != DEBIT:
+                units = -units
+
+            # The new balance is found in units too, so posting never adds floating point error to the balance.
+            attributes["bal"] = (to_units(attributes["bal"]) + units) / SCALE
+
+        return len(updates)
+
+    def reset_counters(self) -> None:
+        """
+        Sets every throughput counter back to 0.
+        :return: Nothing.
+        """
+        self.batches_posted = 0
+        self.entries_posted = 0
+        self.lines_posted = 0
+        self.accounts_updated = 0
+        self.posting_time = 0.0
@@ -0,0 +1,88 @@
+"""
+TrialBalance.py
+
+A TrialBalance lists every account with its balance in either the debit or the credit column. If every journal entry
+balanced, the two columns add up to the same total. Ledger.trial_balance() builds one from the ledger's statements.
+"""
+
+from typing import Iterable, Iterator, Self
+
+from ..constants import DEBIT
+from ..fundamentals.FixedMoney import SCALE, to_units
+from ..statements.FinancialStatement import FinancialStatement
+
+
+class TrialBalance:
+    # Dunders
+    def __init__(self) -> None:
+        """
+        An empty trial balance.
+        """
+        # Each row is in (account, category, debit, credit) format.
+        self.rows: list[tuple[str, str, float, float]] = []
+        # The totals are kept in units (see FixedMoney.py) so that balanced() is an exact comparison.
+        self._debit_units: int = 0
+        self._credit_units: int = 0
+
+    def __iter__(self) -> Iterator[tuple[str, str, float, float]]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def from_statements(cls, statements: Iterable[FinancialStatement]) -> Self:
+        """
+        Lists every account of the given financial statements, in the order they appear in.
+        :param statements: The financial statements.
+        :return: The trial balance.
+        """
+        trial_balance: Self = cls()
+
+        for statement in statements:
+            for category, accounts in statement.fs.items():
+                for account, attributes in accounts.items():
+                    trial_balance.add_row(account, category, attributes["bal"], attributes["d/c"])
+
+        return trial_balance
+
+    # Properties
+    @property
+    def balanced(self) -> bool:
+        """
+        :return: If the debit and credit columns add up to the same total.
+        """
+        return self._debit_units == self._credit_units
+
+    @property
+    def total_debits(self) -> float:
+        """
+        :return: The total of the debit column.
+        """
+        return self._debit_units / SCALE
+
+    @property
+    def total_credits(self) -> float:
+        """
+        :return: The total of the credit column.
+        """
+        return self._credit_units / SCALE
+
+    # Methods
+    def add_row(self, account: str, category: str, balance: float | int, normal_balance: str) -> None:
+        """
+        Adds an account to the trial balance. An account with a negative balance is listed in the column opposite its
+        normal balance.
+        :param account: The name of the account.
+        :param category: The category of the account.
+        :param balance: The balance of the account.
+        :param normal_balance: The normal balance of the account ("debit" or "credit").
+        :return: Nothing.
+        """
+        units: int = to_units(balance) if normal_balance == DEBIT else -to_units(balance)
+        debit: int = max(units, 0)
+        credit: int = max(-units, 0)
+
+        self.rows.append((account, category, debit / SCALE, credit / SCALE))
+        self._debit_units += debit
+        self._credit_units += credit
@@ -0,0 +1,3 @@
+from .Journal import *
+from .Ledger import *
+from .TrialBalance import *
@@ -0,0 +1,143 @@
+"""
+Account.py
+
+An Account holds the attributes of a single account ("d/c", "bal", and "term" on balance sheets). It's a dict, so it
+behaves exactly like the plain dicts financial statements have always stored, but it tells the statement that owns it
+whenever its balance or normal balance changes. That's what keeps a statement's running totals up to date without ever
+adding up every account again. It also tells the statement right before anything changes, so the statement can save a
+copy of the account for its history (see StatementHistory.py).
+"""
+
+from typing import Any, override
+
+# The attributes that the totals of a financial statement depend on.
+TRACKED_ATTRIBUTES: frozenset[str] = frozenset({"d/c", "bal"})
+
+
+class Account(dict):
+    __slots__ = ("_owner", "_category", "_name")
+
+    # Dunders
+    def __init__(self, attributes: dict[str:str | int | float], owner: Any = None, category: str = "",
+                 name: str = "") -> None:
+        """
+        An account belonging to a financial statement.
+        :param attributes: The attributes of the account.
+        :param owner: The FinancialStatement the account belongs to, which is told about every change to the account.
+        :param category: The category the account is in.
+        :param name: The name of the account.
+        """
+        super().__init__(attributes)
+        self._owner: Any = owner
+        self._category: str = category
+        self._name: str = name
+
+    @override
+    def __setitem__(self, key: str, value: str | int | float) -> None:
+        if self._owner is None:
+            super().__setitem__(key, value)
+            return
+
+        self._owner._record(self._name)
+
+        if key not in TRACKED_ATTRIBUTES:
+            super().__setitem__(key, value)
+            return
+
+        # The old balance is taken out of the totals and the new one is put in, which is the same amount of work no
+        # matter how many accounts there are.
+        self._owner._untrack(self._category, self)
+        super().__setitem__(key, value)
+        self._owner._track(self._category, self)
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        if self._owner is None:
+            super().__delitem__(key)
+            return
+
+        self._owner._record(self._name)
+
+        if key not in TRACKED_ATTRIBUTES:
+            super().__delitem__(key)
+            return
+
+        self._owner._untrack(self._category, self)
+        super().__delitem__(key)
+        self._owner._track(self._category, self)
+
+    @override
+    def __ior__(self, other: Any) -> "Account":
+        self.update(other)
+
+        return self
+
+    # Copies and pickles are plain accounts that don't belong to any statement, otherwise copying a single account
+    # would copy the entire statement with it.
+    @override
+    def __reduce__(self) -> tuple:
+        return Account, (dict(self),)
+
+    # Methods
+    @override
+    def update(self, *args, **kwargs) -> None:
+        if self._owner is None:
+            super().update(*args, **kwargs)
+            return
+
+        self._owner._record(self._name)
+        self._owner._untrack(self._category, self)
+        super().update(*args, **kwargs)
+        self._owner._track(self._category, self)
+
+    @override
+    def pop(self, key: str, *default: Any) -> Any:
+        if self._owner is None or key not in self:
+            return super().pop(key, *default)
+
+        value: Any = self[key]
+        del self[key]
+
+        return value
+
+    @override
+    def popitem(self) -> tuple[str, Any]:
+        if self._owner is None or not self:
+            return super().popitem()
+
+        # Like a dict, the last attribute is the one that's removed.
+        key: str = next(reversed(self))
+        value: Any = self[key]
+        del self[key]
+
+        return key, value
+
+    @override
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    @override
+    def clear(self) -> None:
+        if self._owner is None:
+            super().clear()
+            return
+
+        self._owner._record(self._name)
+        self._owner._untrack(self._category, self)
+        super().clear()
+        self._owner._track(self._category, self)
+
+    def _attach(self, owner: Any, category: str, name: str) -> None:
+        """
+        Hands the account to a financial statement, which is told about every change to it from now on.
+        :param owner: The FinancialStatement the account belongs to, or None if it no longer belongs to one.
+        :param category: The category the account is in.
+        :param name: The name of the account.
+        :return: Nothing.
+        """
+        self._owner = owner
+        self._category = category
+        self._name = name
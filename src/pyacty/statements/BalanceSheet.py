@@ -5,8 +5,8 @@ BalanceSheet.py
 from typing import override
 
 from ..fundamentals.Balance import Balance
+from ..fundamentals.FixedMoney import SCALE
 from .FinancialStatement import FinancialStatement
-from .skeletons.FsSkeleton import FsSkeleton
 from ..constants import BS_CATEGORIES
 
 
@@ -49,11 +49,6 @@ class BalanceSheet(FinancialStatement):
         }
         self.fs_name: str = "Balance Sheet"
 
-    @override
-    def __str__(self) -> str:
-        return FsSkeleton(self.fs, self.company, self.fs_name, self.date,
-                          decimals=self.decimals).auto_render()
-
     @override
     def reset(self) -> None:
         self.fs = {
@@ -77,50 +72,45 @@ class BalanceSheet(FinancialStatement):
         db: str = Balance.find_default_balance(category, contra)
 
         # Equity doesn't have separate sections for current and non-current, so we ignore it.
+        # _store_account() raises a ValueError if another category already has an account with this name.
         if category.lower() == "equity":
-            self.fs[category.lower()][name] = {
+            self._store_account(name, category.lower(), {
                 "d/c": db,
                 "bal": start_bal
-            }
+            })
 
         else:
-            self.fs[category.lower()][name] = {
+            self._store_account(name, category.lower(), {
                 "d/c": db,
                 "bal": start_bal,
                 "term": term.lower()
-            }
+            })
 
     @override
     def del_account(self, name: str) -> None:
-        for category in BS_CATEGORIES:
-            try:
-                self.fs[category].pop(name)
-                break
-
-            except KeyError:
-                pass
-
-        else:
-            raise KeyError("Account not found!")
+        self._pop_account(name)
 
     def check_bs(self) -> (bool, str):
         """
-        Checks if the balance sheet balances.
+        Checks if the balance sheet balances. This only reads the running totals (see total_accounts()), so it's cheap
+        enough to call after every posting.
         :return: Returns if the balance sheet balances (as a boolean) and the reason why it doesn't balance, if
         applicable.
         """
-        totals: dict[str:float] = self.total_accounts()
+        if self.verify:
+            self._raise_drift()
+
+        # The totals are compared in integer units (see FixedMoney.py), so balances like 0.1 + 0.2 still match 0.3.
+        difference: int = self._totals["asset"] - (self._totals["liability"] + self._totals["equity"])
 
-        balances: bool = totals["asset"] == (totals["liability"] + totals["equity"])
+        balances: bool = difference == 0
         reason: str = "Balance sheet is balanced, no reason applicable."
 
         # If the balance sheet doesn't balance, this provides the reason why it doesn't balance.
         if not balances:
-            if totals["asset"] > (totals["liability"] + totals["equity"]):
-                reason = f"Assets exceeds liabilities and equity by {totals["asset"] - (totals["liability"] +
-                                                                                        totals["equity"])}"
+            if difference > 0:
+                reason = f"Assets exceeds liabilities and equity by {difference / SCALE}"
             else:
-                reason = f"Liabilities and equity exceeds assets by {(totals["liability"] + totals["equity"]) -
-                                                                     totals["asset"]}"
+                reason = f"Liabilities and equity exceeds assets by {-difference / SCALE}"
 
         return balances, reason
@@ -0,0 +1,312 @@
+"""
+BinarySnapshot.py
+
+A compact binary format for financial statements, which is much smaller and faster to load than JSON. The file is
+memory-mapped when it's opened, so opening a snapshot takes the same amount of time no matter how many accounts it has,
+and an account's attributes are only built when the account is looked up.
+
+[Layout] \n
+Every number is little-endian, and every column starts on an 8-byte boundary (padded with zeros). N is the number of
+accounts, and the columns are in the order the accounts appear in the statement. \n
+1. Header: HEADER (see below), which is the magic bytes, the version, the number of categories, N, the size of the
+name table, and the size of the category table. \n
+2. Category table: the name of each category in UTF-8, separated by newlines. A category's code is its position. \n
+3. Balances: N float64. \n
+4. Name offsets: N + 1 uint64. The name of account i is name_table[offsets[i]:offsets[i + 1]]. \n
+5. Name order: N uint64, the accounts sorted by the UTF-8 bytes of their names, for binary searches. \n
+6. Category codes: N uint8. \n
+7. Normal balances: N uint8, where 1 is a debit and 0 is a credit. \n
+8. Term codes: N uint8, which are positions in TERMS. 0 means the account doesn't have a term. \n
+9. Name table: the name of every account in UTF-8, one after another. \n
+
+Only the "d/c", "bal", and "term" attributes are stored.
+"""
+
+import struct
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from ..storage import atomic_open
+from ..constants import CREDIT, DEBIT
+
+MAGIC: bytes = b"PYACTYFS"
+VERSION: int = 1
+# magic, version, category count, account count, name table size, category table size
+HEADER: struct.Struct = struct.Struct("<8sIIQQQ")
+TERMS: tuple[str, ...] = ("", "current", "non-current")
+
+
+def _align(offset: int) -> int:
+    """
+    :param offset: An offset in the file.
+    :return: The next offset that's a multiple of 8.
+    """
+    return -(-offset // 8) * 8
+
+
+def _layout(accounts: int, names_size: int, categories_size: int) -> dict[str:int]:
+    """
+    Finds where each part of the file starts. Used when both reading and writing, so they can't disagree.
+    :param accounts: The number of accounts.
+    :param names_size: The size of the name table (in bytes).
+    :param categories_size: The size of the category table (in bytes).
+    :return: The offset of each part, in {part: offset} format. "end" is the size of the file.
+    """
+    offsets: dict[str:int] = {"categories": HEADER.size}
+    offsets["balances"] = _align(offsets["categories"] + categories_size)
+    offsets["name_offsets"] = offsets["balances"] + 8 * accounts
+    offsets["order"] = offsets["name_offsets"] + 8 * (accounts + 1)
+    offsets["category_codes"] = offsets["order"] + 8 * accounts
+    offsets["debit"] = offsets["category_codes"] + accounts
+    offsets["term_codes"] = offsets["debit"] + accounts
+    offsets["names"] = _align(offsets["term_codes"] + accounts)
+    offsets["end"] = offsets["names"] + names_size
+
+    return offsets
+
+
+class BinarySnapshot:
+    # Dunders
+    def __init__(self, path: str) -> None:
+        """
+        Opens a snapshot written by write(). Nothing but the header and the category table is read until it's needed.
+        :param path: The path of the file.
+        """
+        self.path: str = path
+        self._raw: np.memmap = np.memmap(path, dtype=np.uint8, mode="r")
+
+        if len(self._raw) < HEADER.size:
+            raise ValueError("Not a PyActy snapshot.")
+
+        magic: bytes
+        version: int
+        category_count: int
+        accounts: int
+        names_size: int
+        categories_size: int
+        magic, version, category_count, accounts, names_size, categories_size = HEADER.unpack_from(self._raw)
+
+        if magic != MAGIC:
+            raise ValueError("Not a PyActy snapshot.")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}.")
+
+        offsets: dict[str:int] = _layout(accounts, names_size, categories_size)
+
+        if len(self._raw) != offsets["end"]:
+            raise ValueError("The snapshot is truncated or corrupted.")
+
+        category_table: str = bytes(self._raw[offsets["categories"]:offsets["categories"] + categories_size]).decode()
+        self.categories: list[str] = category_table.split("\n") if category_count > 0 else []
+
+        # These are all views of the memory-mapped file, so none of them are read until they're used.
+        self.balances: np.ndarray = self._column(offsets["balances"], np.float64, accounts)
+        self._name_offsets: np.ndarray = self._column(offsets["name_offsets"], np.uint64, accounts + 1)
+        self._order: np.ndarray = self._column(offsets["order"], np.uint64, accounts)
+        self.category_codes: np.ndarray = self._column(offsets["category_codes"], np.uint8, accounts)
+        self.debit: np.ndarray = self._column(offsets["debit"], np.uint8, accounts)
+        self.term_codes: np.ndarray = self._column(offsets["term_codes"], np.uint8, accounts)
+        self._names: np.ndarray = self._raw[offsets["names"]:offsets["end"]]
+
+        # Accounts that have been looked up, in {row: attributes} format.
+        self._materialized: dict[int:dict[str:str | float]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def __getitem__(self, name: str) -> dict[str:str | float]:
+        return self.account(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.name(row) for row in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.balances)
+
+    # Methods
+    def _column(self, offset: int, dtype: type, count: int) -> np.ndarray:
+        """
+        :param offset: Where the column starts.
+        :param dtype: The type of the column.
+        :param count: How many values are in the column.
+        :return: A read-only view of the column.
+        """
+        return np.frombuffer(self._raw, dtype=np.dtype(dtype).newbyteorder("<"), count=count, offset=offset)
+
+    def _find(self, name: str) -> int | None:
+        """
+        Finds an account with a binary search, so only about log2(N) names are ever decoded.
+        :param name: The name of the account.
+        :return: The row of the account, or None if it isn't in the snapshot.
+        """
+        target: bytes = name.encode()
+        low: int = 0
+        high: int = len(self)
+
+        while low < high:
+            middle: int = (low + high) // 2
+
+            if self._name_bytes(int(self._order[middle])) < target:
+                low = middle + 1
+
+            else:
+                high = middle
+
+        if low < len(self) and self._name_bytes(int(self._order[low])) == target:
+            return int(self._order[low])
+
+        return None
+
+    def _name_bytes(self, row: int) -> bytes:
+        """
+        :param row: The row of the account.
+        :return: The name of the account in UTF-8.
+        """
+        return bytes(self._names[int(self._name_offsets[row]):int(self._name_offsets[row + 1])])
+
+    def name(self, row: int) -> str:
+        """
+        :param row: The row of the account.
+        :return: The name of the account.
+        """
+        return self._name_bytes(row).decode()
+
+    def row(self, name: str) -> int:
+        """
+        :param name: The name of the account.
+        :return: The row of the account.
+        """
+        row: int | None = self._find(name)
+
+        if row is None:
+            raise KeyError("Account not found!")
+
+        return row
+
+    def category_of(self, name: str) -> str:
+        """
+        :param name: The name of the account.
+        :return: The category the account is in.
+        """
+        return self.categories[self.category_codes[self.row(name)]]
+
+    def account(self, name: str) -> dict[str:str | float]:
+        """
+        Builds the attributes of a single account, the same way they're stored in FinancialStatement.fs.
+        :param name: The name of the account.
+        :return: The attributes of the account.
+        """
+        return self._attributes(self.row(name))
+
+    def _attributes(self, row: int) -> dict[str:str | float]:
+        """
+        :param row: The row of the account.
+        :return: The attributes of the account.
+        """
+        attributes: dict[str:str | float] | None = self._materialized.get(row)
+
+        if attributes is None:
+            attributes = {"d/c": DEBIT if self.debit[row] else CREDIT, "bal": float(self.balances[row])}
+
+            if self.term_codes[row]:
+                attributes["term"] = TERMS[self.term_codes[row]]
+
+            self._materialized[row] = attributes
+
+        # A copy is returned so that changing it doesn't change what the next lookup returns.
+        return dict(attributes)
+
+    def total_accounts(self) -> dict[str:float]:
+        """
+        Adds up the balances of every category without building any accounts. See FinancialStatement.total_accounts().
+        :return: The total of each category, in {category: total} format.
+        """
+        totals: np.ndarray = np.bincount(self.category_codes, weights=self.balances, minlength=len(self.categories))
+        return dict(zip(self.categories, totals.tolist()))
+
+    def to_fs(self) -> dict[str:dict[str:dict[str:str | float]]]:
+        """
+        Builds every account in the snapshot.
+        :return: The financial statement, in {category: {account: attributes}} format.
+        """
+        fs: dict[str:dict[str:dict[str:str | float]]] = {category: {} for category in self.categories}
+        names: bytes = bytes(self._names)
+        name_offsets: list[int] = self._name_offsets.tolist()
+        balances: list[float] = self.balances.tolist()
+        category_codes: list[int] = self.category_codes.tolist()
+        debit: list[int] = self.debit.tolist()
+        term_codes: list[int] = self.term_codes.tolist()
+
+        for row in range(len(self)):
+            attributes: dict[str:str | float] = {"d/c": DEBIT if debit[row] else CREDIT, "bal": balances[row]}
+
+            if term_codes[row]:
+                attributes["term"] = TERMS[term_codes[row]]
+
+            name: str = names[name_offsets[row]:name_offsets[row + 1]].decode()
+            fs[self.categories[category_codes[row]]][name] = attributes
+
+        return fs
+
+    @classmethod
+    def write(cls, fs: dict[str:dict[str:dict[str:str | int | float]]], path: str) -> None:
+        """
+        Saves a financial statement as a snapshot. Like the other formats, the file is written in full before it
+        replaces any existing file (see storage.atomic_open()).
+        :param fs: The financial statement, in {category: {account: attributes}} format.
+        :param path: The path of the file.
+        :return: Nothing.
+        """
+        categories: list[str] = list(fs)
+
+        if len(categories) > 256:
+            raise ValueError("Snapshots can't have more than 256 categories.")
+
+        if any("\n" in category for category in categories):
+            raise ValueError("Category names can't contain newlines.")
+
+        names: list[bytes] = []
+        balances: list[float] = []
+        category_codes: list[int] = []
+        debit: list[int] = []
+        term_codes: list[int] = []
+
+        for code, accounts in enumerate(fs.values()):
+            for account, attributes in accounts.items():
+                if attributes.get("term", "") not in TERMS:
+                    raise ValueError(f"'{account}' has an invalid term.")
+
+                names.append(account.encode())
+                balances.append(attributes["bal"])
+                category_codes.append(code)
+                debit.append(attributes["d/c"] == DEBIT)
+                term_codes.append(TERMS.index(attributes.get("term", "")))
+
+        accounts_count: int = len(names)
+        name_table: bytes = b"".join(names)
+        category_table: bytes = "\n".join(categories).encode()
+        offsets: dict[str:int] = _layout(accounts_count, len(name_table), len(category_table))
+
+        name_offsets: np.ndarray = np.zeros(accounts_count + 1, dtype="<u8")
+        np.cumsum([len(name) for name in names], out=name_offsets[1:])
+        order: np.ndarray = np.array(sorted(range(accounts_count), key=names.__getitem__), dtype="<u8")
+
+        outfile: BinaryIO
+
+        with atomic_open(path, binary=True) as outfile:
+            outfile.write(HEADER.pack(MAGIC, VERSION, len(categories), accounts_count, len(name_table),
+                                      len(category_table)))
+            outfile.write(category_table)
+
+            for part, data in [("balances", np.array(balances, dtype="<f8").tobytes()),
+                               ("name_offsets", name_offsets.tobytes()),
+                               ("order", order.tobytes()),
+                               ("category_codes", np.array(category_codes, dtype=np.uint8).tobytes()),
+                               ("debit", np.array(debit, dtype=np.uint8).tobytes()),
+                               ("term_codes", np.array(term_codes, dtype=np.uint8).tobytes()),
+                               ("names", name_table)]:
+                # Pads the file up to where the next part starts.
+                outfile.write(b"\0" * (offsets[part] - outfile.tell()))
+                outfile.write(data)
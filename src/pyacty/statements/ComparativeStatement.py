@@ -0,0 +1,271 @@
+"""
+ComparativeStatement.py
+
+A ComparativeStatement holds many periods of the same financial statement. The chart of accounts is stored once, and
+the balances are stored in a single (periods x accounts) NumPy array, so a 60-month comparison is one array instead of
+60 statements with 60 copies of the same nested dicts.
+
+Period-over-period changes, rolling sums, and year-to-date totals are each a few array operations over every account at
+once. They return new comparative statements, so they can be rendered (see FsSkeleton) or combined like any other.
+"""
+
+from typing import Iterable, Self, Sequence, override
+
+import numpy as np
+
+from .FinancialStatement import FinancialStatement
+from .skeletons.FsSkeleton import FsSkeleton
+from ..constants import ALL_CATEGORIES, DEBIT
+from ..fundamentals.Balance import Balance
+
+
+class ComparativeStatement:
+    # Dunders
+    def __init__(self, company_name: str, dates: Iterable[str], fs_name: str = "Comparative Statement",
+                 decimals: bool = True, capacity: int = 16) -> None:
+        """
+        An empty comparative statement.
+        :param company_name: The name of the company.
+        :param dates: The date of each period, in "MM/DD/YYYY" format.
+        :param fs_name: The name of the financial statement.
+        :param decimals: If numbers on the financial statement display decimals.
+        :param capacity: How many accounts to make room for up front. The statement grows on its own when it runs out of
+        room.
+        """
+        self.company: str = company_name
+        self.dates: list[str] = list(dates)
+        self.fs_name: str = fs_name
+        self.decimals: bool = decimals
+
+        # The chart of accounts, in {category: {account: attributes}} format. It's the same as FinancialStatement.fs,
+        # except the attributes don't include the balance.
+        self.chart: dict[str:dict[str:dict[str:str]]] = {}
+        # The column of each account in the balances, in {name: column} format.
+        self._columns: dict[str:int] = {}
+        self._size: int = 0
+        self._balances: np.ndarray = np.zeros((len(self.dates), max(capacity, 1)), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, account: str) -> bool:
+        return account in self._columns
+
+    @override
+    def __str__(self) -> str:
+        return FsSkeleton(self._skeleton_fs(), self.company, self.fs_name, self.dates[-1], decimals=self.decimals,
+                          columns=self.dates).auto_render()
+
+    @classmethod
+    def from_statements(cls, statements: Sequence[FinancialStatement], fs_name: str | None = None) -> Self:
+        """
+        Combines single-period statements (one per period, in order) into a comparative statement. Accounts that are
+        missing from a period have a balance of 0 in that period.
+        :param statements: The statement of each period.
+        :param fs_name: The name of the financial statement. Defaults to the name of the first statement.
+        :return: The comparative statement.
+        """
+        if not statements:
+            raise ValueError("At least one statement is needed.")
+
+        comparative: Self = cls(statements[0].company, [statement.date for statement in statements],
+                                statements[0].fs_name if fs_name is None else fs_name, statements[0].decimals)
+
+        for period, statement in enumerate(statements):
+            for category, accounts in statement.fs.items():
+                # Keeps categories without any accounts, so they're still rendered.
+                comparative.chart.setdefault(category, {})
+
+                for account, attributes in accounts.items():
+                    if account not in comparative._columns:
+                        comparative._add_column(account, category, {key: value for key, value in attributes.items()
+                                                                     if key != "bal"})
+
+                    comparative._balances[period, comparative._columns[account]] = attributes["bal"]
+
+        return comparative
+
+    # Properties
+    @property
+    def balances(self) -> np.ndarray:
+        """
+        :return: The (periods x accounts) array of balances. Changing it changes the statement.
+        """
+        return self._balances[:, :self._size]
+
+    @property
+    def periods(self) -> int:
+        """
+        :return: The number of periods.
+        """
+        return len(self.dates)
+
+    # Methods
+    def _add_column(self, name: str, category: str, attributes: dict[str:str]) -> int:
+        """
+        Adds an account to the chart of accounts and gives it a column.
+        :param name: The name of the account.
+        :param category: The category of the account.
+        :param attributes: The attributes of the account, without the balance.
+        :return: The column of the account.
+        """
+        if name in self._columns:
+            raise ValueError(f"'{name}' is already in the statement.")
+
+        capacity: int = self._balances.shape[1]
+
+        # Doubling the capacity means the balances are only copied a handful of times, even for huge charts of accounts.
+        if self._size == capacity:
+            grown: np.ndarray = np.zeros((self.periods, capacity * 2), dtype=np.float64)
+            grown[:, :capacity] = self._balances
+            self._balances = grown
+
+        column: int = self._size
+        self.chart.setdefault(category, {})[name] = attributes
+        self._columns[name] = column
+        self._size += 1
+
+        return column
+
+    def add_account(self, name: str, category: str, balances: float | Iterable[float] | np.ndarray = 0.0,
+                    contra: bool = False, term: str | None = None) -> None:
+        """
+        Adds an account to every period.
+        :param name: The name of the account.
+        :param category: The category of the account (asset/liability/equity/revenue/expense).
+        :param balances: The balance of the account, either one balance for every period or one per period.
+        :param contra: If the account is a contra account.
+        :param term: The term of the account ("current" or "non-current"), which is only used by balance sheet
+        accounts.
+        :return: Nothing.
+        """
+        if category.lower() not in ALL_CATEGORIES:
+            raise ValueError("Invalid category type.")
+
+        attributes: dict[str:str] = {"d/c": Balance.find_default_balance(category.lower(), contra)}
+
+        if term is not None:
+            attributes["term"] = term.lower()
+
+        # Checked before the account is added, so a bad number of balances doesn't leave a half-added account.
+        balances = np.broadcast_to(np.asarray(balances, dtype=np.float64), (self.periods,))
+        self._balances[:, self._add_column(name, category.lower(), attributes)] = balances
+
+    def column(self, account: str) -> np.ndarray:
+        """
+        :param account: The name of the account.
+        :return: The balance of the account in each period. Changing it changes the statement.
+        """
+        try:
+            return self._balances[:, self._columns[account]]
+
+        except KeyError:
+            raise KeyError("Account not found!") from None
+
+    def statement(self, period: int) -> dict[str:dict[str:dict[str:str | float]]]:
+        """
+        Builds a single period in the same format as FinancialStatement.fs.
+        :param period: The period (its position in dates).
+        :return: The financial statement of the period.
+        """
+        balances: list[float] = self._balances[period, :self._size].tolist()
+
+        return {category: {account: {**attributes, "bal": balances[self._columns[account]]}
+                           for account, attributes in accounts.items()}
+                for category, accounts in self.chart.items()}
+
+    def _signs(self) -> np.ndarray:
+        """
+        :return: 1 for every account with a normal debit balance, and -1 for the rest, in column order.
+        """
+        signs: np.ndarray = np.empty(self._size, dtype=np.float64)
+
+        for accounts in self.chart.values():
+            for account, attributes in accounts.items():
+                signs[self._columns[account]] = 1.0 if attributes["d/c"] == DEBIT else -1.0
+
+        return signs
+
+    def total_accounts(self, signed: bool = False) -> dict[str:np.ndarray]:
+        """
+        Adds up every category in every period at once. See FinancialStatement.total_accounts() and signed_totals().
+        :param signed: If True, debit balances are added and credit balances are subtracted.
+        :return: The total of each category in each period, in {category: totals} format.
+        """
+        balances: np.ndarray = self.balances * self._signs() if signed else self.balances
+
+        return {category: balances[:, [self._columns[account] for account in accounts]].sum(axis=1)
+                for category, accounts in self.chart.items()}
+
+    def _derive(self, dates: list[str], balances: np.ndarray) -> Self:
+        """
+        Creates a comparative statement with the same chart of accounts and new balances.
+        :param dates: The date of each period.
+        :param balances: The (periods x accounts) array of balances.
+        :return: The new comparative statement.
+        """
+        derived: Self = type(self)(self.company, dates, self.fs_name, self.decimals, capacity=self._size)
+        derived.chart = {category: dict(accounts) for category, accounts in self.chart.items()}
+        derived._columns = dict(self._columns)
+        derived._size = self._size
+        derived._balances[:, :self._size] = balances
+
+        return derived
+
+    def deltas(self) -> Self:
+        """
+        Finds how much every account changed from one period to the next.
+        :return: The change in each period, starting with the second period.
+        """
+        return self._derive(self.dates[1:], np.diff(self.balances, axis=0))
+
+    def rolling(self, window: int) -> Self:
+        """
+        Adds up every account over a moving window of periods, such as the trailing twelve months.
+        :param window: How many periods each sum covers.
+        :return: The sum ending in each period, starting with the first period that has a full window.
+        """
+        if not 0 < window <= self.periods:
+            raise ValueError("window must be between 1 and the number of periods.")
+
+        # The sum of a window is the difference between two running totals, which is one pass no matter the window.
+        running: np.ndarray = np.cumsum(self.balances, axis=0)
+        sums: np.ndarray = running[window - 1:].copy()
+        sums[1:] -= running[:-window]
+
+        return self._derive(self.dates[window - 1:], sums)
+
+    def ytd(self, fiscal_year_end: int = 12) -> Self:
+        """
+        Adds up every account from the start of the fiscal year to each period. This only makes sense for accounts
+        whose balances are activity within a period, like revenue and expenses.
+        :param fiscal_year_end: The last month of the fiscal year (1-12).
+        :return: The year-to-date total in each period.
+        """
+        if not 1 <= fiscal_year_end <= 12:
+            raise ValueError("fiscal_year_end must be between 1 and 12.")
+
+        # Months after the end of the fiscal year belong to the next fiscal year.
+        years: np.ndarray = np.array([int(date.split("/")[2]) + (int(date.split("/")[0]) > fiscal_year_end)
+                                      for date in self.dates])
+        running: np.ndarray = np.cumsum(self.balances, axis=0)
+        # Each period's running total, minus the running total at the end of the previous fiscal year.
+        year_starts: np.ndarray = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+        before_start: np.ndarray = np.zeros_like(running)
+        before_start[year_starts[1:]] = running[year_starts[1:] - 1]
+        # The period each fiscal year starts in, carried forward to every period of that year.
+        starts: np.ndarray = np.zeros(self.periods, dtype=np.int64)
+        starts[year_starts] = year_starts
+        starts = np.maximum.accumulate(starts)
+
+        return self._derive(list(self.dates), running - before_start[starts])
+
+    def _skeleton_fs(self) -> dict[str:dict[str:dict[str:str | np.ndarray]]]:
+        """
+        :return: The chart of accounts with every period's balance of each account, for FsSkeleton.
+        """
+        balances: np.ndarray = self.balances
+
+        return {category: {account: {**attributes, "bal": balances[:, self._columns[account]]}
+                           for account, attributes in accounts.items()}
+                for category, accounts in self.chart.items()}
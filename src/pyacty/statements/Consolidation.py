@@ -0,0 +1,306 @@
+"""
+Consolidation.py
+
+Consolidation combines the statements of many entities (a parent and its subsidiaries) into a single BalanceSheet and
+IncomeStatement. Each entity's accounts are renamed through an account mapping, split between the group and the
+non-controlling (minority) interest, and added up. Intercompany balances are then eliminated.
+
+The entities are split into chunks, and each chunk is added up separately, which can be spread across a process or
+thread pool. The results of the chunks are then merged in pairs, and the results of those merges in pairs again, until
+only one is left (a tree reduction). Balances are added up in integer units (see FixedMoney.py), so the result is
+exactly the same no matter how the entities are chunked or which worker finishes first.
+"""
+
+import concurrent.futures as cf
+import math
+from typing import Iterable
+
+from .BalanceSheet import BalanceSheet
+from .FinancialStatement import FinancialStatement
+from .IncomeStatement import IncomeStatement
+from ..constants import BS_CATEGORIES, DEBIT, IS_CATEGORIES
+from ..fundamentals.Balance import Balance
+from ..fundamentals.FixedMoney import SCALE, to_units
+
+# The running total of each group account, in {account: [category, normal balance, term, units]} format, where units
+# are positive for debits and negative for credits. The term is None for accounts that don't have one.
+type Partial = dict[str:list]
+
+
+def _add(partial: Partial, account: str, category: str, normal_balance: str, term: str | None, units: int) -> None:
+    """
+    Adds to the total of a group account.
+    :param partial: The totals to add to.
+    :param account: The name of the group account.
+    :param category: The category of the account.
+    :param normal_balance: The normal balance of the account ("debit" or "credit").
+    :param term: The term of the account, or None.
+    :param units: The amount to add, which is positive for debits and negative for credits.
+    :return: Nothing.
+    """
+    total: list | None = partial.get(account)
+
+    if total is None:
+        partial[account] = [category, normal_balance, term, units]
+
+    elif total[0] != category:
+        raise ValueError(f"'{account}' is mapped from both {total[0]} and {category} accounts.")
+
+    else:
+        total[3] += units
+
+
+def _merge(left: Partial, right: Partial) -> Partial:
+    """
+    Adds the totals of right to left. Accounts keep the order they first appeared in, left first.
+    :param left: The first totals, which are changed.
+    :param right: The second totals.
+    :return: left.
+    """
+    for account, (category, normal_balance, term, units) in right.items():
+        _add(left, account, category, normal_balance, term, units)
+
+    return left
+
+
+def _tree_reduce(partials: list[Partial]) -> Partial:
+    """
+    Merges a list of totals in pairs, and then the results in pairs, until one is left.
+    :param partials: The totals to merge.
+    :return: The merged totals.
+    """
+    while len(partials) > 1:
+        partials = [_merge(partials[i], partials[i + 1]) if i + 1 < len(partials) else partials[i]
+                    for i in range(0, len(partials), 2)]
+
+    return partials[0] if partials else {}
+
+
+def _entity_partial(entity: tuple[list[dict], float, dict[str:str]], nci_equity: str, nci_income: str) -> Partial:
+    """
+    Adds up a single entity.
+    :param entity: The entity's statements (their fs dicts), the share the group owns, and its account mapping.
+    :param nci_equity: The equity account the non-controlling interest's share of equity is moved to.
+    :param nci_income: The account the non-controlling interest's share of net income is moved to.
+    :return: The entity's totals.
+    """
+    statements, ownership, mapping = entity
+    partial: Partial = {}
+    minority: float = 1.0 - ownership
+    nci_units: int = 0
+    income_units: int = 0
+
+    for fs in statements:
+        for category, accounts in fs.items():
+            for account, attributes in accounts.items():
+                units: int = to_units(attributes["bal"])
+
+                if attributes["d/c"] != DEBIT:
+                    units = -units
+
+                if category in IS_CATEGORIES:
+                    income_units += units
+
+                # The group only keeps its own share of the entity's equity. The rest belongs to the non-controlling
+                # interest.
+                if category == "equity" and minority:
+                    nci_share: int = round(units * minority)
+                    units -= nci_share
+                    nci_units += nci_share
+
+                _add(partial, mapping.get(account, account), category, attributes["d/c"], attributes.get("term"), units)
+
+    if minority:
+        _add(partial, nci_equity, "equity", Balance.find_default_balance("equity"), None, nci_units)
+        # Net income is credits minus debits, so the non-controlling interest's share is debited to take it out.
+        _add(partial, nci_income, "expense", Balance.find_default_balance("expense"), None,
+             round(-income_units * minority))
+
+    return partial
+
+
+def _aggregate_chunk(entities: list[tuple[list[dict], float, dict[str:str]]], nci_equity: str,
+                     nci_income: str) -> Partial:
+    """
+    Adds up one chunk of entities. This is a plain function (instead of a method) so that it can be sent to a process
+    pool.
+    :param entities: The entities in the chunk (see _entity_partial()).
+    :param nci_equity: See _entity_partial().
+    :param nci_income: See _entity_partial().
+    :return: The totals of the chunk.
+    """
+    return _tree_reduce([_entity_partial(entity, nci_equity, nci_income) for entity in entities])
+
+
+class Consolidation:
+    # Dunders
+    def __init__(self, company_name: str, date: str, mapping: dict[str:str] | None = None,
+                 nci_equity: str = "Non-controlling Interest",
+                 nci_income: str = "Net Income Attributable to Non-controlling Interest") -> None:
+        """
+        An empty consolidation.
+        :param company_name: The name of the group.
+        :param date: The date of the consolidated statements.
+        :param mapping: The group account each entity account is added to, in {entity account: group account} format.
+        Accounts that aren't mapped keep their name.
+        :param nci_equity: The equity account that holds the non-controlling interest's share of equity.
+        :param nci_income: The expense account that holds the non-controlling interest's share of net income, so that
+        the consolidated net income is what's attributable to the group.
+        """
+        self.company: str = company_name
+        self.date: str = date
+        self.mapping: dict[str:str] = {} if mapping is None else mapping
+        self.nci_equity: str = nci_equity
+        self.nci_income: str = nci_income
+
+        # Each entity, in {name: (statements, ownership, mapping)} format.
+        self.entities: dict[str:tuple[list[FinancialStatement], float, dict[str:str]]] = {}
+        # Each elimination rule, in (accounts, plug, plug category, plug term) format.
+        self.eliminations: list[tuple[list[str], str | None, str, str | None]] = []
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    # Methods
+    def add_entity(self, name: str, *statements: FinancialStatement, ownership: float = 1.0,
+                   mapping: dict[str:str] | None = None) -> None:
+        """
+        Adds an entity to the consolidation. The statements are read when consolidate() is called, not when they're
+        added.
+        :param name: The name of the entity.
+        :param statements: The entity's statements (usually a BalanceSheet and an IncomeStatement).
+        :param ownership: The share of the entity the group owns (between 0 and 1).
+        :param mapping: Mappings for this entity only, which take priority over the consolidation's mapping.
+        :return: Nothing.
+        """
+        if name in self.entities:
+            raise ValueError(f"'{name}' is already in the consolidation.")
+
+        if not 0.0 < ownership <= 1.0:
+            raise ValueError("ownership must be greater than 0 and no more than 1.")
+
+        self.entities[name] = (list(statements), ownership, {} if mapping is None else mapping)
+
+    def add_elimination(self, accounts: Iterable[str], plug: str | None = None, plug_category: str = "expense",
+                        plug_term: str = "current") -> None:
+        """
+        Eliminates intercompany balances, such as a receivable from one entity against the matching payable of another.
+        The group accounts are removed from the consolidated statements once every entity has been added up.
+        :param accounts: The group accounts to eliminate, whose balances should cancel each other out.
+        :param plug: The account any difference between the balances is moved to. If it's None, a difference raises a
+        ValueError instead.
+        :param plug_category: The category of the plug account, if it doesn't exist yet.
+        :param plug_term: The term of the plug account, if it's an asset or a liability that doesn't exist yet.
+        :return: Nothing.
+        """
+        if plug_category.lower() not in BS_CATEGORIES + IS_CATEGORIES:
+            raise ValueError("Invalid category type.")
+
+        if plug_term.lower() not in ["current", "non-current"]:
+            raise ValueError("Invalid term.")
+
+        # Equity doesn't have separate sections for current and non-current, so it doesn't get a term.
+        term: str | None = plug_term.lower() if plug_category.lower() in ["asset", "liability"] else None
+        self.eliminations.append((list(accounts), plug, plug_category.lower(), term))
+
+    def _eliminate(self, partial: Partial) -> None:
+        """
+        Applies every elimination rule.
+        :param partial: The consolidated totals.
+        :return: Nothing.
+        """
+        for accounts, plug, plug_category, plug_term in self.eliminations:
+            difference: int = sum(partial.pop(account)[3] for account in accounts if account in partial)
+
+            if difference == 0:
+                continue
+
+            if plug is None:
+                raise ValueError(f"Intercompany balances of {", ".join(accounts)} don't eliminate. They're off by "
+                                 f"{difference / SCALE}.")
+
+            _add(partial, plug, plug_category, Balance.find_default_balance(plug_category), plug_term, difference)
+
+    def consolidate(self, workers: int = 1, use_threads: bool = False,
+                    chunk_size: int | None = None) -> tuple[BalanceSheet, IncomeStatement]:
+        """
+        Consolidates every entity.
+        :param workers: How many processes (or threads) to spread the work across. With 1 worker, everything is done
+        in the current process, which gives the exact same results.
+        :param use_threads: Whether to use a thread pool instead of a process pool. Threads skip the cost of copying
+        each entity to another process, but Python code only runs in one thread at a time.
+        :param chunk_size: How many entities are in each chunk. Defaults to splitting the entities into four chunks per
+        worker.
+        :return: The consolidated balance sheet and income statement.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+
+        # Only the statements' fs dicts are sent to the workers, along with the entity's mapping merged into the
+        # consolidation's.
+        entities: list[tuple[list[dict], float, dict[str:str]]] = [
+            ([statement.fs for statement in statements], ownership, self.mapping | mapping)
+            for statements, ownership, mapping in self.entities.values()
+        ]
+
+        if chunk_size is None:
+            chunk_size = max(math.ceil(len(entities) / (workers * 4)), 1)
+
+        chunks: list[list[tuple[list[dict], float, dict[str:str]]]] = [entities[start:start + chunk_size]
+                                                                       for start in range(0, len(entities), chunk_size)]
+        partial: Partial
+
+        if workers == 1:
+            partial = _tree_reduce([_aggregate_chunk(chunk, self.nci_equity, self.nci_income) for chunk in chunks])
+
+        else:
+            pool_type: type = cf.ThreadPoolExecutor if use_threads else cf.ProcessPoolExecutor
+
+            with pool_type(max_workers=workers) as pool:
+                partials: list[Partial] = list(pool.map(_aggregate_chunk, chunks, [self.nci_equity] * len(chunks),
+                                                        [self.nci_income] * len(chunks)))
+
+                # Each round of the reduction merges pairs in parallel. An odd one out waits for the next round.
+                while len(partials) > 1:
+                    merged: list[Partial] = list(pool.map(_merge, partials[0:-1:2], partials[1::2]))
+                    partials = merged + partials[len(merged) * 2:]
+
+            partial = partials[0] if partials else {}
+
+        self._eliminate(partial)
+
+        return self._build(partial)
+
+    def _build(self, partial: Partial) -> tuple[BalanceSheet, IncomeStatement]:
+        """
+        Turns the consolidated totals into statements.
+        :param partial: The consolidated totals.
+        :return: The consolidated balance sheet and income statement.
+        """
+        bal_sheet: BalanceSheet = BalanceSheet(self.company, self.date)
+        inc_statement: IncomeStatement = IncomeStatement(self.company, self.date)
+        bs_fs: dict[str:dict[str:dict[str:str | float]]] = {category: {} for category in BS_CATEGORIES}
+        is_fs: dict[str:dict[str:dict[str:str | float]]] = {category: {} for category in IS_CATEGORIES}
+
+        for account, (category, normal_balance, term, units) in partial.items():
+            attributes: dict[str:str | float] = {
+                "d/c": normal_balance,
+                "bal": (units if normal_balance == DEBIT else -units) / SCALE
+            }
+
+            if term is not None:
+                attributes["term"] = term
+
+            if category in bs_fs:
+                bs_fs[category][account] = attributes
+
+            elif category in is_fs:
+                is_fs[category][account] = attributes
+
+            else:
+                raise ValueError(f"'{category}' is not a valid category.")
+
+        bal_sheet.fs = bs_fs
+        inc_statement.fs = is_fs
+
+        return bal_sheet, inc_statement
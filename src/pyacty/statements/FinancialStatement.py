@@ -7,15 +7,17 @@ This class also serves as a blank statement for one to make their own custom fin
 """
 
 from abc import abstractmethod
-import csv
-from csv import writer
-import json
 import os
-from typing import TextIO, final, override
+from typing import Callable, Iterable, final, override
 
+from .Account import Account
+from .BinarySnapshot import BinarySnapshot
+from .FsStorage import read_csv, read_json, read_jsonl, write_csv, write_json, write_jsonl
+from .StatementHistory import StatementHistory
 from .skeletons.FsSkeleton import FsSkeleton
 from ..constants import ALL_CATEGORIES
-from ..custom_exceptions import SupportError
+from ..custom_exceptions import SupportError, TotalsDriftError
+from ..fundamentals.FixedMoney import SCALE, to_units
 
 
 class FinancialStatement:
@@ -25,6 +27,25 @@ class FinancialStatement:
         :param company_name: The name of the company.
         :param date: The date of the financial statement.
         """
+        # What the fs property stores. It starts empty so that the setter always has an old statement to replace.
+        self._fs: dict[str:dict[str:dict[str:str | int | float]]] = {}
+        # Finds the category of an account from its name, in {name: category} format. It's kept in sync by the fs
+        # setter, add_account(), and del_account(), so finding an account never means searching every category.
+        self._index: dict[str:str] = {}
+        # The running total of each category, in {category: units} format (see FixedMoney.py). _totals adds up the
+        # balances as they're stored, and _signed_totals adds debits and subtracts credits. Both are kept in sync by
+        # the accounts themselves (see Account.py), and integers are used so that they never drift from the balances.
+        self._totals: dict[str:int] = {}
+        self._signed_totals: dict[str:int] = {}
+        # If True, every read of the totals checks them against the balances first. See verify_totals().
+        self.verify: bool = False
+        # The versions saved by snapshot(). It has to exist before fs is assigned.
+        self.history: StatementHistory = StatementHistory()
+        # The skeleton the statement was last rendered with, what it was rendered with (see skeleton()), and the
+        # accounts whose balances have changed since, in {account: category} format.
+        self._skeleton: FsSkeleton | None = None
+        self._skeleton_key: tuple[str, str, str, bool] | None = None
+        self._stale: dict[str:str] = {}
         self.fs: dict[str:dict[str:dict[str:str | int | float]]] = {}
         self.company: str = company_name
         # This is more of a place-holder name. If someone is making a custom financial statement they can change it.
@@ -34,13 +55,69 @@ class FinancialStatement:
 
     @override
     def __str__(self) -> str:
-        return FsSkeleton(self.fs, self.company, self.fs_name, self.date,
-                          decimals=self.decimals).auto_render()
+        return "".join(f"{line}\n" for line in self.skeleton().lines())
 
     @override
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self.__dict__}"
 
+    # Properties
+    @property
+    def fs(self) -> dict[str:dict[str:dict[str:str | int | float]]]:
+        """
+        :return: The financial statement, in {category: {account: attributes}} format.
+        """
+        return self._fs
+
+    @fs.setter
+    def fs(self, new_fs: dict[str:dict[str:dict[str:str | int | float]]]) -> None:
+        """
+        Replaces the entire financial statement and rebuilds the account index and totals to match. The accounts are
+        turned into Account objects in place, so that they keep the totals up to date from now on.
+        :param new_fs: The new financial statement.
+        :return: Nothing.
+        """
+        index: dict[str:str] = {}
+
+        for category, accounts in new_fs.items():
+            for account in accounts:
+                if account in index:
+                    raise ValueError(f"'{account}' is in both {index[account]} and {category}.")
+
+                index[account] = category
+
+        # Replacing the statement changes every account, so every account has to be saved for the history. This is no
+        # more work than the rest of the setter.
+        if self.history.recording:
+            self.history.record_categories(list(self._fs))
+
+            for account in self._index.keys() | index.keys():
+                self._record(account)
+
+        # The old accounts stop belonging to the statement, otherwise changing one that's still referenced somewhere
+        # would change the totals. Those that are still in the new statement are taken back below.
+        for accounts in self._fs.values():
+            for attributes in accounts.values():
+                self._release(attributes)
+
+        self._fs = new_fs
+        self._index = index
+        self._skeleton = None
+        self._totals = dict.fromkeys(new_fs, 0)
+        self._signed_totals = dict.fromkeys(new_fs, 0)
+
+        for category, accounts in new_fs.items():
+            for account, attributes in accounts.items():
+                # Accounts that don't belong to any statement are kept as they are, so references to them stay valid.
+                if type(attributes) is Account and attributes._owner is None:
+                    attributes._attach(self, category, account)
+
+                else:
+                    accounts[account] = Account(attributes, self, category, account)
+
+                self._track(category, attributes)
+
+    # Methods
     def reset(self) -> None:
         """
         Returns the financial statement to its default state.
@@ -48,6 +125,202 @@ class FinancialStatement:
         """
         self.fs = {}
 
+    @final
+    def category_of(self, account: str) -> str:
+        """
+        :param account: The name of the account.
+        :return: The category the account is in.
+        """
+        try:
+            return self._index[account]
+
+        except KeyError:
+            raise KeyError("Account not found!") from None
+
+    @final
+    def _store_account(self, name: str, category: str, attributes: dict[str:str | int | float]) -> None:
+        """
+        Adds an account to the financial statement, the index, and the totals. Adding an account to the category it's
+        already in is allowed, since add_account() replaces the existing account in that case.
+        :param name: The name of the account.
+        :param category: The category of the account.
+        :param attributes: The attributes of the account.
+        :return: Nothing.
+        """
+        existing: str | None = self._index.get(name)
+
+        if existing is not None and existing != category:
+            raise ValueError(f"'{name}' is already in {existing}.")
+
+        self._record(name)
+        account: Account = Account(attributes, self, category, name)
+        accounts: dict[str:Account] = self.fs[category]
+
+        if name in accounts:
+            self._untrack(category, accounts[name])
+            self._release(accounts[name])
+
+        else:
+            # A new account means a new line, so the skeleton has to be built again.
+            self._skeleton = None
+
+        accounts[name] = account
+        self._index[name] = category
+        self._track(category, account)
+
+    @final
+    def _pop_account(self, name: str) -> dict[str:str | int | float]:
+        """
+        Removes an account from the financial statement, the index, and the totals.
+        :param name: The name of the account.
+        :return: The removed account.
+        """
+        category: str = self.category_of(name)
+        self._record(name)
+        self._skeleton = None
+        del self._index[name]
+        account: dict[str:str | int | float] = self.fs[category].pop(name)
+        self._untrack(category, account)
+        self._release(account)
+
+        return account
+
+    @final
+    def _release(self, attributes: dict[str:str | int | float]) -> None:
+        """
+        Stops an account that was taken out of the statement from changing the totals. It becomes a plain account that
+        doesn't belong to any statement.
+        :param attributes: The attributes of the account.
+        :return: Nothing.
+        """
+        if type(attributes) is Account and attributes._owner is self:
+            attributes._attach(None, "", "")
+
+    @final
+    def _record(self, name: str) -> None:
+        """
+        Saves a copy of an account for the history right before it's changed (see StatementHistory.py). Nothing is
+        copied if there aren't any snapshots, or if the account has already been saved since the last one.
+        :param name: The name of the account.
+        :return: Nothing.
+        """
+        category: str | None = self._index.get(name)
+
+        if self.history.recording:
+            self.history.record(name, None if category is None else (category, self._fs[category][name]))
+
+        # The account's line has to be rendered again too (see skeleton()).
+        if self._skeleton is not None and category is not None:
+            self._stale[name] = category
+
+    @final
+    def skeleton(self) -> FsSkeleton:
+        """
+        The skeleton the financial statement is rendered with. It's kept between renders, so after balances change,
+        only the lines of the changed accounts and the totals of their categories are rendered again. Adding or deleting
+        accounts, replacing fs, or changing the company, name, date, or decimals builds a new one. Like the totals,
+        changes made without going through the statement or its accounts aren't noticed (see verify_totals()).
+        :return: The skeleton, with every element of the financial statement.
+        """
+        key: tuple[str, str, str, bool] = (self.company, self.fs_name, self.date, self.decimals)
+
+        if self._skeleton is None or self._skeleton_key != key:
+            self._skeleton = FsSkeleton(self.fs, self.company, self.fs_name, self.date, decimals=self.decimals)
+            self._skeleton.auto_build()
+            self._skeleton_key = key
+
+        elif self._stale:
+            self._skeleton.update_accounts(self._stale)
+
+        self._stale = {}
+
+        return self._skeleton
+
+    @final
+    def snapshot(self, label: str = "") -> int:
+        """
+        Saves the current version of the financial statement. Nothing is copied until an account is changed, and then
+        only that account is copied, so this takes the same amount of time no matter how many accounts there are.
+        :param label: The name of the version.
+        :return: The number of the version, for diff(), rollback(), and version().
+        """
+        return self.history.snapshot(label)
+
+    @final
+    def version(self, number: int) -> dict[str:dict[str:dict[str:str | int | float]]]:
+        """
+        Rebuilds a saved version of the financial statement without changing the statement. Use this instead of
+        copy.deepcopy() to keep a "before" state around.
+        :param number: The number of the version.
+        :return: A copy of the financial statement in that version.
+        """
+        return self.history.build(self._fs, number)
+
+    @final
+    def diff(self, old: int, new: int | None = None) -> dict[str:dict[str:tuple[dict | None, dict | None]]]:
+        """
+        Compares two versions of the financial statement. Only the accounts changed since the older version are looked
+        at.
+        :param old: The number of the first version.
+        :param new: The number of the second version, or None for the financial statement as it is now.
+        :return: Every account that's different, in {category: {account: (old attributes, new attributes)}} format.
+        The attributes are None if the account doesn't exist in that version.
+        """
+        return self.history.diff(self._fs, self._index, old, new)
+
+    @final
+    def rollback(self, number: int) -> None:
+        """
+        Undoes every change since a version was saved. Versions saved after it are forgotten, but the version itself is
+        kept, so it can be rolled back to again. Only the accounts that changed are touched, unless the whole statement
+        was replaced (like with reset() or load_fs()). Accounts that were deleted are put back at the end of their
+        category.
+        :param number: The number of the version.
+        :return: Nothing.
+        """
+        states: dict[str:tuple[str, dict[str:str | int | float]] | None]
+        categories: list[str] | None
+        states, categories = self.history.states_at(number)
+
+        with self.history.paused():
+            if categories is not None:
+                # The categories are restored first, so every account below has a category to go back to.
+                self.fs = {category: self._fs.get(category, {}) for category in categories}
+
+            for name, state in states.items():
+                if name in self._index and (state is None or self._index[name] != state[0]):
+                    self._pop_account(name)
+
+                if state is not None:
+                    self._store_account(name, state[0], dict(state[1]))
+
+        self.history.truncate(number)
+
+    @final
+    def _track(self, category: str, attributes: dict[str:str | int | float], sign: int = 1) -> None:
+        """
+        Adds an account's balance to the totals of its category.
+        :param category: The category of the account.
+        :param attributes: The attributes of the account.
+        :param sign: 1 to add the balance, -1 to take it back out.
+        :return: Nothing.
+        """
+        units: int = to_units(attributes.get("bal", 0)) * sign
+
+        self._totals[category] = self._totals.get(category, 0) + units
+        self._signed_totals[category] = (self._signed_totals.get(category, 0) +
+                                         (units if attributes.get("d/c") == "debit" else -units))
+
+    @final
+    def _untrack(self, category: str, attributes: dict[str:str | int | float]) -> None:
+        """
+        Takes an account's balance back out of the totals of its category.
+        :param category: The category of the account.
+        :param attributes: The attributes of the account.
+        :return: Nothing.
+        """
+        self._track(category, attributes, -1)
+
     # Is this not already handled by the TrueBalance class?
     @final
     def true_value(self, account: str) -> float:
@@ -57,135 +330,166 @@ class FinancialStatement:
         :param account: The account to find the true value of.
         :return: The true value of the account.
         """
-        # Looping through ALL_CATEGORIES allows this method to work with any financial statement saving the work of
-        # having to override the method for each child class.
-        for category in ALL_CATEGORIES:
-            try:
-                if self.fs[category][account]["d/c"] == "debit":
-                    # All values should be stored as positive floats, but this is just in case they aren't for some
-                    # reason. Accounts have no reason to be negative.
-                    return abs(self.fs[category][account]["balance"])
-                else:
-                    return self.fs[category][account]["balance"] * -1.0
-            except KeyError:
-                continue
+        attributes: dict[str:str | int | float] = self.fs[self.category_of(account)][account]
+
+        if attributes["d/c"] == "debit":
+            # All values should be stored as positive floats, but this is just in case they aren't for some reason.
+            # Accounts have no reason to be negative.
+            return abs(attributes["bal"])
+
         else:
-            raise KeyError("Account not found!")
+            return attributes["bal"] * -1.0
 
-    # I'm sorry.
     # I'm not sure if this should be final or not. Overriding it may make it so that load_fs() won't work properly.
     # @final
-    def save_fs(self, directory: str, file_name: str, file_type: str = "all") -> None:
+    def save_fs(self, directory: str, file_name: str, file_type: str = "all", compress: bool = False) -> None:
         """
-        Saves the financial statement to the given directory.
-        :param directory: The directory to save the financial statement to.
+        Saves the financial statement to the given directory. Each file is written in full before it replaces any
+        existing file with the same name (see FsStorage.py).
+        :param directory: The directory to save the financial statement to. It's created if it doesn't exist.
         :param file_name: The name of the file.
-        :param file_type: The type of file to save to (CSV or JSON).
+        :param file_type: The type of file to save to (CSV, JSON, or JSONL), or "all" for both CSV and JSON.
+        :param compress: If True, the files are compressed with gzip and end in .gz.
         :return: Nothing.
         """
-        valid_file_types: list[str] = ["csv", "json"]
+        file_type = file_type.lower()
+        valid_file_types: list[str] = ["csv", "json", "jsonl"]
 
-        # I'm not entirely sure if I want this to be private or not.
-        def __make_file(extension: str) -> TextIO:
-            """
-            Makes the file the data is saved to.
-            :param extension: The type of file to save to.
-            :return: The file to save the data to.
-            """
-            return open(f"{directory}\\{file_name}.{extension}", "w", newline="")
+        if file_type != "all" and file_type not in valid_file_types:
+            raise ValueError("Invalid valid type.")
 
-        def save_files(option: int) -> None:
+        def path_of(extension: str) -> str:
             """
-            Saves files specified by the argument.\n
-            0: Saves all files.
-            1: Saves CSV file only.
-            2: Saves JSON file only.
-            :param option: What types of files to save.
-            :return: Nothing
+            :param extension: The type of file.
+            :return: The path of the file.
             """
-            outfile: TextIO
+            return os.path.join(directory, f"{file_name}.{extension}{".gz" if compress else ""}")
 
-            # Having "or option == 0" included in each conditional makes it possible to save each file. It's also why
-            # these are separate conditional statements and aren't chained.
+        # TODO: When saving to a CSV file, we need to make contra-accounts negative/positive depending on what the
+        #  non-contra equivalent is. For example, treasury stock should be stored in the CSV file as a negative
+        #  number. Expenses should be negative as well. The true_value() function should be useful for this.
+        if file_type in ["all", "csv"]:
+            write_csv(self.fs, path_of("csv"), compress)
 
-            # CSV file
-            # TODO: When saving to a CSV file, we need to make contra-accounts negative/positive depending on what the
-            #  non-contra equivalent is. For example, treasury stock should be stored in the CSV file as a negative
-            #  number. Expenses should be negative as well. The true_value() function should be useful for this.
-            if option == 1 or option == 0:
-                try:
-                    outfile = __make_file("csv")
+        if file_type in ["all", "json"]:
+            write_json(self.fs, path_of("json"), compress)
 
-                except FileNotFoundError:
-                    os.mkdir(directory)
-                    outfile = __make_file("csv")
+        if file_type == "jsonl":
+            write_jsonl(self.fs, path_of("jsonl"), compress)
 
-                csv_writer: writer = csv.writer(outfile)
-
-                for fs_category, fs_accounts in self.fs.items():
-                    csv_writer.writerow([fs_category.capitalize()])
+    def load_fs(self, directory: str) -> None:
+        """
+        Replaces the financial statement with one loaded from a file saved by save_fs(). Every account is checked as
+        it's read, and the statement isn't changed if the file isn't valid. Categories the statement already has are
+        kept even if the file doesn't have any accounts in them.
+        :param directory: The path of the file (.csv, .json, or .jsonl, optionally followed by .gz).
+        :return: Nothing.
+        """
+        readers: dict[str:Callable[[str, Iterable[str]], dict[str:dict[str:dict[str:str | int | float]]]]] = {
+            ".csv": read_csv,
+            ".json": read_json,
+            ".jsonl": read_jsonl
+        }
+        extension: str = os.path.splitext(directory.lower().removesuffix(".gz"))[1]
 
-                    for account, attributes in fs_accounts.items():
-                        value: float = 0.0
+        if extension not in readers:
+            raise SupportError("PyActy only supports loading .CSV, .JSON, and .JSONL files!")
 
-                        for attribute, info in attributes.items():
-                            if attribute == "bal":
-                                value = info
+        # Assigning to fs rebuilds the account index.
+        self.fs = readers[extension](directory, self.fs.keys())
 
-                        csv_writer.writerow(["", account, value])
+    def save_snapshot(self, directory: str, file_name: str) -> None:
+        """
+        Saves the financial statement as a binary snapshot (see BinarySnapshot.py), which is much smaller and faster to
+        load than the other formats.
+        :param directory: The directory to save the snapshot to. It's created if it doesn't exist.
+        :param file_name: The name of the file, without an extension.
+        :return: Nothing.
+        """
+        BinarySnapshot.write(self.fs, os.path.join(directory, f"{file_name}.pyfs"))
 
-                outfile.close()
+    def load_snapshot(self, path: str) -> None:
+        """
+        Replaces the financial statement with a binary snapshot. To look at a few accounts without loading every one of
+        them, open the snapshot with BinarySnapshot instead.
+        :param path: The path of the snapshot.
+        :return: Nothing.
+        """
+        snapshot: BinarySnapshot = BinarySnapshot(path)
+        invalid: list[str] = [category for category in snapshot.categories if category not in ALL_CATEGORIES]
 
-            # JSON file
-            if option == 2 or option == 0:
-                try:
-                    outfile = __make_file("json")
+        if invalid:
+            raise ValueError(f"'{invalid[0]}' is not a valid category.")
 
-                except FileNotFoundError:
-                    os.mkdir(directory)
-                    outfile = __make_file("json")
+        fs: dict[str:dict[str:dict[str:str | int | float]]] = {category: {} for category in self.fs}
+        fs.update(snapshot.to_fs())
+        self.fs = fs
 
-                outfile.write(json.dumps(self.fs, indent=4))
-                outfile.close()
+    def total_accounts(self) -> dict[str:float]:
+        """
+        Adds up the balances of every category. The totals are kept up to date as balances change, so this takes the
+        same amount of time no matter how many accounts there are.
+        :return: The total of each category, in {category: total} format.
+        """
+        if self.verify:
+            self._raise_drift()
 
-        if file_type == "all":
-            save_files(0)
+        return {category: units / SCALE for category, units in self._totals.items()}
 
-        else:
-            if file_type not in valid_file_types:
-                raise ValueError("Invalid valid type.")
+    def signed_totals(self) -> dict[str:float]:
+        """
+        Like total_accounts(), except debit balances are added and credit balances are subtracted. Contra-accounts
+        therefore reduce their category, and the totals of a balanced set of accounts add up to 0.
+        :return: The signed total of each category, in {category: total} format.
+        """
+        if self.verify:
+            self._raise_drift()
 
-            if file_type.lower() == "csv":
-                save_files(1)
-            else:
-                save_files(2)
+        return {category: units / SCALE for category, units in self._signed_totals.items()}
 
-    def load_fs(self, directory: str):
+    def verify_totals(self, repair: bool = False) -> dict[str:float]:
         """
-        Considerations for this method:
-        - Should it be overridden or final?
-        - Should it return the loaded file or modify self.fs directly?
-        - Should we only load JSON files or CSV files too?
+        Adds up every account from scratch and compares the result against the running totals. The totals can only
+        drift if the statement is changed without going through its methods or its Account objects, like adding a
+        plain dict straight to self.fs["asset"].
+        :param repair: If True, the index and totals are rebuilt from the accounts when they've drifted.
+        :return: How far each drifted category is off, in {category: running total - actual total} format. Categories
+        that haven't drifted are left out.
         """
-        if not directory.lower().endswith(".json"):
-            raise SupportError("PyActy only supports loading .JSON files!")
+        totals: dict[str:int] = {}
+        signed_totals: dict[str:int] = {}
 
-        self.fs = json.load(open(directory))
+        for category, accounts in self.fs.items():
+            totals[category] = signed_totals[category] = 0
 
-    def total_accounts(self) -> dict[str:float]:
-        totals: dict[str:float] = {}
+            for attributes in accounts.values():
+                units: int = to_units(attributes.get("bal", 0))
+                totals[category] += units
+                signed_totals[category] += units if attributes.get("d/c") == "debit" else -units
 
-        for category, accounts in self.fs.items():
-            for account, attributes in accounts.items():
-                for attribute, value in attributes.items():
-                    if attribute == "bal":
-                        try:
-                            totals[category] += value
+        drift: dict[str:float] = {}
 
-                        except KeyError:
-                            totals[category] = value
+        for category in totals.keys() | self._totals.keys():
+            if (self._totals.get(category, 0) != totals.get(category, 0) or
+                    self._signed_totals.get(category, 0) != signed_totals.get(category, 0)):
+                drift[category] = (self._totals.get(category, 0) - totals.get(category, 0)) / SCALE
+
+        if drift and repair:
+            # Assigning fs turns any plain dicts into Account objects too, so they won't cause drift again.
+            self.fs = self._fs
+
+        return drift
+
+    @final
+    def _raise_drift(self) -> None:
+        """
+        Used by the totals when verify is True.
+        :return: Nothing.
+        """
+        drift: dict[str:float] = self.verify_totals()
 
-        return totals
+        if drift:
+            raise TotalsDriftError(f"The running totals have drifted from the balances: {drift}")
 
     @abstractmethod
     def add_account(self, name: str, category: str, start_bal: float = 0.0, contra: bool = False) -> None:
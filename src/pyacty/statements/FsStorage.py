@@ -0,0 +1,233 @@
+"""
+FsStorage.py
+
+Reads and writes the files financial statements are saved to (see FinancialStatement.save_fs() and load_fs()).
+
+Every file is written through atomic_open() (see storage.py), so a crash or an error halfway through a save never
+leaves a half-written statement behind. Rows are written as they're generated, so the whole file never has to be held
+in memory as a single string.
+
+CSV and JSON Lines files are read a line at a time too, and every account is validated as it's read, so loading never
+needs a second pass or a copy of the statement.
+"""
+
+import csv
+import gzip
+import json
+from typing import Iterable, Iterator, TextIO
+
+from ..constants import ALL_CATEGORIES, BAL_TYPES
+from ..fundamentals.Balance import Balance
+from ..storage import atomic_open
+
+
+def csv_rows(fs: dict[str:dict[str:dict[str:str | int | float]]]) -> Iterator[list[str | int | float]]:
+    """
+    Generates the rows of the CSV layout, where each category is a row of its own followed by a row for each of its
+    accounts.
+    :param fs: The financial statement, in {category: {account: attributes}} format.
+    :return: The rows.
+    """
+    for category, accounts in fs.items():
+        yield [category.capitalize()]
+
+        for account, attributes in accounts.items():
+            yield ["", account, attributes.get("bal", 0.0)]
+
+
+def write_csv(fs: dict[str:dict[str:dict[str:str | int | float]]], path: str, compress: bool = False) -> None:
+    """
+    Saves a financial statement to a CSV file.
+    :param fs: The financial statement, in {category: {account: attributes}} format.
+    :param path: The path of the file.
+    :param compress: If True, the file is compressed with gzip.
+    :return: Nothing.
+    """
+    outfile: TextIO
+
+    with atomic_open(path, compress) as outfile:
+        csv.writer(outfile).writerows(csv_rows(fs))
+
+
+def write_json(fs: dict[str:dict[str:dict[str:str | int | float]]], path: str, compress: bool = False) -> None:
+    """
+    Saves a financial statement to a JSON file. json.dump() writes the file a piece at a time, unlike json.dumps().
+    :param fs: The financial statement, in {category: {account: attributes}} format.
+    :param path: The path of the file.
+    :param compress: If True, the file is compressed with gzip.
+    :return: Nothing.
+    """
+    outfile: TextIO
+
+    with atomic_open(path, compress) as outfile:
+        json.dump(fs, outfile, indent=4)
+
+
+def write_jsonl(fs: dict[str:dict[str:dict[str:str | int | float]]], path: str, compress: bool = False) -> None:
+    """
+    Saves a financial statement to a JSON Lines file, where each line is a single account in {"category": category,
+    "account": name, **attributes} format.
+    :param fs: The financial statement, in {category: {account: attributes}} format.
+    :param path: The path of the file.
+    :param compress: If True, the file is compressed with gzip.
+    :return: Nothing.
+    """
+    outfile: TextIO
+
+    with atomic_open(path, compress) as outfile:
+        outfile.writelines(f"{json.dumps({"category": category, "account": account, **attributes})}\n"
+                           for category, accounts in fs.items() for account, attributes in accounts.items())
+
+
+def open_text(path: str) -> TextIO:
+    """
+    Opens a file for reading text. Files ending in .gz are decompressed as they're read.
+    :param path: The path of the file.
+    :return: The file.
+    """
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+
+    return open(path, encoding="utf-8", newline="")
+
+
+def _add_account(fs: dict[str:dict[str:dict[str:str | int | float]]], category: str, account: str,
+                 attributes: dict[str:str | int | float], where: str) -> None:
+    """
+    Validates an account and adds it to a financial statement.
+    :param fs: The financial statement being loaded.
+    :param category: The category of the account.
+    :param account: The name of the account.
+    :param attributes: The attributes of the account.
+    :param where: Where the account is in the file, for error messages.
+    :return: Nothing.
+    """
+    if category not in ALL_CATEGORIES:
+        raise ValueError(f"{where}: '{category}' is not a valid category.")
+
+    if not isinstance(attributes, dict):
+        raise ValueError(f"{where}: '{account}' doesn't have any attributes.")
+
+    if attributes.get("d/c") not in BAL_TYPES:
+        raise ValueError(f"{where}: '{attributes.get("d/c")}' is not a valid balance type.")
+
+    # bool is a subclass of int, but it's never a valid balance.
+    if type(attributes.get("bal")) not in [int, float]:
+        raise ValueError(f"{where}: '{attributes.get("bal")}' is not a valid balance.")
+
+    accounts: dict[str:dict[str:str | int | float]] = fs.setdefault(category, {})
+
+    if account in accounts:
+        raise ValueError(f"{where}: '{account}' appears more than once.")
+
+    accounts[account] = attributes
+
+
+def read_csv(path: str, categories: Iterable[str] = ()) -> dict[str:dict[str:dict[str:str | int | float]]]:
+    """
+    Loads a financial statement from the CSV layout written by write_csv(). The layout doesn't include the normal
+    balance of each account, so every account is given the default balance of its category.
+    :param path: The path of the file.
+    :param categories: Categories to include even if the file doesn't have any accounts in them.
+    :return: The financial statement, in {category: {account: attributes}} format.
+    """
+    fs: dict[str:dict[str:dict[str:str | int | float]]] = {category: {} for category in categories}
+    category: str | None = None
+    infile: TextIO
+
+    with open_text(path) as infile:
+        for line, row in enumerate(csv.reader(infile), 1):
+            where: str = f"Line {line}"
+
+            # Category rows have the category in the first column, and account rows leave it empty.
+            if not row or not any(row):
+                continue
+
+            if row[0]:
+                category = row[0].lower()
+
+                if category not in ALL_CATEGORIES:
+                    raise ValueError(f"{where}: '{category}' is not a valid category.")
+
+                fs.setdefault(category, {})
+
+            elif category is None:
+                raise ValueError(f"{where}: Accounts have to come after a category.")
+
+            elif len(row) < 3:
+                raise ValueError(f"{where}: Accounts need a name and a balance.")
+
+            else:
+                try:
+                    balance: float = float(row[2])
+
+                except ValueError:
+                    raise ValueError(f"{where}: '{row[2]}' is not a valid balance.") from None
+
+                _add_account(fs, category, row[1], {"d/c": Balance.find_default_balance(category), "bal": balance},
+                             where)
+
+    return fs
+
+
+def read_json(path: str, categories: Iterable[str] = ()) -> dict[str:dict[str:dict[str:str | int | float]]]:
+    """
+    Loads a financial statement from a JSON file written by write_json().
+    :param path: The path of the file.
+    :param categories: Categories to include even if the file doesn't have any accounts in them.
+    :return: The financial statement, in {category: {account: attributes}} format.
+    """
+    fs: dict[str:dict[str:dict[str:str | int | float]]] = {category: {} for category in categories}
+    infile: TextIO
+
+    with open_text(path) as infile:
+        loaded: dict[str:dict[str:dict[str:str | int | float]]] = json.load(infile)
+
+    if not isinstance(loaded, dict):
+        raise ValueError("The file doesn't contain a financial statement.")
+
+    for category, accounts in loaded.items():
+        if category not in ALL_CATEGORIES:
+            raise ValueError(f"'{category}' is not a valid category.")
+
+        if not isinstance(accounts, dict):
+            raise ValueError(f"'{category}' doesn't have any accounts.")
+
+        fs.setdefault(category, {})
+
+        for account, attributes in accounts.items():
+            _add_account(fs, category, account, attributes, f"'{account}'")
+
+    return fs
+
+
+def read_jsonl(path: str, categories: Iterable[str] = ()) -> dict[str:dict[str:dict[str:str | int | float]]]:
+    """
+    Loads a financial statement from a JSON Lines file written by write_jsonl().
+    :param path: The path of the file.
+    :param categories: Categories to include even if the file doesn't have any accounts in them.
+    :return: The financial statement, in {category: {account: attributes}} format.
+    """
+    fs: dict[str:dict[str:dict[str:str | int | float]]] = {category: {} for category in categories}
+    infile: TextIO
+
+    with open_text(path) as infile:
+        for line, text in enumerate(infile, 1):
+            where: str = f"Line {line}"
+
+            if not text.strip():
+                continue
+
+            try:
+                attributes: dict[str:str | int | float] = json.loads(text)
+
+            except json.JSONDecodeError:
+                raise ValueError(f"{where}: Not valid JSON.") from None
+
+            if not isinstance(attributes, dict) or "category" not in attributes or "account" not in attributes:
+                raise ValueError(f"{where}: Accounts need a category and a name.")
+
+            category: str = attributes.pop("category")
+            _add_account(fs, category, attributes.pop("account"), attributes, where)
+
+    return fs
@@ -6,7 +6,6 @@ from typing import override
 
 from .FinancialStatement import FinancialStatement
 from ..fundamentals.Balance import Balance
-from .skeletons.FsSkeleton import FsSkeleton
 from ..constants import IS_CATEGORIES
 
 
@@ -39,11 +38,6 @@ class IncomeStatement(FinancialStatement):
         }
         self.fs_name: str = "Income Statement"
 
-    @override
-    def __str__(self) -> str:
-        return FsSkeleton(self.fs, self.company, self.fs_name, self.date,
-                          decimals=self.decimals).auto_render()
-
     @override
     def reset(self) -> None:
         self.fs = {
@@ -58,23 +52,15 @@ class IncomeStatement(FinancialStatement):
 
         db: str = Balance.find_default_balance(category, contra)
 
-        self.fs[category.lower()][name] = {
+        # Raises a ValueError if another category already has an account with this name.
+        self._store_account(name, category.lower(), {
             "d/c": db,
             "bal": start_bal
-        }
+        })
 
     @override
     def del_account(self, name: str) -> None:
-        for category in IS_CATEGORIES:
-            try:
-                self.fs[category].pop(name)
-                break
-
-            except KeyError:
-                pass
-
-        else:
-            raise KeyError("Account not found!")
+        self._pop_account(name)
 
     def net_income(self) -> float:
         """
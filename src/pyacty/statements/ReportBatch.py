@@ -0,0 +1,163 @@
+"""
+ReportBatch.py
+
+Renders many financial statements at once, like every subsidiary of a group, either to a file each or to a single
+stream. The output of each statement is the same as str(statement).
+
+The statements are split into chunks, which can be spread across a process or thread pool. Each worker compiles every
+template once (see Layout.py) and reuses it for every statement it renders, and reports are streamed a line at a time
+(see FsSkeleton.auto_write()), so no report is ever held in memory as a single string unless it has to be sent back from
+another process.
+"""
+
+import concurrent.futures as cf
+import math
+import os
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from .FinancialStatement import FinancialStatement
+from ..storage import atomic_open
+from .skeletons.FsSkeleton import FsSkeleton
+
+# Everything FsSkeleton needs to render a statement, in (fs, company, fs_name, date, decimals) format. Only this is sent
+# to the workers, instead of the whole statement.
+type Report = tuple[dict[str:dict[str:dict[str:Any]]], str, str, str, bool]
+
+
+def _report_of(statement: FinancialStatement) -> Report:
+    """
+    :param statement: The financial statement.
+    :return: What FsSkeleton needs to render the statement.
+    """
+    return statement.fs, statement.company, statement.fs_name, statement.date, statement.decimals
+
+
+def _skeleton_of(report: Report) -> FsSkeleton:
+    """
+    :param report: What FsSkeleton needs to render the statement.
+    :return: The skeleton, the same way FinancialStatement.__str__() makes it.
+    """
+    fs, company, fs_name, date, decimals = report
+
+    return FsSkeleton(fs, company, fs_name, date, decimals=decimals)
+
+
+def _chunks(items: list, workers: int, chunk_size: int | None) -> list[list]:
+    """
+    Splits the statements between the workers.
+    :param items: The statements.
+    :param workers: How many workers there are.
+    :param chunk_size: How many statements are in each chunk. Defaults to four chunks per worker.
+    :return: The chunks.
+    """
+    if chunk_size is None:
+        chunk_size = max(math.ceil(len(items) / (workers * 4)), 1)
+
+    return [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+
+def _save_chunk(jobs: list[tuple[str, Report]]) -> None:
+    """
+    Renders a chunk of statements to their files. This is a plain function (instead of a nested one) so that it can be
+    sent to a process pool.
+    :param jobs: The path of each file and the statement to render to it.
+    :return: Nothing.
+    """
+    outfile: TextIO
+
+    for path, report in jobs:
+        with atomic_open(path) as outfile:
+            _skeleton_of(report).auto_write(outfile)
+
+
+def _render_chunk(reports: list[Report]) -> list[str]:
+    """
+    Renders a chunk of statements, which are sent back to be written to the stream in order.
+    :param reports: The statements.
+    :return: The output of each statement.
+    """
+    return ["".join(f"{line}\n" for line in _skeleton_of(report).auto_lines()) for report in reports]
+
+
+def _map(function: Callable[[list], Any], chunks: list, workers: int, use_threads: bool) -> Iterator:
+    """
+    Runs a function over every chunk, in order.
+    :param function: The function.
+    :param chunks: The chunks.
+    :param workers: How many processes (or threads) to use. With 1 worker, everything runs in the current process.
+    :param use_threads: Whether to use a thread pool instead of a process pool.
+    :return: The result of each chunk, in order.
+    """
+    if workers == 1:
+        yield from map(function, chunks)
+        return
+
+    pool_type: type = cf.ThreadPoolExecutor if use_threads else cf.ProcessPoolExecutor
+
+    with pool_type(max_workers=workers) as pool:
+        yield from pool.map(function, chunks)
+
+
+def save_reports(statements: dict[str:FinancialStatement], directory: str, workers: int = 1, use_threads: bool = False,
+                 chunk_size: int | None = None) -> list[str]:
+    """
+    Renders each statement to a text file of its own. Like save_fs(), each file is written in full before it replaces
+    any existing file with the same name.
+    :param statements: The statements, in {file name: statement} format. Each file name gets a .txt extension.
+    :param directory: The directory to save the reports to. It's created if it doesn't exist.
+    :param workers: How many processes (or threads) to spread the work across.
+    :param use_threads: Whether to use a thread pool instead of a process pool. Rendering is pure Python, so threads
+    only help when writing the files is the slow part.
+    :param chunk_size: How many statements each worker renders at a time. Defaults to four chunks per worker.
+    :return: The path of each report, in the same order as statements.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    jobs: list[tuple[str, Report]] = [(os.path.join(directory, f"{file_name}.txt"), _report_of(statement))
+                                      for file_name, statement in statements.items()]
+
+    # The workers write the files themselves, so nothing has to be sent back.
+    for _ in _map(_save_chunk, _chunks(jobs, workers, chunk_size), workers, use_threads):
+        pass
+
+    return [path for path, _ in jobs]
+
+
+def write_reports(statements: Iterable[FinancialStatement], stream: TextIO, workers: int = 1,
+                  use_threads: bool = False, chunk_size: int | None = None, separator: str = "\n") -> None:
+    """
+    Renders every statement to a single text stream (a file, a socket, sys.stdout, etc.), one after another.
+    :param statements: The statements, in the order they're written.
+    :param stream: The stream to write to.
+    :param workers: How many processes (or threads) to spread the rendering across. The reports are still written in
+    order. With 1 worker, every report is streamed straight to the stream a line at a time.
+    :param use_threads: Whether to use a thread pool instead of a process pool.
+    :param chunk_size: How many statements each worker renders at a time. Defaults to four chunks per worker.
+    :param separator: What's written between reports.
+    :return: Nothing.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    reports: list[Report] = [_report_of(statement) for statement in statements]
+    first: bool = True
+
+    if workers == 1:
+        for report in reports:
+            if not first:
+                stream.write(separator)
+
+            _skeleton_of(report).auto_write(stream)
+            first = False
+
+        return
+
+    # Chunks are written as soon as they're done (and every chunk before them is too), instead of all at the end.
+    for rendered in _map(_render_chunk, _chunks(reports, workers, chunk_size), workers, use_threads):
+        for output in rendered:
+            if not first:
+                stream.write(separator)
+
+            stream.write(output)
+            first = False
@@ -0,0 +1,238 @@
+"""
+StatementHistory.py
+
+A StatementHistory keeps the versions of a financial statement (see FinancialStatement.snapshot()) without copying the
+statement. Taking a snapshot only starts a new, empty version. The first time an account is changed after that, a copy
+of what it looked like is saved to the version, and changing it again doesn't copy anything. A snapshot of a statement
+with a million accounts therefore costs nothing, and a what-if adjustment to a dozen accounts only ever copies those
+dozen accounts.
+
+Older versions are rebuilt by starting from the statement as it is now and undoing the saved copies, newest version
+first. Diffs only look at the accounts that were copied, so they take the same amount of time no matter how big the
+statement is.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+# What an account looked like, in (category, attributes) format, or None if the statement didn't have it.
+type AccountState = tuple[str, dict[str:str | int | float]] | None
+
+
+class _Version:
+    __slots__ = ("label", "changes", "categories")
+
+    def __init__(self, label: str) -> None:
+        """
+        A single version of a financial statement.
+        :param label: The name of the version.
+        """
+        self.label: str = label
+        # What every account changed since the snapshot looked like when it was taken, in {name: state} format.
+        self.changes: dict[str:AccountState] = {}
+        # The categories of the statement when the snapshot was taken, if the statement has been replaced since then.
+        self.categories: list[str] | None = None
+
+
+class StatementHistory:
+    # Dunders
+    def __init__(self) -> None:
+        """
+        An empty history. Nothing is recorded until the first snapshot.
+        """
+        self._versions: list[_Version] = []
+        self._paused: bool = False
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    # Properties
+    @property
+    def labels(self) -> list[str]:
+        """
+        :return: The label of each version, in order. A version's number is its position.
+        """
+        return [version.label for version in self._versions]
+
+    @property
+    def recording(self) -> bool:
+        """
+        :return: If changes to the statement need to be recorded.
+        """
+        return bool(self._versions) and not self._paused
+
+    # Methods
+    def snapshot(self, label: str = "") -> int:
+        """
+        Starts a new version.
+        :param label: The name of the version.
+        :return: The number of the version.
+        """
+        self._versions.append(_Version(label))
+
+        return len(self._versions) - 1
+
+    def clear(self) -> None:
+        """
+        Forgets every version, along with the copies they saved.
+        :return: Nothing.
+        """
+        self._versions.clear()
+
+    def record(self, name: str, state: AccountState) -> None:
+        """
+        Saves what an account looks like right before it's changed. Only the first change after a snapshot is saved.
+        :param name: The name of the account.
+        :param state: The account's category and attributes, or None if the statement doesn't have it yet.
+        :return: Nothing.
+        """
+        changes: dict[str:AccountState] = self._versions[-1].changes
+
+        if name not in changes:
+            changes[name] = None if state is None else (state[0], dict(state[1]))
+
+    def record_categories(self, categories: list[str]) -> None:
+        """
+        Saves the categories of the statement right before the whole statement is replaced.
+        :param categories: The categories.
+        :return: Nothing.
+        """
+        if self._versions[-1].categories is None:
+            self._versions[-1].categories = list(categories)
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """
+        Stops recording changes for the length of a with block, which is used while rolling back.
+        :return: Nothing.
+        """
+        self._paused = True
+
+        try:
+            yield
+
+        finally:
+            self._paused = False
+
+    def _check(self, version: int) -> None:
+        """
+        :param version: The number of a version.
+        :return: Nothing.
+        """
+        if not 0 <= version < len(self._versions):
+            raise KeyError("Version not found!")
+
+    def states_at(self, version: int) -> tuple[dict[str:AccountState], list[str] | None]:
+        """
+        Finds what every account changed since a version looked like in that version. An account's state in a version
+        is the first copy saved from that version on, since it hadn't changed before then.
+        :param version: The number of the version.
+        :return: The state of each changed account, in {name: state} format, and the categories of the statement in
+        that version (or None if they haven't changed since).
+        """
+        self._check(version)
+
+        states: dict[str:AccountState] = {}
+        categories: list[str] | None = None
+
+        # Going from the newest version back, so the oldest copy of each account is the one that's kept.
+        for saved in reversed(self._versions[version:]):
+            states.update(saved.changes)
+            categories = saved.categories if saved.categories is not None else categories
+
+        return states, categories
+
+    def diff(self, fs: dict[str:dict[str:dict[str:str | int | float]]], index: dict[str:str], old: int,
+             new: int | None = None) -> dict[str:dict[str:tuple[dict | None, dict | None]]]:
+        """
+        Compares two versions of a statement.
+        :param fs: The statement as it is now.
+        :param index: The statement's account index, in {name: category} format.
+        :param old: The number of the first version.
+        :param new: The number of the second version, or None for the statement as it is now.
+        :return: Every account that's different, in {category: {account: (old attributes, new attributes)}} format.
+        The attributes are None if the account doesn't exist in that version.
+        """
+        old_states: dict[str:AccountState] = self.states_at(old)[0]
+        new_states: dict[str:AccountState] = {} if new is None else self.states_at(new)[0]
+        diff: dict[str:dict[str:tuple[dict | None, dict | None]]] = {}
+
+        # Only accounts that were copied in either version can be different.
+        for name in old_states | new_states:
+            before: AccountState = self._state(name, old_states, fs, index)
+            after: AccountState = self._state(name, new_states, fs, index)
+
+            if before != after:
+                category: str = after[0] if after is not None else before[0]
+                diff.setdefault(category, {})[name] = (None if before is None else dict(before[1]),
+                                                       None if after is None else dict(after[1]))
+
+        return diff
+
+    @staticmethod
+    def _state(name: str, states: dict[str:AccountState], fs: dict[str:dict[str:dict[str:str | int | float]]],
+               index: dict[str:str]) -> AccountState:
+        """
+        :param name: The name of the account.
+        :param states: The states returned by states_at().
+        :param fs: The statement as it is now.
+        :param index: The statement's account index.
+        :return: The account's state in the version, which is its current state if it hasn't changed since.
+        """
+        if name in states:
+            return states[name]
+
+        if name in index:
+            return index[name], fs[index[name]][name]
+
+        return None
+
+    def build(self, fs: dict[str:dict[str:dict[str:str | int | float]]],
+              version: int) -> dict[str:dict[str:dict[str:str | int | float]]]:
+        """
+        Rebuilds a version of a statement. Accounts that were deleted since then are put back at the end of their
+        category.
+        :param fs: The statement as it is now.
+        :param version: The number of the version.
+        :return: A copy of the statement in that version.
+        """
+        states: dict[str:AccountState]
+        categories: list[str] | None
+        states, categories = self.states_at(version)
+        built: dict[str:dict[str:dict[str:str | int | float]]] = {}
+        placed: set[str] = set()
+
+        for category, accounts in fs.items():
+            built[category] = {}
+
+            for account, attributes in accounts.items():
+                state: AccountState = states.get(account, (category, attributes))
+
+                # Accounts that are still in the same category keep their place.
+                if state is not None and state[0] == category:
+                    built[category][account] = dict(state[1])
+
+                    if account in states:
+                        placed.add(account)
+
+        for name, state in states.items():
+            if state is not None and name not in placed:
+                built.setdefault(state[0], {})[name] = dict(state[1])
+
+        if categories is not None:
+            built = {category: built.get(category, {}) for category in categories}
+
+        return built
+
+    def truncate(self, version: int) -> None:
+        """
+        Forgets every version after the given one, and every change recorded since it. Used once the statement has
+        been rolled back to it.
+        :param version: The number of the version.
+        :return: Nothing.
+        """
+        self._check(version)
+
+        del self._versions[version + 1:]
+        self._versions[version].changes = {}
+        self._versions[version].categories = None
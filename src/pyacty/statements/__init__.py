@@ -1,3 +1,10 @@
+from .Account import *
 from .BalanceSheet import *
+from .BinarySnapshot import *
+from .ComparativeStatement import *
+from .Consolidation import *
 from .FinancialStatement import *
+from .FsStorage import *
 from .IncomeStatement import *
+from .ReportBatch import *
+from .StatementHistory import *
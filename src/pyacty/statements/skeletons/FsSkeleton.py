@@ -8,12 +8,77 @@ Considerations for this file:
 """
 
 from string import Template
-from typing import Any, Final
+from typing import Any, Final, Iterator, TextIO
+
+import numpy as np
+
+from .Layout import Layout, compile_layout
+from ...custom_exceptions import SupportError
 
 DEFAULT_INDENT_SIZE: Final[int] = 4
 
 
 class FsSkeleton:
+    class _Mappings(dict):
+        __slots__ = ("_element",)
+
+        def __init__(self, mappings: dict[str:str], element: "FsSkeleton._Element") -> None:
+            """
+            The mappings of an element. It's a dict, but it tells the element whenever it changes, so that the element's
+            cached width is never out of date.
+            :param mappings: The mappings, in {mapping: keyword} format.
+            :param element: The element the mappings belong to.
+            """
+            super().__init__(mappings)
+            self._element: FsSkeleton._Element = element
+
+        def __setitem__(self, key: str, value: str) -> None:
+            super().__setitem__(key, value)
+            self._changed()
+
+        def __delitem__(self, key: str) -> None:
+            super().__delitem__(key)
+            self._changed()
+
+        def __ior__(self, other: Any) -> "FsSkeleton._Mappings":
+            super().__ior__(other)
+            self._changed()
+
+            return self
+
+        def pop(self, key: str, *default: str) -> str:
+            value: str = super().pop(key, *default)
+            self._changed()
+
+            return value
+
+        def popitem(self) -> tuple[str, str]:
+            item: tuple[str, str] = super().popitem()
+            self._changed()
+
+            return item
+
+        def setdefault(self, key: str, default: str | None = None) -> str | None:
+            value: str | None = super().setdefault(key, default)
+            self._changed()
+
+            return value
+
+        def clear(self) -> None:
+            super().clear()
+            self._changed()
+
+        def update(self, *args, **kwargs) -> None:
+            super().update(*args, **kwargs)
+            self._changed()
+
+        def _changed(self) -> None:
+            """
+            Called by every method that changes the mappings.
+            :return: Nothing.
+            """
+            self._element._invalidate()
+
     class _Element:
         auto_mappings: list[str] = ["divider", "indent", "spacer", "left_spacer", "central_spacer", "right_spacer"]
 
@@ -28,24 +93,83 @@ class FsSkeleton:
             :param edge: If the element is an edge-piece (only applicable to dividers).
             :param mappings: A dictionary of mappings that will be used, in {mapping: keyword} format.
             """
-            self.template: Template = template
+            # The width is cached, since it takes a whole substitution to find. Anything that changes it clears the
+            # cache (see _invalidate()).
+            self._width: int | None = None
+            # The skeleton the element belongs to, which keeps track of the widest element, and the width it counted
+            # for the element. Nothing is counted while a mapping the template needs is missing.
+            self._owner: FsSkeleton | None = None
+            self._counted: int | None = None
+            self._template: Template = template
+            # The compiled template, which is shared with every other element that uses the same template.
+            self._layout: Layout = compile_layout(template)
 
             if mappings is None:
                 mappings = {}
 
-            self.mappings: dict[str:str] = mappings
-
             # Spacers shouldn't be manually controlled by the user, so this gets rid of any they may have inserted into
             # mappings.
-            for key, mapping in self.mappings.items():
-                if key in self.auto_mappings:
-                    self.mappings.pop(key)
+            self._mappings: FsSkeleton._Mappings = FsSkeleton._Mappings(
+                {key: mapping for key, mapping in mappings.items() if key not in self.auto_mappings}, self
+            )
 
-            self.indent_level: int = indent_level
-            self.indent_size: int = indent_size
+            self._indent_level: int = indent_level
+            self._indent_size: int = indent_size
             self.edge: bool = edge
 
             self._string: str = ""
+            # The width _string was rendered at, or None if the element has changed since. Elements are only rendered
+            # again when they change or the width does.
+            self._rendered_width: int | None = None
+
+        @property
+        def template(self) -> Template:
+            """
+            :return: The string template of the element.
+            """
+            return self._template
+
+        @template.setter
+        def template(self, template: Template) -> None:
+            self._template = template
+            self._layout = compile_layout(template)
+            self._invalidate()
+
+        @property
+        def mappings(self) -> dict[str:str]:
+            """
+            :return: The mappings of the element, in {mapping: keyword} format. Changing them updates the width.
+            """
+            return self._mappings
+
+        @mappings.setter
+        def mappings(self, mappings: dict[str:str]) -> None:
+            self._mappings = FsSkeleton._Mappings(mappings, self)
+            self._invalidate()
+
+        @property
+        def indent_level(self) -> int:
+            """
+            :return: How many indents this element has.
+            """
+            return self._indent_level
+
+        @indent_level.setter
+        def indent_level(self, indent_level: int) -> None:
+            self._indent_level = indent_level
+            self._invalidate()
+
+        @property
+        def indent_size(self) -> int:
+            """
+            :return: The size of the indent.
+            """
+            return self._indent_size
+
+        @indent_size.setter
+        def indent_size(self, indent_size: int) -> None:
+            self._indent_size = indent_size
+            self._invalidate()
 
         @property
         def total_indent(self) -> int:
@@ -60,33 +184,30 @@ class FsSkeleton:
 
             return result
 
-        # self.width needs to change whenever self._string does, so this allows us to calculate it when width is called.
         @property
         def width(self) -> int:
             """
-            The smallest width an element can be.
+            The smallest width an element can be, which is the element rendered without any spacers. It's only
+            calculated the first time it's needed after the element changes, and it's worked out from the lengths of the
+            mappings without rendering anything (see Layout.width()).
             :return: The length of the string.
             """
-            print(self.template.substitute(
-                self.mappings,
-                end = "",
-                divider = "",
-                indent = " " * self.total_indent,
-                spacer = "",
-                left_spacer = "",
-                central_spacer = "",
-                right_spacer = ""
-            ))
-            return len(self.template.substitute(
-                self.mappings,
-                end = "",
-                divider = "",
-                indent = " " * self.total_indent,
-                spacer = "",
-                left_spacer = "",
-                central_spacer = "",
-                right_spacer = ""
-            ))
+            if self._width is None:
+                self._width = self._layout.width(self.mappings, self.total_indent)
+
+            return self._width
+
+        def _invalidate(self) -> None:
+            """
+            Clears the cached width. If the element belongs to a skeleton, the new width is calculated right away so
+            that the skeleton's widest element stays up to date.
+            :return: Nothing.
+            """
+            self._rendered_width = None
+            self._width = None
+
+            if self._owner is not None:
+                self._owner._recount(self)
 
         def render(self, min_width: int) -> str:
             """
@@ -94,35 +215,25 @@ class FsSkeleton:
             :param min_width: The minimum width of the template to render.
             :return: The finished line result.
             """
-            width_diff: int = max(min_width - self.width, 0)
-
-            # Some elements are centered, so we need the space on either side to be equal while still being the proper
-            # width. In the case where the resulting space needed is an odd number, it'll put more space on the right
-            # side than the left, which tends to look better.
-            if width_diff % 2 == 0:
-                left_space: int = width_diff // 2
-                right_space: int = left_space
-
-            else:
-                left_space: int = int(width_diff / 2 - 0.5)
-                right_space: int = int(width_diff / 2 + 0.5)
-
-            div_end_char = "+" if self.edge else "|"
-
-            # Subtracting 2 from min_width accounts for the border.
-            self._string = self.template.substitute(
-                self.mappings,
-                end = div_end_char,
-                divider = "-" * (min_width - 2),
-                indent = " " * self.total_indent,
-                spacer = " " * width_diff,
-                left_spacer = " " * left_space,
-                central_spacer = "·" * width_diff,
-                right_spacer = " " * right_space
-            )
+            if self._rendered_width != min_width:
+                self._string = self._layout.render(self.mappings, self.width, min_width, self.total_indent, self.edge)
+                self._rendered_width = min_width
 
             return self._string
 
+    # The pre-made templates every instance starts with. Adding a template here adds it to every instance created
+    # afterward.
+    TEMPLATES: dict[str:Template] = {
+        "account": Template("| $indent$account_name$central_spacer$account_bal |"),
+        "columns": Template("| $spacer$column_names |"),
+        "divider": Template("$end$divider$end"),
+        "header": Template("|$left_spacer$header_name$right_spacer|"),
+        "spacer": Template("|$spacer|"),
+        "subtotal": Template("| $indent$subtotal_name$central_spacer$subtotal_bal |"),
+        "title": Template("| $title$spacer|"),
+        "total": Template("| Total $total_name$spacer$total_bal |")
+    }
+
     # Not sure if this should be final or not.
     MONTHS: Final[dict[str:str]] = {
         "01": "January",
@@ -141,7 +252,7 @@ class FsSkeleton:
 
     def __init__(self, fn_stmt: dict[str:dict[str:dict[str:Any]]], company: str, fs_name: str, date: str,
                  min_width: int = 75, margin: int = 2, indent_size: int = DEFAULT_INDENT_SIZE, column_space: int = 20,
-                 decimals: bool = True) -> None:
+                 decimals: bool = True, columns: list[str] | None = None) -> None:
         """
         A class that helps format the output of a financial statement in the console.
         :param fn_stmt: The financial statement to format.
@@ -153,6 +264,8 @@ class FsSkeleton:
         :param indent_size: How many spaces each indent is.
         :param column_space: I forgot lol.
         :param decimals: If numbers on the financial statement display decimals.
+        :param columns: The heading of each column, for statements with more than one balance per account (see
+        ComparativeStatement). Each balance in fn_stmt is then a sequence with one balance per column.
         """
         self.fn_stmt: dict[str:dict[str:dict[str:Any]]] = fn_stmt
         self.company: str = company
@@ -165,20 +278,44 @@ class FsSkeleton:
         # What is self.column_space for???
         self.column_space: int = column_space
         self.decimals: str = ",.2f" if decimals else ",.0f"
+        self.columns: list[str] | None = columns
+        # How much space is between columns.
+        self.column_gap: int = 2
+
+        # The templates are copied from TEMPLATES by value, so a template added to a single instance stays there, while
+        # every instance shares the same Template objects (and the same compiled layouts) for the pre-made ones.
+        self.templates: dict[str:Template] = dict(self.TEMPLATES)
+        # How many elements there are of each width, in {width: count} format, and the widest of them. They're kept up
+        # to date as elements are added, deleted, and changed, so finding the widest element never means looking at
+        # every element.
+        self._width_counts: dict[int:int] = {}
+        self._widest: int = 0
+        self._elements: dict[str:FsSkeleton._Element] = {}
 
-        # Should there be a class attribute for templates which is then passed into self.templates by value? That way
-        # one can choose to add a template to all instances or just a single instance easily. I'm not sure if this is a
-        # good practice or not, however.
-        self.templates: dict[str:Template] = {
-            "account": Template("| $indent$account_name$central_spacer$account_bal |"),
-            "divider": Template("$end$divider$end"),
-            "header": Template("|$left_spacer$header_name$right_spacer|"),
-            "spacer": Template("|$spacer|"),
-            "subtotal": Template("| $indent$subtotal_name$central_spacer$subtotal_bal |"),
-            "title": Template("| $title$spacer|"),
-            "total": Template("| Total $total_name$spacer$total_bal |")
-        }
-        self.elements: dict[str:FsSkeleton._Element] = {}
+    @property
+    def elements(self) -> dict[str:_Element]:
+        """
+        Elements should be added and deleted with add_element() and del_element(), which keep min_width up to date.
+        :return: Every element, in {key: element} format.
+        """
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: dict[str:_Element]) -> None:
+        """
+        Replaces every element and recounts their widths.
+        :param elements: The new elements, in {key: element} format.
+        :return: Nothing.
+        """
+        for element in self._elements.values():
+            self._detach(element)
+
+        self._elements = elements
+        self._width_counts = {}
+        self._widest = 0
+
+        for element in elements.values():
+            self._attach(element)
 
     @property
     def min_width(self) -> int:
@@ -186,12 +323,7 @@ class FsSkeleton:
         Finds and returns the minimum width that the output can be.
         :return: The longest string in self.elements.
         """
-        longest_str_len: int = 0
-
-        for key, element in self.elements.items():
-            longest_str_len = max(longest_str_len, element.width)
-
-        return longest_str_len
+        return self._widest
 
     @min_width.setter
     def min_width(self, width: int) -> None:
@@ -204,6 +336,128 @@ class FsSkeleton:
         """
         self._min_width = width
 
+    def _count_width(self, width: int, change: int) -> None:
+        """
+        Adds an element's width to the running maximum, or takes it back out.
+        :param width: The width of the element.
+        :param change: 1 if the element was added, -1 if it was taken out.
+        :return: Nothing.
+        """
+        count: int = self._width_counts.get(width, 0) + change
+
+        if count:
+            self._width_counts[width] = count
+
+        else:
+            self._width_counts.pop(width, None)
+
+        if change > 0:
+            self._widest = max(self._widest, width)
+
+        # There are only ever a few dozen different widths, so this is still cheap when the widest element goes away.
+        elif width == self._widest and not count:
+            self._widest = max(self._width_counts, default=0)
+
+    def _attach(self, element: _Element) -> None:
+        """
+        Makes an element report its width changes to this skeleton.
+        :param element: The element.
+        :return: Nothing.
+        """
+        element._owner = self
+        self._recount(element)
+
+    def _detach(self, element: _Element) -> None:
+        """
+        Takes an element's width back out of this skeleton and stops it from reporting its width changes.
+        :param element: The element.
+        :return: Nothing.
+        """
+        if element._counted is not None:
+            self._count_width(element._counted, -1)
+
+        element._owner = None
+        element._counted = None
+
+    def _recount(self, element: _Element) -> None:
+        """
+        Replaces the width counted for an element with its current width.
+        :param element: The element.
+        :return: Nothing.
+        """
+        if element._counted is not None:
+            self._count_width(element._counted, -1)
+            element._counted = None
+
+        try:
+            width: int = element.width
+
+        except KeyError:
+            # A mapping is missing, so the element's width is only counted once it's put back.
+            return
+
+        element._counted = width
+        self._count_width(width, 1)
+
+    def _column_widths(self) -> list[int]:
+        """
+        Finds how wide each column has to be to fit its heading, every balance, and every total.
+        :return: The width of each column.
+        """
+        widths: list[int] = [len(heading) for heading in self.columns]
+
+        for accounts in self.fn_stmt.values():
+            if not accounts:
+                continue
+
+            balances: np.ndarray = np.array([attributes["bal"] for attributes in accounts.values()], dtype=np.float64)
+            signs: np.ndarray = np.array([1.0 if attributes["d/c"] == "debit" else -1.0
+                                          for attributes in accounts.values()])
+            total: np.ndarray = np.abs(signs @ balances)
+
+            # The longest number in a column is either its largest or its most negative.
+            for column, values in enumerate(zip(balances.max(axis=0), balances.min(axis=0), total)):
+                widths[column] = max(widths[column], *(len(f"{value:{self.decimals}}") for value in values))
+
+        return widths
+
+    def _format_balance(self, balance: float | np.ndarray, widths: list[int] | None) -> str:
+        """
+        Formats a balance, or a balance for each column.
+        :param balance: The balance(s).
+        :param widths: The width of each column, or None if there's only one balance.
+        :return: The formatted balance(s).
+        """
+        if widths is None:
+            return f"{balance:{self.decimals}}"
+
+        # Categories without any accounts have a total of 0.0 instead of an array.
+        balances: np.ndarray = np.broadcast_to(balance, (len(widths),))
+
+        return (" " * self.column_gap).join(f"{value:>{width}{self.decimals}}"
+                                            for value, width in zip(balances, widths))
+
+    def _category_total(self, accounts: dict[str:dict[str:Any]], widths: list[int] | None) -> str:
+        """
+        Adds up a category, where debits are added and credits are subtracted.
+        :param accounts: The accounts of the category.
+        :param widths: The width of each column, or None if there's only one balance.
+        :return: The formatted total.
+        """
+        total_bal: float | int | np.ndarray = 0.0
+
+        for attributes in accounts.values():
+            # With more than one column, each balance is an array, so the totals of every column are added at once.
+            balance: float | int | np.ndarray = attributes["bal"] if widths is None else np.asarray(attributes["bal"])
+
+            if attributes["d/c"] == "debit":
+                total_bal += balance
+
+            else:
+                total_bal -= balance
+
+        return self._format_balance(abs(total_bal), widths)
+
     def _format_date(self, date: str) -> str:
         """
         Converts a date from MM/DD/YYYY format to the conventional one found commonly on most financial statements.
@@ -213,81 +467,182 @@ class FsSkeleton:
         split_date: list[str] = date.split("/")
         return f"For year ended {self.MONTHS[split_date[0]]} {split_date[1]}, {split_date[2]}"
 
+    def lines(self) -> Iterator[str]:
+        """
+        Renders the added elements one at a time, without a newline at the end of each.
+        :return: The line of each element.
+        """
+        for element in self.elements.values():
+            yield element.render(self._min_width)
+
     def render(self, print_output: bool = False) -> str:
         """
         Renders all added elements.
         :param print_output: If the output should display in console.
         :return: A list of strings of each element.
         """
-        output: str = ""
+        output: list[str] = []
 
-        for key, element in self.elements.items():
-            output += element.render(self._min_width)
+        # Each element is only rendered once, even when it's printed too.
+        for line in self.lines():
+            output.append(line)
 
             if print_output:
-                print(element.render(self._min_width))
+                print(line)
 
-        return output
+        return "".join(output)
 
-    def auto_render(self, print_output: bool = False) -> str:
+    def write(self, stream: TextIO) -> None:
         """
-        Unlike the render() method, this generates an output automatically based on self.fn_stmt.
-        :param print_output: If the output should display in console.
-        :return: A list of strings of each element.
+        Renders all added elements straight to a text stream (a file, a socket, sys.stdout, etc.), a line at a time, so
+        the whole output is never held in memory as a single string.
+        :param stream: The stream to write to.
+        :return: Nothing.
+        """
+        stream.writelines(f"{line}\n" for line in self.lines())
+
+    def _auto_elements(self) -> Iterator[tuple[str, _Element]]:
+        """
+        Generates the elements of self.fn_stmt in order, one at a time. None of them are added to the skeleton.
+        :return: The key and the element of each line.
         """
-        output: str = ""
-        # Temporarily stores elements that have been manually added so that they can be restored at the end of the
-        # method.
-        auto_elements: dict[str:FsSkeleton._Element] = self.elements
+        def element(template_name: str, indent_level: int = 0, edge: bool = False,
+                    **mappings: str) -> FsSkeleton._Element:
+            """
+            :param template_name: The name of the template.
+            :param indent_level: The indent level of the element.
+            :param edge: If the element is an edge-piece.
+            :param mappings: The mappings of the element.
+            :return: The element.
+            """
+            return self._Element(self.templates[template_name], indent_level, DEFAULT_INDENT_SIZE, edge, mappings)
 
         # Header Elements
-        self.add_element(self.templates["divider"], "div_top", edge = True)
-        self.add_element(self.templates["header"], "header_company", header_name = self.company)
-        self.add_element(self.templates["divider"], "div_1")
-        self.add_element(self.templates["header"], "header_fs_name", header_name = self.fs_name)
-        self.add_element(self.templates["divider"], "div_2")
-        self.add_element(self.templates["header"], "header_date", header_name = self.f_date)
-        self.add_element(self.templates["divider"], "div_3")
+        yield "div_top", element("divider", edge = True)
+        yield "header_company", element("header", header_name = self.company)
+        yield "div_1", element("divider")
+        yield "header_fs_name", element("header", header_name = self.fs_name)
+        yield "div_2", element("divider")
+        yield "header_date", element("header", header_name = self.f_date)
+
+        # Dividers are only added between categories, and the bottom edge replaces the one that would come after the
+        # last category. Without any categories, that's the one under the header.
+        if self.fn_stmt:
+            yield "div_3", element("divider")
+
+        widths: list[int] | None = None
+
+        if self.columns is not None:
+            widths = self._column_widths()
+            column_names: str = (" " * self.column_gap).join(f"{heading:>{width}}" for heading, width
+                                                             in zip(self.columns, widths))
+            yield "columns", element("columns", column_names = column_names)
 
         num_of_divs: int = 3
         # Body Elements
-        for category, accounts in self.fn_stmt.items():
-            self.add_element(self.templates["title"], f"title_{category.lower()}",
-                             title = category.lower().capitalize())
+        for position, (category, accounts) in enumerate(self.fn_stmt.items()):
+            if position > 0:
+                num_of_divs += 1
+                yield f"div_{num_of_divs}", element("divider")
 
-            total_bal: float | int = 0.0
+            yield f"title_{category.lower()}", element("title", title = category.lower().capitalize())
 
             for account, attributes in accounts.items():
-                if attributes["d/c"] == "debit":
-                    total_bal += attributes["bal"]
+                yield f"account_{account.lower()}", element("account", indent_level = 1, account_name = account,
+                                                            account_bal = self._format_balance(attributes["bal"],
+                                                                                               widths))
 
-                else:
-                    total_bal -= attributes["bal"]
+            yield f"total_{category.lower()}", element("total", total_name = category.lower().capitalize(),
+                                                       total_bal = self._category_total(accounts, widths))
 
-                self.add_element(self.templates["account"], f"account_{account.lower()}",
-                                 account_name = account, account_bal = f"{attributes["bal"]:{self.decimals}}",
-                                 indent_level = 1)
+        yield "div_bottom", element("divider", edge = True)
 
-            self.add_element(self.templates["total"], f"total_{category.lower()}",
-                             total_name = category.lower().capitalize(),
-                             total_bal = f"{abs(total_bal):{self.decimals}}")
-            num_of_divs += 1
-            self.add_element(self.templates["divider"], f"div_{num_of_divs}")
+    def auto_lines(self) -> Iterator[str]:
+        """
+        Like lines(), except the elements of self.fn_stmt are generated and rendered one at a time after the added
+        elements. They aren't added to the skeleton, so memory use doesn't grow with the size of the statement.
+        :return: The line of each element.
+        """
+        yield from self.lines()
 
+        for _, element in self._auto_elements():
+            yield element.render(self._min_width)
 
-        else:
-            self.del_element(f"div_{num_of_divs}")
-            self.add_element(self.templates["divider"], "div_bottom", edge = True)
+    def auto_write(self, stream: TextIO) -> None:
+        """
+        Like write(), except it writes the output of auto_render() without adding any elements (see auto_lines()).
+        :param stream: The stream to write to.
+        :return: Nothing.
+        """
+        stream.writelines(f"{line}\n" for line in self.auto_lines())
 
+    def auto_build(self) -> None:
+        """
+        Adds the elements of self.fn_stmt to the skeleton without rendering them. After that, update_accounts() keeps
+        them up to date as balances change, and render() or lines() only renders the lines that changed.
+        :return: Nothing.
+        """
+        for key, element in self._auto_elements():
+            self._insert(key, element)
+
+    def update_accounts(self, accounts: dict[str:str]) -> None:
+        """
+        Updates the elements of accounts whose balances have changed since auto_build(), along with the totals of their
+        categories. Only elements whose text actually changed have to be rendered again. Accounts that were added or
+        deleted since then need a new skeleton instead.
+        :param accounts: The accounts that changed, in {account: category} format.
+        :return: Nothing.
+        """
+        # Column widths depend on every balance, so a single change can change every line.
+        if self.columns is not None:
+            raise SupportError("Skeletons with columns can't be updated one account at a time.")
+
+        for account, category in accounts.items():
+            self._update_mapping(f"account_{account.lower()}", "account_bal",
+                                 self._format_balance(self.fn_stmt[category][account]["bal"], None))
 
-        for key, element in auto_elements.items():
-            output += element.render(self._min_width) + "\n"
+        # Each category is only added up once, no matter how many of its accounts changed.
+        for category in set(accounts.values()):
+            self._update_mapping(f"total_{category.lower()}", "total_bal",
+                                 self._category_total(self.fn_stmt[category], None))
+
+    def _update_mapping(self, key: str, mapping: str, keyword: str) -> None:
+        """
+        Changes a mapping of an element, unless it's already the same.
+        :param key: The key of the element.
+        :param mapping: The mapping.
+        :param keyword: The new keyword.
+        :return: Nothing.
+        """
+        mappings: dict[str:str] = self.elements[key].mappings
+
+        if mappings.get(mapping) != keyword:
+            mappings[mapping] = keyword
+
+    def auto_render(self, print_output: bool = False) -> str:
+        """
+        Unlike the render() method, this generates an output automatically based on self.fn_stmt. The generated elements
+        are added to the skeleton after any elements that were already added.
+        :param print_output: If the output should display in console.
+        :return: A list of strings of each element.
+        """
+        output: list[str] = []
+
+        for line in self.lines():
+            output.append(f"{line}\n")
 
             if print_output:
-                print(element.render(self._min_width))
+                print(line)
 
-        self.elements = auto_elements
-        return output
+        for key, element in self._auto_elements():
+            self._insert(key, element)
+            line: str = element.render(self._min_width)
+            output.append(f"{line}\n")
+
+            if print_output:
+                print(line)
+
+        return "".join(output)
 
     def add_element(self, template: Template | str, key: str, indent_level: int = 0,
                     indent_size: int = DEFAULT_INDENT_SIZE, edge: bool = False, **kwargs) -> None:
@@ -315,12 +670,21 @@ class FsSkeleton:
 
         # By storing the template used and the elements to substitute, we can perform the substitution later after all
         # elements are added. This allows us to dynamically update the width of the output as new elements are added.
-        new_element: FsSkeleton._Element = self._Element(template, indent_level, indent_size, edge)
+        self._insert(key, self._Element(template, indent_level, indent_size, edge, kwargs))
 
-        for mapping, keyword in kwargs.items():
-            new_element.mappings[mapping] = keyword
+    def _insert(self, key: str, element: _Element) -> None:
+        """
+        Adds an element to the end of the skeleton.
+        :param key: A unique key to identify the element.
+        :param element: The element.
+        :return: Nothing.
+        """
+        # Keys need to be unique so that we can delete them later, if needed.
+        if key in self.elements:
+            raise ValueError
 
-        self.elements[key] = new_element
+        self.elements[key] = element
+        self._attach(element)
 
     def del_element(self, key: str) -> None:
         """
@@ -331,7 +695,7 @@ class FsSkeleton:
         if key not in self.elements:
             raise KeyError
 
-        self.elements.pop(key)
+        self._detach(self.elements.pop(key))
 
     def add_template(self, template_name: str, template: Template | str) -> None:
         """
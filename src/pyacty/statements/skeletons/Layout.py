@@ -0,0 +1,153 @@
+"""
+Layout.py
+
+A Layout is a string.Template compiled once into a format string with a fixed slot for each placeholder, so rendering
+a line is a single str.format_map() call instead of a regex substitution. The width of a line is worked out from the
+lengths of its mappings without rendering it at all, and the spacers, dot leaders, and dividers are cut from strings
+that are built once and shared by every line of the same width.
+
+Layouts are cached by their template (see compile_layout()), so every FsSkeleton, and every element in it, that uses the
+same template shares the same layout.
+"""
+
+from functools import cache
+from string import Template
+from typing import Callable
+
+
+@cache
+def fill(character: str, count: int) -> str:
+    """
+    Repeats a character, like the padding, dot leaders, and dividers of a line. Each one is only ever built once.
+    :param character: The character to repeat.
+    :param count: How many times to repeat it. Anything less than 1 is an empty string.
+    :return: The repeated character.
+    """
+    return character * count
+
+
+# How FsSkeleton fills in each of the placeholders it controls, from (width_diff, min_width, total_indent, edge), where
+# width_diff is how much narrower the line is than min_width. Every other placeholder comes from an element's mappings.
+# Centered elements put the extra space on the right when it can't be split evenly, and subtracting 2 from min_width
+# accounts for the border.
+AUTO_SLOTS: dict[str:Callable[[int, int, int, bool], str]] = {
+    "end": lambda width_diff, min_width, total_indent, edge: "+" if edge else "|",
+    "divider": lambda width_diff, min_width, total_indent, edge: fill("-", min_width - 2),
+    "indent": lambda width_diff, min_width, total_indent, edge: fill(" ", total_indent),
+    "spacer": lambda width_diff, min_width, total_indent, edge: fill(" ", width_diff),
+    "left_spacer": lambda width_diff, min_width, total_indent, edge: fill(" ", width_diff // 2),
+    "central_spacer": lambda width_diff, min_width, total_indent, edge: fill("·", width_diff),
+    "right_spacer": lambda width_diff, min_width, total_indent, edge: fill(" ", width_diff - width_diff // 2)
+}
+
+# Every compiled layout, in {(template type, template string): layout} format.
+_LAYOUTS: dict[tuple[type, str]:"Layout"] = {}
+
+
+class Layout:
+    # Dunders
+    def __init__(self, template: Template) -> None:
+        """
+        Compiles a template. Use compile_layout() instead, which only compiles each template once.
+        :param template: The template.
+        """
+        self.template: Template = template
+
+        pieces: list[str] = []
+        slots: list[str] = []
+        # The length of everything in the template that isn't a placeholder.
+        static_width: int = 0
+        position: int = 0
+
+        for match in template.pattern.finditer(template.template):
+            literal: str = template.template[position:match.start()]
+            position = match.end()
+            name: str | None = match.group("named") or match.group("braced")
+
+            if match.group("escaped") is not None:
+                literal += template.delimiter
+
+            elif name is None:
+                # string.Template raises a ValueError too, although only once it's substituted.
+                raise ValueError(f"Invalid placeholder in template: {template.template!r}")
+
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            static_width += len(literal)
+
+            if name is not None:
+                pieces.append(f"{{{name}}}")
+                slots.append(name)
+
+        literal = template.template[position:]
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        static_width += len(literal)
+
+        self._format: str = "".join(pieces)
+        self._static_width: int = static_width
+        # Each placeholder the element's mappings fill in, once for every time it appears in the template.
+        self._mapped_slots: tuple[str, ...] = tuple(slot for slot in slots if slot not in AUTO_SLOTS)
+        self._indents: int = slots.count("indent")
+        self._auto_slots: tuple[str, ...] = tuple(slot for slot in AUTO_SLOTS if slot in slots)
+        # Lines without any mapped placeholders (like dividers) are the same for every element of the same width, so
+        # they're cached in {(min_width, total_indent, edge): line} format.
+        self._lines: dict[tuple[int, int, bool]:str] | None = None if self._mapped_slots else {}
+
+    # Methods
+    def width(self, mappings: dict[str:str], total_indent: int) -> int:
+        """
+        Finds the smallest width a line can be, which is the line without any spacers.
+        :param mappings: The element's mappings.
+        :param total_indent: The number of spaces in the indent.
+        :return: The width.
+        """
+        return (self._static_width + self._indents * total_indent +
+                sum(len(str(mappings[slot])) for slot in self._mapped_slots))
+
+    def render(self, mappings: dict[str:str], width: int, min_width: int, total_indent: int, edge: bool) -> str:
+        """
+        Renders a line.
+        :param mappings: The element's mappings.
+        :param width: The smallest width of the line (see width()).
+        :param min_width: The width to pad the line to.
+        :param total_indent: The number of spaces in the indent.
+        :param edge: If the element is an edge-piece (only applicable to dividers).
+        :return: The line.
+        """
+        if self._lines is not None:
+            line: str | None = self._lines.get((min_width, total_indent, edge))
+
+            if line is not None:
+                return line
+
+        values: dict[str:str] = dict(mappings)
+        width_diff: int = max(min_width - width, 0)
+
+        # Only the placeholders the template actually has are filled in.
+        for slot in self._auto_slots:
+            values[slot] = AUTO_SLOTS[slot](width_diff, min_width, total_indent, edge)
+
+        line = self._format.format_map(values)
+
+        if self._lines is not None:
+            self._lines[(min_width, total_indent, edge)] = line
+
+        return line
+
+
+def compile_layout(template: Template | str) -> Layout:
+    """
+    Compiles a template into a layout, or returns the layout it was already compiled into. Templates are compared by
+    their type and their string, so two Template objects made from the same string share a layout.
+    :param template: The template, or a template string.
+    :return: The layout.
+    """
+    if type(template) is str:
+        template = Template(template)
+
+    key: tuple[type, str] = (type(template), template.template)
+    layout: Layout | None = _LAYOUTS.get(key)
+
+    if layout is None:
+        layout = _LAYOUTS[key] = Layout(template)
+
+    return layout
@@ -1,2 +1,3 @@
 # This is a separate folder because more skeletons will be added in the future. I'm just too lazy to make them now.
 from .FsSkeleton import *
+from .Layout import *
@@ -0,0 +1,115 @@
+"""
+storage.py
+
+Writes files atomically. Every file is written to a temporary file in the same directory first and then renamed over the
+real one, which the operating system does in a single step. A crash or an error halfway through never leaves a
+half-written file behind, and anything reading the file sees either the old version or the new one.
+
+It's shared by everything that saves files, like financial statements (see statements/FsStorage.py) and asset schedules
+(see assets/ScheduleExport.py).
+"""
+
+from contextlib import contextmanager
+import gzip
+import io
+import os
+import secrets
+import stat
+import tempfile
+from typing import BinaryIO, Iterator, TextIO
+
+# How the temporary files are opened. O_EXCL makes sure an existing file is never reused, and O_BINARY stops Windows
+# from translating newlines (open() takes care of that for text files).
+_TEMP_FLAGS: int = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp(path: str, directory: str) -> tuple[int, str]:
+    """
+    Creates the temporary file a save is written to, in the same directory as the real one. Unlike tempfile.mkstemp(),
+    which creates files that only the owner can read, the file gets the same permissions open() would give a new file,
+    since the operating system applies the umask when it's created.
+    :param path: The path of the real file.
+    :param directory: The directory the real file is in.
+    :return: The handle and the path of the temporary file.
+    """
+    for _ in range(tempfile.TMP_MAX):
+        temp_path: str = os.path.join(directory, f".{os.path.basename(path)}.{secrets.token_hex(4)}.tmp")
+
+        try:
+            return os.open(temp_path, _TEMP_FLAGS, 0o666), temp_path
+
+        except FileExistsError:
+            continue
+
+    raise FileExistsError(f"No usable temporary file name was found for {path!r}.")
+
+
+def _sync(outfile: io.IOBase) -> None:
+    """
+    Makes sure everything written to a file is actually on the disk before it's renamed.
+    :param outfile: The file.
+    :return: Nothing.
+    """
+    outfile.flush()
+    os.fsync(outfile.fileno())
+
+
+@contextmanager
+def atomic_open(path: str, compress: bool = False, binary: bool = False) -> Iterator[TextIO | BinaryIO]:
+    """
+    Opens a temporary file to write to, which replaces the file at path once the with block finishes. If the with block
+    raises an exception, the temporary file is deleted and the file at path isn't touched. Every missing directory in
+    the path is created.
+    :param path: The path of the file.
+    :param compress: If True, the file is compressed with gzip. Binary files can't be compressed.
+    :param binary: If True, the file is opened for writing bytes instead of text.
+    :return: The temporary file.
+    """
+    if compress and binary:
+        raise ValueError("Binary files can't be compressed.")
+
+    directory: str = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    handle: int
+    temp_path: str
+    handle, temp_path = _create_temp(path, directory)
+
+    try:
+        if compress:
+            with open(handle, "wb") as raw:
+                # The real file name is stored in the gzip header, not the temporary one.
+                with io.TextIOWrapper(gzip.GzipFile(os.path.basename(path), "wb", fileobj=raw), encoding="utf-8",
+                                      newline="") as outfile:
+                    yield outfile
+
+                # The gzip file doesn't close the file it was given, which still needs to be synced.
+                _sync(raw)
+
+        elif binary:
+            with open(handle, "wb") as outfile:
+                yield outfile
+                _sync(outfile)
+
+        else:
+            with open(handle, "w", encoding="utf-8", newline="") as outfile:
+                yield outfile
+                _sync(outfile)
+
+        # A file that's being replaced keeps its permissions.
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+
+        except FileNotFoundError:
+            pass
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        try:
+            os.remove(temp_path)
+
+        except FileNotFoundError:
+            pass
+
+        raise
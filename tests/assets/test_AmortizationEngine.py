@@ -0,0 +1,82 @@
+"""
+test_AmortizationEngine.py
+
+Like test_DepreciationEngine.py, these build the same register as IntangibleAsset objects and as an engine, and make
+sure both give exactly the same numbers.
+"""
+
+import random
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.assets.AmortizationEngine import AmortizationEngine
+from src.pyacty.assets.IntangibleAsset import IntangibleAsset
+from src.pyacty.fundamentals.MoneyArray import MoneyArray
+
+
+class TestAmortizationEngine(ut.TestCase):
+    def test_matches_amortize(self) -> None:
+        generator: random.Random = random.Random(0)
+        assets: list[IntangibleAsset] = []
+        options: list[dict[str:int | float]] = []
+
+        for i in range(300):
+            value: float = round(generator.uniform(1_000, 500_000), 2)
+            assets.append(IntangibleAsset(f"Asset {i}", generator.choice([12, 60, 120, 360]), value))
+            options.append({
+                "method": generator.choice([0, 1, 2, 3, 4, 5]),
+                "decline": generator.choice([1.0, 2.0]),
+                "rate": generator.choice([0.0, 0.03, 0.075]),
+                "balloon": round(value * generator.choice([0, 0.25]), 2),
+                "payment": round(value * generator.choice([0.001, 0.01]), 2)
+            })
+
+        engine: AmortizationEngine = AmortizationEngine.from_assets(
+            assets, *[[option[name] for option in options] for name in ["method", "decline", "rate", "balloon",
+                                                                          "payment"]]
+        )
+        # 31 years covers the longest life in the register, plus an extra year for fully amortized assets.
+        schedule: MoneyArray = engine.schedule(31 * 12, periods=1)
+
+        for row, asset in enumerate(assets):
+            expected: list[float] = [asset.amortize(periods=1, **options[row]).value for _ in range(31 * 12)]
+
+            self.assertEqual(schedule.value[row].tolist(), expected)
+            self.assertEqual(engine.total_amort[row], asset.total_amort.value)
+            self.assertEqual(engine.rem_life[row], asset.rem_life)
+
+    def test_methods(self) -> None:
+        engine: AmortizationEngine = AmortizationEngine([300_000, 1_000, 1_000, 1_000], [360, 60, 60, 24],
+                                                        [2, 3, 4, 5], rate=[0.06, 0, 0, 0.12], balloon=400, payment=5)
+
+        # A 30-year, 6% annuity pays $1,798.65 a month, and $1,500 of the first payment is interest.
+        annuity: MoneyArray = engine.schedule(periods=1)[0]
+
+        self.assertEqual(annuity[0], 298.65)
+        self.assertEqual(annuity.sum(), 300_000)
+
+        engine.reset()
+        yearly: MoneyArray = engine.schedule(5)
+
+        # Bullet
+        self.assertEqual(yearly.value[1].tolist(), [0, 0, 0, 0, 1_000])
+        # Balloon
+        self.assertEqual(yearly.value[2].tolist(), [120, 120, 120, 120, 520])
+        # Negative amortization, where $5 a month doesn't cover 1% interest on $1,000.
+        self.assertTrue(np.all(yearly.value[3] < 0))
+        self.assertTrue(engine.net_value[3] > 1_000)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            AmortizationEngine([100], [12], 6)
+
+        with self.assertRaises(ZeroDivisionError):
+            AmortizationEngine([100], [0], 0).amortize()
+
+        # The Bullet Method never divides by the life.
+        self.assertEqual(AmortizationEngine([100], [0], 3).amortize().value.tolist(), [100])
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,165 @@
+"""
+test_AssetRegister.py
+"""
+
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.assets.AssetRegister import AssetRegister, IntangibleAssetView, TangibleAssetView
+from src.pyacty.assets.IntangibleAsset import IntangibleAsset
+from src.pyacty.assets.TangibleAsset import TangibleAsset
+from src.pyacty.fundamentals.Money import Money
+
+
+class TestAssetRegister(ut.TestCase):
+    def test_views(self) -> None:
+        register: AssetRegister = AssetRegister(capacity=1)
+        register.add_tangible("Truck", 10 * 12, 100_000, 10_000)
+        register.add_intangible("Patent", 5 * 12, 50_000)
+
+        truck: TangibleAssetView = register["Truck"]
+        patent: IntangibleAssetView = register[-1]
+
+        self.assertIsInstance(truck, TangibleAsset)
+        self.assertIsInstance(patent, IntangibleAsset)
+        self.assertEqual(truck.depreciable_allocation, 90_000)
+        self.assertEqual(truck.syd, 55)
+
+        # Everything a view does is written straight into the register's arrays.
+        self.assertEqual(truck.depreciate(0), 9_000)
+        self.assertEqual(patent.amortize(0), 10_000)
+        self.assertEqual(register.total_depr.tolist(), [9_000, 0])
+        self.assertEqual(register.total_amort.tolist(), [0, 10_000])
+        self.assertEqual(register.rem_life[0], 108)
+        self.assertEqual(register["Truck"].net_value, 91_000)
+
+        truck.value = 120_000
+        truck.life = 20 * 12
+
+        self.assertEqual(register.value[0], 120_000)
+        self.assertEqual(register.rem_life[0], 228)
+
+        truck.reset()
+        patent.reset()
+
+        self.assertEqual(register.total_depr.tolist(), [0, 0])
+        self.assertEqual(register.total_amort.tolist(), [0, 0])
+        self.assertEqual(register.value[0], 100_000)
+        self.assertEqual(register.life[0], 120)
+
+    def test_matches_objects(self) -> None:
+        assets: list[TangibleAsset] = [TangibleAsset(f"Asset {i}", (i % 10 + 1) * 12, 1_000 * (i + 1), 10 * i, 500)
+                                       for i in range(100)]
+        register: AssetRegister = AssetRegister.from_assets(assets)
+
+        self.assertEqual(len(register), 100)
+
+        for _ in range(3):
+            for method, (asset, view) in enumerate(zip(assets, register)):
+                self.assertEqual(view.depreciate(method % 4, units_prod=50).value,
+                                 asset.depreciate(method % 4, units_prod=50).value)
+
+        self.assertEqual(register.total_depr.tolist(), [asset.total_depr.value for asset in assets])
+        self.assertEqual(list(register[7].schedule(2)), list(assets[7].schedule(2)))
+
+    def test_add_existing(self) -> None:
+        asset: TangibleAsset = TangibleAsset("Truck", 10 * 12, 100_000, 10_000, 1_000)
+        asset.depreciate(0)
+        register: AssetRegister = AssetRegister()
+        register.add(asset)
+
+        self.assertEqual(register["Truck"].total_depr, 9_000)
+        self.assertEqual(register["Truck"].rem_life, 108)
+
+        # The register keeps the asset's original state for reset().
+        register.reset()
+
+        self.assertEqual(register["Truck"].total_depr, 0)
+        self.assertEqual(register["Truck"].rem_life, 120)
+        self.assertEqual(register["Truck"].prod_cap, 1_000)
+
+    def test_columns(self) -> None:
+        register: AssetRegister = AssetRegister()
+
+        for i in range(1_000):
+            register.add_tangible(f"Asset {i}", 12, i)
+
+        # The columns can be changed in bulk.
+        register.value[:] *= 2
+
+        self.assertTrue(np.array_equal(register.value, np.arange(1_000) * 2))
+        self.assertEqual(register[999].value, 1_998)
+        self.assertLess(register.nbytes / len(register), 200)
+
+    def test_close(self) -> None:
+        register: AssetRegister = AssetRegister()
+
+        for i in range(200):
+            if i % 4 == 0:
+                register.add_intangible(f"Asset {i}", (i % 7 + 1) * 12, 1_000 * (i + 1))
+
+            else:
+                register.add_tangible(f"Asset {i}", (i % 10 + 1) * 12, 1_000 * (i + 1), 10 * i, 500)
+
+        expected: AssetRegister = AssetRegister.from_assets(register)
+        methods: np.ndarray = np.arange(200) % 4
+
+        # Closing the register should be the same as calling depreciate() or amortize() on every asset.
+        for _ in range(12):
+            expenses, total = register.close(methods, methods % 2, units_prod=5)
+            expected_expenses: list[float] = [
+                asset.depreciate(methods[row], 1, units_prod=5).value if isinstance(asset, TangibleAsset) else
+                asset.amortize(methods[row] % 2, 1).value
+                for row, asset in enumerate(expected)
+            ]
+
+            self.assertEqual(expenses.value.tolist(), expected_expenses)
+            self.assertEqual(total, Money(sum(expected_expenses)))
+
+        self.assertEqual(register.total_depr.tolist(), expected.total_depr.tolist())
+        self.assertEqual(register.total_amort.tolist(), expected.total_amort.tolist())
+        self.assertEqual(register.rem_life.tolist(), expected.rem_life.tolist())
+
+        # Spreading the work across threads or processes doesn't change anything.
+        serial: list[float] = []
+
+        for workers, use_threads in ((1, False), (3, True), (2, False)):
+            register.reset()
+            expenses, total = register.close(methods, methods % 2, 12, units_prod=5, workers=workers,
+                                             use_threads=use_threads, chunk_size=17)
+            serial = serial or [total.value] + expenses.value.tolist()
+
+            self.assertEqual([total.value] + expenses.value.tolist(), serial)
+
+        with self.assertRaises(ValueError):
+            register.close(workers=0)
+
+        with self.assertRaises(ValueError):
+            register.close(amort_method=6)
+
+    def test_names(self) -> None:
+        register: AssetRegister = AssetRegister()
+        register.add_tangible("Truck", 12, 1_000)
+
+        with self.assertRaises(ValueError):
+            register.add_intangible("Truck", 12, 1_000)
+
+        with self.assertRaises(KeyError):
+            _ = register["Car"]
+
+        with self.assertRaises(IndexError):
+            _ = register[1]
+
+        with self.assertRaises(TypeError):
+            register.add("Car")
+
+        register[0].name = "Car"
+
+        self.assertIn("Car", register)
+        self.assertNotIn("Truck", register)
+        self.assertEqual(register.row("Car"), 0)
+
+
+if __name__ == "__main__":
+    ut.main()
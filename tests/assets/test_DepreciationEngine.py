@@ -0,0 +1,128 @@
+"""
+test_DepreciationEngine.py
+
+The engine has to give exactly the same numbers as calling TangibleAsset.depreciate() on each asset, so most of these
+tests build the same register both ways and compare them.
+"""
+
+import random
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.assets.DepreciationEngine import DepreciationEngine
+from src.pyacty.assets.TangibleAsset import TangibleAsset
+from src.pyacty.fundamentals.MoneyArray import MoneyArray
+
+
+def random_register(size: int, seed: int = 0) -> (list[TangibleAsset], list[int], list[float]):
+    """
+    Makes a register of random assets.
+    :param size: How many assets to make.
+    :param seed: The seed for the random number generator.
+    :return: The assets, the method of each asset, and the decline of each asset.
+    """
+    generator: random.Random = random.Random(seed)
+    assets: list[TangibleAsset] = []
+    methods: list[int] = []
+    declines: list[float] = []
+
+    for i in range(size):
+        value: float = round(generator.uniform(1_000, 500_000), 2)
+        assets.append(TangibleAsset(f"Asset {i}", generator.choice([12, 36, 60, 84, 120, 360]), value,
+                                    round(value * generator.choice([0, 0.05, 0.1, 0.25]), 2),
+                                    generator.choice([100, 1_000, 5_000])))
+        methods.append(generator.choice([0, 1, 2, 3]))
+        declines.append(generator.choice([1.0, 1.5, 2.0]))
+
+    return assets, methods, declines
+
+
+class TestDepreciationEngine(ut.TestCase):
+    def test_matches_depreciate(self) -> None:
+        assets, methods, declines = random_register(500)
+        engine: DepreciationEngine = DepreciationEngine.from_assets(assets, methods, declines)
+        units_prod: np.ndarray = np.random.default_rng(0).integers(0, 400, (len(assets), 35))
+
+        # 35 years covers the longest life in the register, plus some extra years to test fully depreciated assets.
+        schedule: MoneyArray = engine.schedule(35, units_prod=units_prod)
+
+        for row, asset in enumerate(assets):
+            expected: list[float] = [asset.depreciate(methods[row], decline=declines[row],
+                                                      units_prod=int(units_prod[row, step])).value
+                                     for step in range(35)]
+
+            self.assertEqual(schedule.value[row].tolist(), expected)
+            self.assertEqual(engine.total_depr[row], asset.total_depr.value)
+            self.assertEqual(engine.rem_life[row], asset.rem_life)
+
+    def test_monthly(self) -> None:
+        assets, methods, declines = random_register(100, seed=1)
+        engine: DepreciationEngine = DepreciationEngine.from_assets(assets, methods, declines)
+
+        for _ in range(24):
+            expenses: MoneyArray = engine.depreciate(1, units_prod=10)
+
+            for row, asset in enumerate(assets):
+                self.assertEqual(expenses.value[row], asset.depreciate(methods[row], 1, declines[row], 10).value)
+
+    def test_salvage_floor(self) -> None:
+        engine: DepreciationEngine = DepreciationEngine([100_000, 100_000], 10 * 12, [0, 1], 10_000, decline=2.0)
+        # Declining balance never quite reaches the salvage value on its own, so this goes past the life of the assets.
+        engine.schedule(15)
+
+        self.assertTrue(np.all(MoneyArray(engine.net_value) == 10_000))
+        self.assertTrue(np.all(MoneyArray(engine.depreciable_value) == 0))
+
+        # Once an asset is fully depreciated, depreciating it again does nothing.
+        self.assertTrue(np.all(engine.depreciate() == 0))
+
+    def test_default_steps(self) -> None:
+        engine: DepreciationEngine = DepreciationEngine([120, 60], [120, 60], 0)
+
+        self.assertEqual(engine.schedule(periods=12).shape, (2, 10))
+
+        engine.reset()
+
+        self.assertEqual(engine.schedule(periods=1).shape, (2, 120))
+        self.assertTrue(np.all(engine.rem_life <= 0))
+
+    def test_period_lookup(self) -> None:
+        assets, methods, declines = random_register(200, seed=2)
+        engine: DepreciationEngine = DepreciationEngine.from_assets(assets, methods, declines)
+        expenses: MoneyArray = engine.schedule(30, units_prod=25)
+        accumulated: np.ndarray = expenses.cumsum(axis=1).value
+
+        for period in (1, 5, 10, 30):
+            # Sum of the Years' Digits is only defined over the life of the asset, so only compare those periods.
+            in_life: np.ndarray = period * 12 <= engine.life
+            lookup: np.ndarray = engine.accumulated_at(period, units_prod=25).value
+
+            np.testing.assert_allclose(lookup[in_life], accumulated[in_life, period - 1], atol=1e-6)
+            np.testing.assert_allclose(engine.net_value_at(period, units_prod=25).value, engine.value - lookup)
+
+        # Each asset can be looked up at a different period, and agrees with the single asset version.
+        periods: np.ndarray = np.arange(len(assets)) % 10
+        lookup: MoneyArray = engine.accumulated_at(periods, units_prod=25)
+
+        for row, asset in enumerate(assets):
+            self.assertAlmostEqual(lookup.value[row], asset.accumulated_depr_at(methods[row], int(periods[row]),
+                                                                                decline=declines[row],
+                                                                                units_prod=25).value, places=6)
+
+        with self.assertRaises(ValueError):
+            engine.accumulated_at(-1)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            DepreciationEngine([100], [12], 4)
+
+        with self.assertRaises(ZeroDivisionError):
+            DepreciationEngine([100], [12], 3).depreciate()
+
+        with self.assertRaises(ZeroDivisionError):
+            DepreciationEngine([100], [6], 2).depreciate()
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -2,9 +2,12 @@
 test_IntangibleAsset
 """
 
+from typing import Iterator
 import unittest as ut
 
 from src.pyacty.assets.IntangibleAsset import IntangibleAsset
+from src.pyacty.assets.Schedule import Schedule
+from src.pyacty.fundamentals.Money import Money
 
 
 class TestIntangibleAsset(ut.TestCase):
@@ -45,6 +48,81 @@ class TestIntangibleAsset(ut.TestCase):
         self.assertEqual(asset_one.net_value, 64_000)
         self.assertEqual(asset_one.total_amort, 36_000)
 
+    def test_fully_amortized(self) -> None:
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 2 * 12, 100_000)
+
+        self.assertEqual(asset_one.amortize(0, 18), 75_000)
+        # Only the remaining $25,000 can be amortized, and that's what should be returned.
+        self.assertEqual(asset_one.amortize(0, 18), 25_000)
+        self.assertEqual(asset_one.net_value, 0)
+        self.assertEqual(asset_one.amortize(0, 18), 0)
+
+    def test_schedule(self) -> None:
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 10 * 12, 100_000)
+
+        self.assertEqual(len(asset_one.schedule(1, decline=2.0)), 10)
+        self.assertEqual(asset_one.schedule(1, decline=2.0)[1], 16_000)
+        self.assertIs(asset_one.schedule(1, decline=2.0), asset_one.schedule(1, decline=2.0))
+        self.assertEqual([expense for _, expense, _, _ in asset_one.stream_schedule(1, decline=2.0)],
+                         list(asset_one.schedule(1, decline=2.0)))
+        self.assertEqual(asset_one.total_amort, 0)
+
+    def test_annuity(self) -> None:
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 30 * 12, 300_000)
+
+        # The level payment is $1,798.65, and $1,500 of the first one is interest.
+        self.assertEqual(asset_one.amortize(2, 1, rate=0.06), 298.65)
+        self.assertEqual(asset_one.rem_life, 359)
+
+        for _ in range(359):
+            asset_one.amortize(2, 1, rate=0.06)
+
+        self.assertEqual(asset_one.net_value, 0)
+
+        # Without interest, the annuity is the same as straight line.
+        self.assertEqual(IntangibleAsset("Test Asset", 10 * 12, 100_000).amortize(2), 10_000)
+
+    def test_bullet_balloon(self) -> None:
+        bullet: IntangibleAsset = IntangibleAsset("Test Asset", 5 * 12, 1_000)
+        balloon: IntangibleAsset = IntangibleAsset("Test Asset", 5 * 12, 1_000)
+
+        self.assertEqual([bullet.amortize(3).value for _ in range(5)], [0, 0, 0, 0, 1_000])
+        self.assertEqual([balloon.amortize(4, balloon=400).value for _ in range(5)], [120, 120, 120, 120, 520])
+        self.assertEqual(balloon.net_value, 0)
+
+    def test_schedule_arguments(self) -> None:
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 4 * 12, 6_000)
+        balloon: Money = Money(2_000.0)
+        schedule: Schedule = asset_one.schedule(4, 12, balloon=balloon)
+        stream: Iterator[tuple[int, Money, Money, Money]] = asset_one.stream_schedule(4, 12, balloon=balloon)
+        next(stream)
+
+        # Changing the Money objects afterwards doesn't change the schedule, or the one cached for their old value.
+        balloon += 5_000
+
+        self.assertEqual([expense.value for expense in schedule], [1_000, 1_000, 1_000, 3_000])
+        self.assertEqual([expense.value for _, expense, _, _ in stream], [1_000, 1_000, 3_000])
+        self.assertIs(asset_one.schedule(4, 12, balloon=2_000.0), schedule)
+
+    def test_negative_amortization(self) -> None:
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 2 * 12, 1_000)
+
+        # 1% interest a month is $10, so a $5 payment leaves $5 to be added to the asset.
+        self.assertEqual(asset_one.amortize(5, 1, rate=0.12, payment=5), -5)
+        self.assertEqual(asset_one.net_value, 1_005)
+        self.assertEqual(asset_one.amortize(5, 1, rate=0.12, payment=20), 9.95)
+
+
+    def test_owned_money(self) -> None:
+        total_amort: Money = Money(20_000)
+        asset_one: IntangibleAsset = IntangibleAsset("Test Asset", 10 * 12, 100_000)
+        asset_one.total_amort = total_amort
+
+        # Amortizing the asset doesn't change the Money object it was given.
+        self.assertEqual(asset_one.amortize(0), 10_000)
+        self.assertEqual(asset_one.total_amort, 30_000)
+        self.assertEqual(total_amort, 20_000)
+
 
 if __name__ == "__main__":
     ut.main()
\ No newline at end of file
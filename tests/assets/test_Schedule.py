@@ -0,0 +1,78 @@
+"""
+test_Schedule.py
+"""
+
+import unittest as ut
+
+from src.pyacty.assets.Schedule import Schedule
+from src.pyacty.assets.TangibleAsset import TangibleAsset
+
+
+class TestSchedule(ut.TestCase):
+    def test_matches_depreciate(self) -> None:
+        asset: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000, 10_000)
+        schedule: Schedule = asset.schedule(1, decline=2.0)
+        copy_asset: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000, 10_000)
+
+        self.assertEqual(len(schedule), 10)
+
+        for period in range(len(schedule)):
+            self.assertEqual(schedule[period].value, copy_asset.depreciate(1, decline=2.0).value)
+            self.assertEqual(schedule.accumulated(period).value, copy_asset.total_depr.value)
+            self.assertEqual(schedule.net_value(period).value, copy_asset.net_value.value)
+
+        # Creating and reading a schedule shouldn't change the asset.
+        self.assertEqual(asset.total_depr, 0)
+        self.assertEqual(asset.rem_life, 120)
+
+    def test_random_access(self) -> None:
+        asset: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000)
+        schedule: Schedule = asset.schedule(0, periods=1)
+
+        self.assertEqual(len(schedule), 120)
+        self.assertEqual(schedule[37], 833.33)
+        self.assertEqual(schedule.accumulated(37), 31_666.67)
+        self.assertEqual(schedule[-1], schedule[119])
+        self.assertEqual(len(schedule[10:20]), 10)
+        self.assertEqual(schedule[::-1][0], schedule[119])
+        self.assertEqual(sum(expense.value for expense in schedule), 100_000)
+
+        with self.assertRaises(IndexError):
+            _ = schedule[120]
+
+    def test_cache(self) -> None:
+        asset: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000, 10_000)
+        schedule: Schedule = asset.schedule(0)
+
+        self.assertIs(asset.schedule(0), schedule)
+        self.assertIsNot(asset.schedule(0, periods=1), schedule)
+
+        asset.slvg_value = 0
+        self.assertIsNot(asset.schedule(0), schedule)
+        self.assertEqual(asset.schedule(0)[0], 10_000)
+        # The old schedule still describes the asset as it was when the schedule was created.
+        self.assertEqual(schedule[0], 9_000)
+
+        schedule = asset.schedule(0)
+        asset.value = 50_000
+        self.assertEqual(asset.schedule(0)[0], 5_000)
+
+        schedule = asset.schedule(0)
+        asset.life = 5 * 12
+        self.assertEqual(len(asset.schedule(0)), 5)
+        self.assertEqual(len(schedule), 10)
+
+    def test_read_only(self) -> None:
+        schedule: Schedule = TangibleAsset("Test Asset", 10 * 12, 100_000).schedule(0)
+
+        with self.assertRaises(AttributeError):
+            schedule._length = 5
+
+        # Changing a Money object handed out by the schedule doesn't change the schedule.
+        expense = schedule[0]
+        expense += 1_000
+        self.assertEqual(schedule[0], 10_000)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,79 @@
+"""
+test_ScheduleExport.py
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest as ut
+
+from src.pyacty.assets.AssetRegister import AssetRegister
+from src.pyacty.assets.IntangibleAsset import IntangibleAsset
+from src.pyacty.assets.ScheduleExport import export_schedules, schedule_rows
+from src.pyacty.assets.TangibleAsset import TangibleAsset
+from src.pyacty.custom_exceptions import SupportError
+
+
+class TestScheduleExport(ut.TestCase):
+    truck: TangibleAsset = TangibleAsset("Truck", 10 * 12, 100_000, 10_000)
+    patent: IntangibleAsset = IntangibleAsset("Patent", 5 * 12, 50_000)
+
+    def test_rows(self) -> None:
+        rows: list[tuple] = list(schedule_rows([self.truck, self.patent], [2, 0]))
+
+        self.assertEqual(len(rows), 10 + 5)
+        self.assertEqual(rows[0], ("Truck", 0, 16_363.64, 16_363.64, 83_636.36))
+        self.assertEqual(rows[9], ("Truck", 9, 1_636.36, 90_000.0, 10_000.0))
+        self.assertEqual(rows[-1], ("Patent", 4, 10_000.0, 50_000.0, 0.0))
+
+        # The rows match the cached schedules, and the assets themselves aren't changed.
+        self.assertEqual([row[2] for row in rows[:10]], [expense.rounded_value for expense in self.truck.schedule(2)])
+        self.assertEqual(self.truck.total_depr, 0)
+        self.assertEqual(self.patent.total_amort, 0)
+
+        # Every asset needs a method, so a list of methods that's too short or too long isn't cut off silently.
+        with self.assertRaises(ValueError):
+            list(schedule_rows([self.truck, self.patent], [2]))
+
+        with self.assertRaises(ValueError):
+            list(schedule_rows([self.truck], [2, 0]))
+
+    def test_export(self) -> None:
+        register: AssetRegister = AssetRegister()
+
+        for i in range(50):
+            register.add_tangible(f"Asset {i}", 30 * 12, 1_000 * (i + 1))
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(export_schedules(register, directory, "schedules", "csv", periods=1), 50 * 360)
+            self.assertEqual(export_schedules(register, directory, "schedules", "jsonl", periods=1), 50 * 360)
+
+            with open(os.path.join(directory, "schedules.csv"), newline="") as infile:
+                csv_rows: list[list[str]] = list(csv.reader(infile))
+
+            with open(os.path.join(directory, "schedules.jsonl")) as infile:
+                json_rows: list[dict] = [json.loads(line) for line in infile]
+
+            with self.assertRaises(SupportError):
+                export_schedules(register, directory, "schedules", "xml")
+
+            # An incomplete export never replaces the file.
+            with self.assertRaises(ValueError):
+                export_schedules(register, directory, "schedules", "csv", [0] * 49, periods=1)
+
+            with open(os.path.join(directory, "schedules.csv"), newline="") as infile:
+                self.assertEqual(sum(1 for _ in infile), 50 * 360 + 1)
+
+        self.assertEqual(csv_rows[0], ["asset", "period", "expense", "accumulated", "net_value"])
+        self.assertEqual(csv_rows[-1], ["Asset 49", "359", "138.89", "50000.0", "0.0"])
+        self.assertEqual(json_rows[-1], {"asset": "Asset 49", "period": 359, "expense": 138.89,
+                                         "accumulated": 50_000.0, "net_value": 0.0})
+        self.assertEqual(len(json_rows), len(csv_rows) - 1)
+
+        # Exporting doesn't change the register.
+        self.assertEqual(register.total_depr.sum(), 0)
+
+
+if __name__ == "__main__":
+    ut.main()
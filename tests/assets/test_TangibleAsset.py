@@ -7,6 +7,7 @@ First time using unittest. I'm not 100% sure how to structure the file.
 import unittest as ut
 
 from src.pyacty.assets.TangibleAsset import TangibleAsset
+from src.pyacty.fundamentals.Money import Money
 
 asset_one: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000)
 asset_two: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, 100_000, 10_000)
@@ -273,6 +274,51 @@ class TestTangibleAsset(ut.TestCase):
         self.assertEqual(asset_five.total_depr, 100_000)
         self.assertEqual(asset_five.prod_cap, 100)
 
+    def test_period_lookup(self) -> None:
+        # The lookups should agree with actually depreciating the asset, without changing the asset.
+        asset_two.reset()
+
+        self.assertEqual(asset_two.accumulated_depr_at(0, 0), 0)
+        self.assertEqual(asset_two.accumulated_depr_at(0, 2), 18_000)
+        self.assertEqual(asset_two.net_value_at(1, 2, decline=2.0), 64_000)
+        self.assertEqual(asset_two.depreciable_value_at(2, 2), 58_909.09)
+        self.assertEqual(asset_four.accumulated_depr_at(3, 1, units_prod=100), 9_000)
+        self.assertEqual(asset_two.total_depr, 0)
+
+        # Past the end of the asset's life, everything but the salvage value has been depreciated.
+        self.assertEqual(asset_two.net_value_at(0, 50), 10_000)
+        self.assertEqual(asset_two.net_value_at(2, 50), 10_000)
+
+        for method in range(4):
+            for periods in (1, 12):
+                asset_four.reset()
+
+                for period in range(1, 10 * 12 // periods + 1):
+                    asset_four.depreciate(method, periods, 2.0, 10)
+                    self.assertAlmostEqual(asset_four.accumulated_depr_at(method, period, periods, 2.0, 10).value,
+                                           asset_four.total_depr.value, places=6)
+
+        with self.assertRaises(ValueError):
+            asset_two.accumulated_depr_at(0, -1)
+
+
+    def test_owned_money(self) -> None:
+        value: Money = Money(100_000)
+        slvg_value: Money = Money(10_000)
+        total_depr: Money = Money(5_000)
+        asset: TangibleAsset = TangibleAsset("Test Asset", 10 * 12, value, slvg_value)
+        asset.total_depr = total_depr
+
+        # Depreciating the asset doesn't change the Money objects it was given.
+        asset.depreciate(0)
+        asset.value = value
+        asset.slvg_value = slvg_value
+
+        self.assertEqual(asset.total_depr, 14_000)
+        self.assertEqual((value, slvg_value, total_depr), (100_000, 10_000, 5_000))
+        self.assertIsNot(asset.value, value)
+        self.assertIsNot(asset.slvg_value, slvg_value)
+
 
 if __name__ == "__main__":
     ut.main()
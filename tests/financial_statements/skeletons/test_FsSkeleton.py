@@ -0,0 +1,157 @@
+"""
+test_FsSkeleton.py
+"""
+
+import contextlib
+import io
+import unittest as ut
+
+from src.pyacty.custom_exceptions import SupportError
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.skeletons.FsSkeleton import FsSkeleton
+
+
+class TestFsSkeleton(ut.TestCase):
+    def setUp(self) -> None:
+        self.bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        self.bal_sheet.add_account("Cash", "asset", 1_234.5)
+        self.bal_sheet.add_account("Accounts Payable", "liability", 200.0)
+        self.bal_sheet.add_account("Common Stock", "equity", 1_034.5)
+        self.skeleton: FsSkeleton = FsSkeleton(self.bal_sheet.fs, "PyActy", "Balance Sheet", "12/31/2024")
+
+    def test_width(self) -> None:
+        stdout: io.StringIO = io.StringIO()
+
+        # Rendering doesn't print anything unless it's asked to.
+        with contextlib.redirect_stdout(stdout):
+            str(self.bal_sheet)
+
+        self.assertEqual(stdout.getvalue(), "")
+
+        self.skeleton.add_element(self.skeleton.templates["title"], "title", title = "Assets")
+        element: FsSkeleton._Element = self.skeleton.elements["title"]
+
+        self.assertEqual(element.width, len("| Assets|"))
+        self.assertEqual(element._width, len("| Assets|"))
+
+        # Changing the mappings or the indent updates the width.
+        element.mappings["title"] = "Current Assets"
+
+        self.assertEqual(element.width, len("| Current Assets|"))
+
+        self.skeleton.add_element(self.skeleton.templates["account"], "cash", indent_level = 1, account_name = "Cash",
+                                  account_bal = "1,234.50")
+        cash: FsSkeleton._Element = self.skeleton.elements["cash"]
+
+        self.assertEqual(cash.width, len("|    Cash1,234.50 |"))
+
+        cash.indent_level = 2
+
+        self.assertEqual(cash.width, len("|        Cash1,234.50 |"))
+
+    def test_min_width(self) -> None:
+        self.assertEqual(self.skeleton.min_width, 0)
+
+        self.skeleton.add_element(self.skeleton.templates["header"], "short", header_name = "PyActy")
+        self.skeleton.add_element(self.skeleton.templates["header"], "long", header_name = "A" * 100)
+        self.skeleton.add_element(self.skeleton.templates["header"], "also_long", header_name = "B" * 100)
+
+        self.assertEqual(self.skeleton.min_width, 102)
+
+        # The widest width is only gone once every element that wide is gone.
+        self.skeleton.del_element("long")
+
+        self.assertEqual(self.skeleton.min_width, 102)
+
+        self.skeleton.elements["also_long"].mappings["header_name"] = "B" * 50
+
+        self.assertEqual(self.skeleton.min_width, 52)
+
+        self.skeleton.del_element("also_long")
+
+        self.assertEqual(self.skeleton.min_width, len("|PyActy|"))
+
+        self.skeleton.elements = {}
+
+        self.assertEqual(self.skeleton.min_width, 0)
+
+    def test_mappings(self) -> None:
+        self.skeleton.add_element(self.skeleton.templates["header"], "header", header_name = "A" * 100)
+        mappings: dict[str:str] = self.skeleton.elements["header"].mappings
+
+        self.assertEqual(self.skeleton.min_width, 102)
+
+        # Every way of changing the mappings updates the width.
+        mappings |= {"header_name": "B"}
+
+        self.assertEqual(self.skeleton.min_width, len("|B|"))
+
+        mappings.clear()
+        mappings.setdefault("header_name", "C" * 10)
+
+        self.assertEqual(self.skeleton.min_width, 12)
+
+        self.assertEqual(mappings.popitem(), ("header_name", "C" * 10))
+        mappings["note"] = "D" * 20
+        mappings["header_name"] = "E"
+
+        self.assertEqual(self.skeleton.min_width, len("|E|"))
+        self.assertEqual(self.skeleton.elements["header"].width, len("|E|"))
+
+    def test_stream(self) -> None:
+        stream: io.StringIO = io.StringIO()
+        self.skeleton.auto_write(stream)
+
+        # Streaming doesn't add any elements.
+        self.assertEqual(self.skeleton.elements, {})
+
+        stdout: io.StringIO = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout):
+            output: str = self.skeleton.auto_render(print_output = True)
+
+        self.assertEqual(stream.getvalue(), output)
+        self.assertEqual(stdout.getvalue(), output)
+        self.assertEqual(output, str(self.bal_sheet))
+        self.assertEqual(len(output.splitlines()), len(self.skeleton.elements))
+        self.assertEqual(list(self.skeleton.lines()), output.splitlines())
+
+        stream = io.StringIO()
+        self.skeleton.write(stream)
+
+        self.assertEqual(stream.getvalue(), output)
+
+        # Without any categories, the bottom edge goes right under the header.
+        empty: FsSkeleton = FsSkeleton({}, "PyActy", "Balance Sheet", "12/31/2024")
+
+        self.assertEqual(list(empty.auto_lines())[-2:],
+                         [f"|{"For year ended December 31, 2024":^73}|", f"+{"-" * 73}+"])
+
+    def test_update(self) -> None:
+        self.skeleton.auto_build()
+        before: list[str] = list(self.skeleton.lines())
+
+        self.assertEqual("".join(f"{line}\n" for line in before), str(self.bal_sheet))
+
+        self.bal_sheet.fs["asset"]["Cash"]["bal"] = 1_500.0
+        self.skeleton.update_accounts({"Cash": "asset"})
+        after: list[str] = list(self.skeleton.lines())
+        changed: list[int] = [index for index, (old, new) in enumerate(zip(before, after)) if old is not new]
+
+        # Only the account and the total of its category are rendered again.
+        self.assertEqual([after[index] for index in changed], [
+            f"|    Cash{"·" * 56}1,500.00 |",
+            f"| Total Asset{" " * 52}1,500.00 |"
+        ])
+        self.assertEqual("".join(f"{line}\n" for line in after),
+                         FsSkeleton(self.bal_sheet.fs, "PyActy", "Balance Sheet", "12/31/2024").auto_render())
+
+        columns: FsSkeleton = FsSkeleton(self.bal_sheet.fs, "PyActy", "Balance Sheet", "12/31/2024",
+                                         columns=["2024", "2023"])
+
+        with self.assertRaises(SupportError):
+            columns.update_accounts({"Cash": "asset"})
+
+
+if __name__ == "__main__":
+    ut.main()
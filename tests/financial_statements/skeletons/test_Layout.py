@@ -0,0 +1,58 @@
+"""
+test_Layout.py
+"""
+
+from string import Template
+import unittest as ut
+
+from src.pyacty.statements.skeletons.FsSkeleton import FsSkeleton
+from src.pyacty.statements.skeletons.Layout import Layout, compile_layout
+
+
+class TestLayout(ut.TestCase):
+    def test_matches_template(self) -> None:
+        templates: list[str] = [
+            "| $indent$account_name$central_spacer$account_bal |",
+            "|$left_spacer${header_name}$right_spacer|",
+            "$end$divider$end",
+            "| {braces} $$5.00 $note$spacer|"
+        ]
+        mappings: dict[str:str] = {"account_name": "Cash", "account_bal": "1,000.00", "header_name": "PyActy",
+                                   "note": "Note"}
+
+        for text in templates:
+            layout: Layout = compile_layout(text)
+            width: int = len(Template(text).substitute(mappings, end="", divider="", indent="   ", spacer="",
+                                                       left_spacer="", central_spacer="", right_spacer=""))
+
+            self.assertEqual(layout.width(mappings, 3), width, text)
+
+            for min_width in [0, width + 7, 75]:
+                width_diff: int = max(min_width - width, 0)
+
+                self.assertEqual(layout.render(mappings, width, min_width, 3, True), Template(text).substitute(
+                    mappings, end="+", divider="-" * (min_width - 2), indent="   ", spacer=" " * width_diff,
+                    left_spacer=" " * (width_diff // 2), central_spacer="·" * width_diff,
+                    right_spacer=" " * (width_diff - width_diff // 2)
+                ), text)
+
+        with self.assertRaises(KeyError):
+            compile_layout("| $missing |").width({}, 0)
+
+        with self.assertRaises(ValueError):
+            compile_layout("| $ |")
+
+    def test_shared(self) -> None:
+        # Every template with the same string is only compiled once.
+        self.assertIs(compile_layout("| $title$spacer|"), compile_layout(Template("| $title$spacer|")))
+
+        skeleton: FsSkeleton = FsSkeleton({}, "PyActy", "Balance Sheet", "12/31/2024")
+        skeleton.add_template("note", "| Note: $note$spacer|")
+        skeleton.add_element(skeleton.templates["note"], "note", note = "Unaudited")
+
+        self.assertIs(skeleton.elements["note"]._layout, compile_layout(skeleton.templates["note"]))
+        self.assertEqual(skeleton.render(), f"| Note: Unaudited{" " * 57}|")
+
+
+if __name__ == "__main__":
+    ut.main()
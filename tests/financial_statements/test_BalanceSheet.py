@@ -126,7 +126,25 @@ def test_two() -> None:
     }
 
 
+def test_units() -> None:
+    """
+    Makes sure balances that don't add up exactly as floats still balance.
+    :return: Nothing.
+    """
+    small_bs: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+    small_bs.add_account("Cash", "asset", 0.3)
+    small_bs.add_account("Accounts Payable", "liability", 0.1)
+    small_bs.add_account("Common Stock", "equity", 0.2)
+
+    assert small_bs.check_bs() == (True, "Balance sheet is balanced, no reason applicable.")
+
+    small_bs.add_account("Retained Earnings", "equity", 0.1)
+
+    assert small_bs.check_bs() == (False, "Liabilities and equity exceeds assets by 0.1")
+
+
 if __name__ == "__main__":
     print(bal_sheet)
     test_one()
     test_two()
+    test_units()
@@ -0,0 +1,94 @@
+"""
+test_BinarySnapshot.py
+"""
+
+import os
+import tempfile
+import unittest as ut
+
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.BinarySnapshot import BinarySnapshot
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+
+
+class TestBinarySnapshot(ut.TestCase):
+    def test_round_trip(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.25)
+        bal_sheet.add_account("Équipement", "asset", 5_000.0, "non-current")
+        bal_sheet.add_account("Common Stock", "equity", 6_100.25)
+        bal_sheet.add_account("Treasury Stock", "equity", 100.0, contra=True)
+        saved: dict = {category: dict(accounts) for category, accounts in bal_sheet.fs.items()}
+
+        with tempfile.TemporaryDirectory() as directory:
+            bal_sheet.save_snapshot(os.path.join(directory, "nested"), "bs")
+            path: str = os.path.join(directory, "nested", "bs.pyfs")
+            bal_sheet.reset()
+            bal_sheet.load_snapshot(path)
+
+            self.assertEqual(bal_sheet.fs, saved)
+            self.assertEqual(list(bal_sheet.fs), ["asset", "liability", "equity"])
+            self.assertEqual(bal_sheet.category_of("Équipement"), "asset")
+
+            # The categories in the snapshot are added after the statement's own.
+            inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+            inc_statement.load_snapshot(path)
+
+            self.assertEqual(list(inc_statement.fs), ["revenue", "expense", "asset", "liability", "equity"])
+
+    def test_lazy(self) -> None:
+        inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+
+        for i in range(10_000):
+            inc_statement.add_account(f"Account {i:05}", "revenue" if i % 3 else "expense", i / 100)
+
+        with tempfile.TemporaryDirectory() as directory:
+            inc_statement.save_snapshot(directory, "is")
+            snapshot: BinarySnapshot = BinarySnapshot(os.path.join(directory, "is.pyfs"))
+
+            self.assertEqual(len(snapshot), 10_000)
+            self.assertEqual(snapshot["Account 00042"], {"d/c": "debit", "bal": 0.42})
+            self.assertEqual(snapshot.category_of("Account 09998"), "revenue")
+            self.assertIn("Account 00000", snapshot)
+            self.assertNotIn("Account 10000", snapshot)
+            self.assertEqual(list(snapshot)[:2], ["Account 00001", "Account 00002"])
+
+            # Only the accounts that were looked up have been built.
+            self.assertEqual(len(snapshot._materialized), 1)
+
+            totals: dict[str:float] = snapshot.total_accounts()
+
+            for category, total in inc_statement.total_accounts().items():
+                self.assertAlmostEqual(totals[category], total, places=6)
+
+            self.assertEqual(snapshot.to_fs(), inc_statement.fs)
+
+            with self.assertRaises(KeyError):
+                snapshot.account("Account 10000")
+
+            # Anything that isn't a complete snapshot is rejected.
+            with open(os.path.join(directory, "is.pyfs"), "rb") as infile:
+                data: bytes = infile.read()
+
+            for name, contents in [("short.pyfs", data[:-1]), ("magic.pyfs", b"X" + data[1:]), ("empty.pyfs", b"0")]:
+                with open(os.path.join(directory, name), "wb") as outfile:
+                    outfile.write(contents)
+
+                with self.assertRaises(ValueError):
+                    BinarySnapshot(os.path.join(directory, name))
+
+    def test_empty(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+
+        with tempfile.TemporaryDirectory() as directory:
+            bal_sheet.save_snapshot(directory, "bs")
+            snapshot: BinarySnapshot = BinarySnapshot(os.path.join(directory, "bs.pyfs"))
+
+            self.assertEqual(len(snapshot), 0)
+            self.assertEqual(snapshot.categories, ["asset", "liability", "equity"])
+            self.assertEqual(snapshot.total_accounts(), {"asset": 0.0, "liability": 0.0, "equity": 0.0})
+            self.assertNotIn("Cash", snapshot)
+
+
+if __name__ == "__main__":
+    ut.main()
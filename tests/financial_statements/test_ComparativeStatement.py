@@ -0,0 +1,120 @@
+"""
+test_ComparativeStatement.py
+"""
+
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.ComparativeStatement import ComparativeStatement
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+
+
+class TestComparativeStatement(ut.TestCase):
+    def setUp(self) -> None:
+        # 18 months, from July 2023 to December 2024.
+        self.dates: list[str] = [f"{(month - 1) % 12 + 1:02}/28/{2023 + (month - 1) // 12}" for month in range(7, 25)]
+        self.comparative: ComparativeStatement = ComparativeStatement("PyActy", self.dates, "Income Statement")
+        self.comparative.add_account("Sales", "revenue", np.arange(1, 19) * 100.0)
+        self.comparative.add_account("Returns", "revenue", 10.0, contra=True)
+        self.comparative.add_account("Rent", "expense", 50.0)
+
+    def test_accounts(self) -> None:
+        self.assertEqual(len(self.comparative), 3)
+        self.assertEqual(self.comparative.balances.shape, (18, 3))
+        self.assertEqual(self.comparative.chart["revenue"]["Returns"], {"d/c": "debit"})
+        self.assertEqual(self.comparative.statement(2)["revenue"]["Sales"], {"d/c": "credit", "bal": 300.0})
+
+        totals: dict[str:np.ndarray] = self.comparative.total_accounts(signed=True)
+
+        self.assertEqual(totals["revenue"][0], -90.0)
+        self.assertEqual(totals["expense"][-1], 50.0)
+
+        # Columns are views, so changing one changes the statement.
+        self.comparative.column("Rent")[0] = 75.0
+
+        self.assertEqual(self.comparative.balances[0, 2], 75.0)
+
+        with self.assertRaises(ValueError):
+            self.comparative.add_account("Rent", "expense")
+
+        with self.assertRaises(ValueError):
+            self.comparative.add_account("Wages", "expense", [1.0, 2.0])
+
+        self.assertNotIn("Wages", self.comparative)
+
+        with self.assertRaises(KeyError):
+            self.comparative.column("Wages")
+
+    def test_aggregation(self) -> None:
+        deltas: ComparativeStatement = self.comparative.deltas()
+
+        self.assertEqual(deltas.dates, self.dates[1:])
+        self.assertTrue(np.array_equal(deltas.column("Sales"), np.full(17, 100.0)))
+        self.assertTrue(np.array_equal(deltas.column("Rent"), np.zeros(17)))
+
+        rolling: ComparativeStatement = self.comparative.rolling(12)
+
+        self.assertEqual(rolling.dates[0], "06/28/2024")
+        self.assertEqual(rolling.column("Sales").tolist(), [sum(range(start, start + 12)) * 100.0
+                                                            for start in range(1, 8)])
+        self.assertTrue(np.array_equal(self.comparative.rolling(1).balances, self.comparative.balances))
+
+        # The fiscal years start in January, so the first year only has six months.
+        ytd: ComparativeStatement = self.comparative.ytd()
+
+        self.assertEqual(ytd.column("Rent").tolist(), [50.0 * month for month in [*range(1, 7), *range(1, 13)]])
+
+        # With a June year end, July 2023 to June 2024 is a single fiscal year.
+        self.assertEqual(self.comparative.ytd(6).column("Rent").tolist(),
+                         [50.0 * month for month in [*range(1, 13), *range(1, 7)]])
+
+        with self.assertRaises(ValueError):
+            self.comparative.rolling(19)
+
+        with self.assertRaises(ValueError):
+            self.comparative.ytd(13)
+
+    def test_from_statements(self) -> None:
+        statements: list[BalanceSheet] = []
+
+        for year in range(2022, 2025):
+            bal_sheet: BalanceSheet = BalanceSheet("PyActy", f"12/31/{year}")
+            bal_sheet.add_account("Cash", "asset", 1_000.0 * (year - 2021))
+            bal_sheet.add_account("Common Stock", "equity", 1_000.0 * (year - 2021))
+
+            if year == 2023:
+                bal_sheet.add_account("Land", "asset", 123_456.0, "non-current")
+
+            statements.append(bal_sheet)
+
+        comparative: ComparativeStatement = ComparativeStatement.from_statements(statements)
+
+        self.assertEqual(comparative.dates, ["12/31/2022", "12/31/2023", "12/31/2024"])
+        self.assertEqual(comparative.column("Land").tolist(), [0.0, 123_456.0, 0.0])
+        self.assertEqual(comparative.statement(0)["asset"]["Land"], {"d/c": "debit", "bal": 0.0, "term": "non-current"})
+        self.assertEqual(list(comparative.chart), ["asset", "liability", "equity"])
+
+        # Every column is as wide as its widest number, and every line is as wide as the others.
+        lines: list[str] = str(comparative).splitlines()
+
+        self.assertTrue(lines[7].endswith(" 12/31/2022  12/31/2023  12/31/2024 |"))
+        self.assertTrue(lines[11].startswith("| Total Asset "))
+        self.assertTrue(lines[11].endswith(" 1,000.00  125,456.00    3,000.00 |"))
+        self.assertEqual(len({len(line) for line in lines}), 1)
+
+    def test_statement_round_trip(self) -> None:
+        inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        inc_statement.add_account("Sales", "revenue", 500.0)
+
+        comparative: ComparativeStatement = ComparativeStatement.from_statements([inc_statement])
+
+        self.assertEqual(comparative.statement(0), inc_statement.fs)
+
+        with self.assertRaises(ValueError):
+            ComparativeStatement.from_statements([])
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,102 @@
+"""
+test_Consolidation.py
+"""
+
+import unittest as ut
+
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.Consolidation import Consolidation
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+
+
+class TestConsolidation(ut.TestCase):
+    def setUp(self) -> None:
+        self.consolidation: Consolidation = Consolidation("PyActy Group", "12/31/2024")
+
+        parent_bs: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        parent_bs.add_account("Cash", "asset", 1000.0)
+        parent_bs.add_account("Investment in Sub", "asset", 600.0, "non-current")
+        parent_bs.add_account("Receivable from Sub", "asset", 100.0)
+        parent_bs.add_account("Common Stock", "equity", 1700.0)
+        parent_is: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        parent_is.add_account("Sales", "revenue", 500.0)
+        parent_is.add_account("Rent", "expense", 200.0)
+
+        # The group owns 80% of the subsidiary.
+        sub_bs: BalanceSheet = BalanceSheet("Sub", "12/31/2024")
+        sub_bs.add_account("Cash", "asset", 800.0)
+        sub_bs.add_account("Payable to Parent", "liability", 100.0)
+        sub_bs.add_account("Stock", "equity", 700.0)
+        sub_is: IncomeStatement = IncomeStatement("Sub", "12/31/2024")
+        sub_is.add_account("Sales", "revenue", 300.0)
+        sub_is.add_account("Rent", "expense", 100.0)
+
+        self.consolidation.add_entity("Parent", parent_bs, parent_is)
+        self.consolidation.add_entity("Sub", sub_bs, sub_is, ownership=0.8, mapping={"Stock": "Sub Equity"})
+        self.consolidation.add_elimination(["Receivable from Sub", "Payable to Parent"])
+        self.consolidation.add_elimination(["Investment in Sub", "Sub Equity"], "Goodwill", "asset", "non-current")
+
+    def test_consolidate(self) -> None:
+        bal_sheet: BalanceSheet
+        inc_statement: IncomeStatement
+        bal_sheet, inc_statement = self.consolidation.consolidate()
+
+        self.assertEqual(bal_sheet.fs["asset"], {
+            "Cash": {"d/c": "debit", "bal": 1800.0, "term": "current"},
+            "Goodwill": {"d/c": "debit", "bal": 40.0, "term": "non-current"}
+        })
+        self.assertEqual(bal_sheet.fs["liability"], {})
+        self.assertEqual(bal_sheet.fs["equity"], {
+            "Common Stock": {"d/c": "credit", "bal": 1700.0},
+            "Non-controlling Interest": {"d/c": "credit", "bal": 140.0}
+        })
+        self.assertTrue(bal_sheet.check_bs()[0])
+
+        # The parent's 300, plus 80% of the subsidiary's 200.
+        self.assertEqual(inc_statement.fs["expense"][self.consolidation.nci_income]["bal"], 40.0)
+        self.assertEqual(inc_statement.net_income(), 460.0)
+
+        with self.assertRaises(ValueError):
+            self.consolidation.add_entity("Parent")
+
+        with self.assertRaises(ValueError):
+            self.consolidation.add_entity("Other", ownership=0.0)
+
+        with self.assertRaises(ValueError):
+            self.consolidation.consolidate(workers=0)
+
+    def test_eliminate(self) -> None:
+        # Without a plug, balances that don't cancel out are an error.
+        self.consolidation.eliminations[1] = (["Investment in Sub", "Sub Equity"], None, "asset", "non-current")
+
+        with self.assertRaises(ValueError):
+            self.consolidation.consolidate()
+
+        # Mapping accounts from different categories to the same group account is an error too.
+        self.consolidation.mapping["Receivable from Sub"] = "Cash"
+        self.consolidation.mapping["Payable to Parent"] = "Cash"
+
+        with self.assertRaises(ValueError):
+            self.consolidation.consolidate()
+
+    def test_parallel(self) -> None:
+        for index in range(25):
+            subsidiary: BalanceSheet = BalanceSheet(f"Sub {index}", "12/31/2024")
+            subsidiary.add_account(f"Cash {index % 4}", "asset", 10.01 * index)
+            subsidiary.add_account("Common Stock", "equity", 10.01 * index)
+            self.consolidation.add_entity(f"Sub {index}", subsidiary, ownership=0.5 if index % 3 else 1.0)
+
+        serial: list[dict] = [statement.fs for statement in self.consolidation.consolidate()]
+
+        # The result doesn't depend on how the entities are chunked or where they're added up.
+        for workers, use_threads, chunk_size in [(1, False, 3), (4, True, None), (3, True, 1), (2, False, 5)]:
+            parallel: list[dict] = [statement.fs for statement in
+                                    self.consolidation.consolidate(workers, use_threads, chunk_size)]
+
+            self.assertEqual(parallel, serial)
+            self.assertEqual([list(accounts) for fs in parallel for accounts in fs.values()],
+                             [list(accounts) for fs in serial for accounts in fs.values()])
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -2,7 +2,20 @@
 test_FinancialStatement.py
 """
 
+import copy
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest as ut
+
+from src.pyacty.custom_exceptions import SupportError, TotalsDriftError
+from src.pyacty.statements.Account import Account
+from src.pyacty.statements.BalanceSheet import BalanceSheet
 from src.pyacty.statements.FinancialStatement import FinancialStatement
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+from src.pyacty.statements.skeletons.FsSkeleton import FsSkeleton
 
 test_fs: FinancialStatement = FinancialStatement("Zufall Company", "12/31/2024")
 
@@ -43,3 +56,379 @@ test_fs.fs = {
 }
 
 print(test_fs)
+
+
+class TestFinancialStatement(ut.TestCase):
+    def test_lookups(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.0)
+        bal_sheet.add_account("Accounts Payable", "liability", 400.0)
+        bal_sheet.add_account("Treasury Stock", "equity", 100.0, contra=True)
+
+        self.assertEqual(bal_sheet.category_of("Cash"), "asset")
+        self.assertEqual(bal_sheet.category_of("Accounts Payable"), "liability")
+        self.assertEqual(bal_sheet.true_value("Cash"), 1_000.0)
+        self.assertEqual(bal_sheet.true_value("Accounts Payable"), -400.0)
+        self.assertEqual(bal_sheet.true_value("Treasury Stock"), 100.0)
+
+        bal_sheet.del_account("Cash")
+
+        self.assertEqual(bal_sheet.fs["asset"], {})
+
+        with self.assertRaises(KeyError):
+            bal_sheet.category_of("Cash")
+
+        with self.assertRaises(KeyError):
+            bal_sheet.del_account("Cash")
+
+        with self.assertRaises(KeyError):
+            bal_sheet.true_value("Cash")
+
+    def test_duplicates(self) -> None:
+        inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        inc_statement.add_account("Sales", "revenue", 500.0)
+
+        # Adding the same account to the same category replaces it, like it always has.
+        inc_statement.add_account("Sales", "revenue", 600.0)
+
+        self.assertEqual(inc_statement.fs["revenue"]["Sales"]["bal"], 600.0)
+
+        with self.assertRaises(ValueError):
+            inc_statement.add_account("Sales", "expense", 100.0)
+
+        self.assertNotIn("Sales", inc_statement.fs["expense"])
+
+        with self.assertRaises(ValueError):
+            inc_statement.fs = {"revenue": {"Sales": {}}, "expense": {"Sales": {}}}
+
+    def test_sync(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.0)
+        bal_sheet.reset()
+
+        with self.assertRaises(KeyError):
+            bal_sheet.category_of("Cash")
+
+        # Replacing fs (which load_fs() does too) rebuilds the index.
+        bal_sheet.fs = {"asset": {}, "liability": {"Cash": {"d/c": "credit", "bal": 5.0}}, "equity": {}}
+
+        self.assertEqual(bal_sheet.category_of("Cash"), "liability")
+        self.assertEqual(bal_sheet.true_value("Cash"), -5.0)
+
+    def test_totals(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.10)
+        bal_sheet.add_account("Inventory", "asset", 0.20)
+        bal_sheet.add_account("Accounts Payable", "liability", 400.0)
+        bal_sheet.add_account("Common Stock", "equity", 700.30)
+        bal_sheet.add_account("Treasury Stock", "equity", 100.0, contra=True)
+
+        self.assertEqual(bal_sheet.total_accounts(), {"asset": 1_000.30, "liability": 400.0, "equity": 800.30})
+        self.assertEqual(bal_sheet.signed_totals(), {"asset": 1_000.30, "liability": -400.0, "equity": -600.30})
+
+        # Changing a balance directly updates the totals too.
+        bal_sheet.fs["asset"]["Cash"]["bal"] += 0.1
+        bal_sheet.fs["equity"]["Treasury Stock"]["d/c"] = "credit"
+        bal_sheet.del_account("Inventory")
+        bal_sheet.add_account("Accounts Payable", "liability", 500.0)
+
+        self.assertEqual(bal_sheet.total_accounts(), {"asset": 1_000.20, "liability": 500.0, "equity": 800.30})
+        self.assertEqual(bal_sheet.signed_totals()["equity"], -800.30)
+        self.assertEqual(bal_sheet.verify_totals(), {})
+
+        # Floats would have drifted by now, but the totals are kept in integer units.
+        for _ in range(10_000):
+            bal_sheet.fs["asset"]["Cash"]["bal"] += 0.1
+            bal_sheet.fs["asset"]["Cash"]["bal"] -= 0.1
+
+        self.assertEqual(bal_sheet.verify_totals(), {})
+
+    def test_mutators(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 100.0)
+        cash: Account = bal_sheet.fs["asset"]["Cash"]
+
+        # Every way of changing a dict keeps the totals up to date.
+        cash |= {"bal": 5.0}
+
+        self.assertIs(bal_sheet.fs["asset"]["Cash"], cash)
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 5.0)
+
+        self.assertEqual(cash.pop("bal"), 5.0)
+        self.assertEqual(cash.pop("bal", None), None)
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 0.0)
+
+        self.assertEqual(cash.setdefault("bal", 20.0), 20.0)
+        self.assertEqual(cash.setdefault("bal", 30.0), 20.0)
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 20.0)
+
+        self.assertEqual(cash.popitem(), ("bal", 20.0))
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 0.0)
+
+        cash["bal"] = 40.0
+        cash.clear()
+
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 0.0)
+        self.assertEqual(bal_sheet.signed_totals()["asset"], 0.0)
+
+        with self.assertRaises(KeyError):
+            cash.popitem()
+
+        self.assertEqual(bal_sheet.verify_totals(), {})
+
+    def test_released(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 0.3)
+        bal_sheet.add_account("Land", "asset", 10.0, "non-current")
+        cash: Account = bal_sheet.fs["asset"]["Cash"]
+        land: Account = bal_sheet.fs["asset"]["Land"]
+
+        # Accounts that are still in the statement keep updating the totals after fs is replaced.
+        bal_sheet.fs = bal_sheet.fs
+        cash["bal"] = 100.0
+
+        self.assertIs(bal_sheet.fs["asset"]["Cash"], cash)
+        self.assertEqual(bal_sheet.total_accounts()["asset"], 110.0)
+
+        # Accounts that were taken out of the statement don't.
+        bal_sheet.del_account("Land")
+        land["bal"] = 50.0
+        bal_sheet.add_account("Cash", "asset", 1.0)
+        cash["bal"] = 200.0
+        bal_sheet.reset()
+
+        for account in [land, cash]:
+            account["bal"] = 1_000.0
+            account.update({"d/c": "credit"})
+
+        self.assertEqual(bal_sheet.total_accounts(), {"asset": 0.0, "liability": 0.0, "equity": 0.0})
+        self.assertEqual(bal_sheet.verify_totals(), {})
+
+    def test_drift(self) -> None:
+        inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        inc_statement.add_account("Sales", "revenue", 500.0)
+        inc_statement.add_account("Rent", "expense", 200.0)
+
+        self.assertEqual(inc_statement.net_income(), 300.0)
+
+        # Going around add_account() leaves the totals behind.
+        inc_statement.fs["expense"]["Wages"] = {"d/c": "debit", "bal": 50.0}
+        inc_statement.verify = True
+
+        with self.assertRaises(TotalsDriftError):
+            inc_statement.net_income()
+
+        self.assertEqual(inc_statement.verify_totals(repair=True), {"expense": -50.0})
+        self.assertEqual(inc_statement.net_income(), 250.0)
+
+        # The repair turned the plain dict into an Account, so it's tracked from now on.
+        inc_statement.fs["expense"]["Wages"]["bal"] = 100.0
+
+        self.assertEqual(inc_statement.net_income(), 200.0)
+        self.assertIsInstance(copy.deepcopy(inc_statement.fs["expense"]["Wages"]), Account)
+
+    def test_save(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.0)
+        bal_sheet.add_account("Common Stock", "equity", 1_000.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            # Every missing directory is created, and the path works on any operating system.
+            nested: str = os.path.join(directory, "2024", "q4")
+            bal_sheet.save_fs(nested, "bs")
+            bal_sheet.save_fs(nested, "bs", "JSON", compress=True)
+
+            self.assertEqual(sorted(os.listdir(nested)), ["bs.csv", "bs.json", "bs.json.gz"])
+
+            with open(os.path.join(nested, "bs.csv"), newline="") as infile:
+                self.assertEqual(list(csv.reader(infile)), [["Asset"], ["", "Cash", "1000.0"], ["Liability"],
+                                                            ["Equity"], ["", "Common Stock", "1000.0"]])
+
+            with gzip.open(os.path.join(nested, "bs.json.gz"), "rt") as infile:
+                self.assertEqual(json.load(infile), bal_sheet.fs)
+
+            # A failed save leaves the old file alone and doesn't leave a temporary file behind.
+            bal_sheet.fs["asset"]["Cash"]["note"] = object()
+
+            with self.assertRaises(TypeError):
+                bal_sheet.save_fs(nested, "bs", "json")
+
+            with open(os.path.join(nested, "bs.json")) as infile:
+                self.assertEqual(json.load(infile)["asset"]["Cash"]["bal"], 1_000.0)
+
+            self.assertEqual(len(os.listdir(nested)), 3)
+
+            with self.assertRaises(ValueError):
+                bal_sheet.save_fs(nested, "bs", "xlsx")
+
+    @ut.skipUnless(os.name == "posix", "Permissions are only fully supported on POSIX systems.")
+    def test_permissions(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            # New files get the same permissions open() would give them.
+            with open(os.path.join(directory, "reference.txt"), "w"):
+                pass
+
+            bal_sheet.save_fs(directory, "bs", "csv")
+            path: str = os.path.join(directory, "bs.csv")
+
+            self.assertEqual(os.stat(path).st_mode & 0o777,
+                             os.stat(os.path.join(directory, "reference.txt")).st_mode & 0o777)
+
+            # Files that are replaced keep their permissions.
+            os.chmod(path, 0o640)
+            bal_sheet.save_fs(directory, "bs", "csv")
+
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+    def test_load(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.0)
+        bal_sheet.add_account("Common Stock", "equity", 1_100.0)
+        bal_sheet.add_account("Treasury Stock", "equity", 100.0, contra=True)
+        saved: dict = copy.deepcopy(bal_sheet.fs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            bal_sheet.save_fs(directory, "bs")
+            bal_sheet.save_fs(directory, "bs", "jsonl", compress=True)
+
+            for file_name in ["bs.json", "bs.jsonl.gz"]:
+                bal_sheet.reset()
+                bal_sheet.load_fs(os.path.join(directory, file_name))
+
+                self.assertEqual(bal_sheet.fs, saved)
+                self.assertEqual(bal_sheet.category_of("Treasury Stock"), "equity")
+                self.assertEqual(bal_sheet.total_accounts(), {"asset": 1_000.0, "liability": 0.0, "equity": 1_200.0})
+
+            # CSV files only have balances, so every account gets the default balance of its category.
+            bal_sheet.load_fs(os.path.join(directory, "bs.csv"))
+
+            self.assertEqual(bal_sheet.fs["equity"]["Treasury Stock"], {"d/c": "credit", "bal": 100.0})
+            self.assertEqual(list(bal_sheet.fs), ["asset", "liability", "equity"])
+
+            invalid_files: dict[str:str] = {
+                "category.csv": "Assets\n,Cash,1000.0\n",
+                "orphan.csv": ",Cash,1000.0\n",
+                "balance.csv": "Asset\n,Cash,lots\n",
+                "duplicate.csv": "Asset\n,Cash,1.0\n,Cash,2.0\n",
+                "dc.jsonl": '{"category": "asset", "account": "Cash", "d/c": "dr", "bal": 1.0}\n',
+                "bal.jsonl": '{"category": "asset", "account": "Cash", "d/c": "debit", "bal": "1.0"}\n',
+                "name.jsonl": '{"category": "asset", "d/c": "debit", "bal": 1.0}\n',
+                "category.json": '{"Assets": {}}'
+            }
+
+            for file_name, contents in invalid_files.items():
+                with open(os.path.join(directory, file_name), "w") as outfile:
+                    outfile.write(contents)
+
+                with self.assertRaises(ValueError, msg=file_name):
+                    bal_sheet.load_fs(os.path.join(directory, file_name))
+
+            # Nothing changes when a file isn't valid.
+            self.assertEqual(bal_sheet.fs["asset"], {"Cash": {"d/c": "debit", "bal": 1_000.0}})
+
+            with self.assertRaises(SupportError):
+                bal_sheet.load_fs(os.path.join(directory, "bs.xlsx"))
+
+    def test_history(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 100.0)
+        bal_sheet.add_account("Accounts Payable", "liability", 40.0)
+        bal_sheet.add_account("Common Stock", "equity", 60.0)
+        before: dict = copy.deepcopy(bal_sheet.fs)
+
+        start: int = bal_sheet.snapshot("start")
+        bal_sheet.fs["asset"]["Cash"]["bal"] = 150.0
+        bal_sheet.fs["asset"]["Cash"]["bal"] = 175.0
+        bal_sheet.add_account("Land", "asset", 10.0, "non-current")
+        bal_sheet.del_account("Accounts Payable")
+
+        # Only the accounts that changed are copied, and only once each.
+        self.assertEqual(bal_sheet.history.states_at(start)[0], {
+            "Cash": ("asset", {"d/c": "debit", "bal": 100.0, "term": "current"}),
+            "Land": None,
+            "Accounts Payable": ("liability", {"d/c": "credit", "bal": 40.0, "term": "current"})
+        })
+
+        what_if: int = bal_sheet.snapshot("what-if")
+        after: dict = copy.deepcopy(bal_sheet.fs)
+        bal_sheet.reset()
+
+        self.assertEqual(bal_sheet.history.labels, ["start", "what-if"])
+        self.assertEqual(bal_sheet.version(start), before)
+        self.assertEqual(bal_sheet.version(what_if), after)
+        self.assertEqual(bal_sheet.diff(start, what_if), {
+            "asset": {
+                "Cash": ({"d/c": "debit", "bal": 100.0, "term": "current"},
+                         {"d/c": "debit", "bal": 175.0, "term": "current"}),
+                "Land": (None, {"d/c": "debit", "bal": 10.0, "term": "non-current"})
+            },
+            "liability": {"Accounts Payable": ({"d/c": "credit", "bal": 40.0, "term": "current"}, None)}
+        })
+        self.assertEqual(bal_sheet.diff(what_if, what_if), {})
+
+        bal_sheet.rollback(what_if)
+
+        self.assertEqual(bal_sheet.fs, after)
+        self.assertEqual(bal_sheet.total_accounts(), {"asset": 185.0, "liability": 0.0, "equity": 60.0})
+
+        bal_sheet.fs["equity"]["Common Stock"]["bal"] = 0.0
+        bal_sheet.rollback(start)
+
+        self.assertEqual(bal_sheet.fs, before)
+        self.assertEqual(bal_sheet.history.labels, ["start"])
+        self.assertEqual(bal_sheet.verify_totals(), {})
+        self.assertEqual(bal_sheet.diff(start), {})
+
+        with self.assertRaises(KeyError):
+            bal_sheet.rollback(what_if)
+
+    def test_skeleton(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 100.0)
+        bal_sheet.add_account("Accounts Payable", "liability", 40.0)
+        bal_sheet.add_account("Common Stock", "equity", 60.0)
+
+        def fresh() -> str:
+            return FsSkeleton(bal_sheet.fs, bal_sheet.company, bal_sheet.fs_name, bal_sheet.date,
+                              decimals=bal_sheet.decimals).auto_render()
+
+        self.assertEqual(str(bal_sheet), fresh())
+
+        skeleton: FsSkeleton = bal_sheet.skeleton()
+        before: list[str] = [element._string for element in skeleton.elements.values()]
+
+        # Changing balances keeps the skeleton, and only the changed lines are rendered again.
+        bal_sheet.fs["asset"]["Cash"]["bal"] = 250.0
+        bal_sheet.fs["asset"]["Cash"].update({"bal": 150.0})
+
+        self.assertEqual(str(bal_sheet), fresh())
+        self.assertIs(bal_sheet.skeleton(), skeleton)
+        self.assertEqual([key for (key, element), old in zip(skeleton.elements.items(), before)
+                          if element._string is not old], ["account_cash", "total_asset"])
+
+        # New lines, replaced statements, and new dates need a new skeleton.
+        bal_sheet.add_account("Land", "asset", 1_000_000.0, "non-current")
+
+        self.assertIsNot(bal_sheet.skeleton(), skeleton)
+        self.assertEqual(str(bal_sheet), fresh())
+
+        skeleton = bal_sheet.skeleton()
+        bal_sheet.date = "12/31/2025"
+
+        self.assertIsNot(bal_sheet.skeleton(), skeleton)
+        self.assertEqual(str(bal_sheet), fresh())
+
+        bal_sheet.del_account("Land")
+
+        self.assertEqual(str(bal_sheet), fresh())
+
+        bal_sheet.reset()
+
+        self.assertEqual(str(bal_sheet), fresh())
+
+
+if __name__ == "__main__":
+    ut.main()
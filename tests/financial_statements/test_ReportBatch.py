@@ -0,0 +1,61 @@
+"""
+test_ReportBatch.py
+"""
+
+import io
+import os
+import tempfile
+import unittest as ut
+
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.FinancialStatement import FinancialStatement
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+from src.pyacty.statements.ReportBatch import save_reports, write_reports
+from src.pyacty.statements.skeletons.FsSkeleton import FsSkeleton
+
+
+class TestReportBatch(ut.TestCase):
+    def setUp(self) -> None:
+        self.statements: dict[str:FinancialStatement] = {}
+
+        for index in range(12):
+            bal_sheet: BalanceSheet = BalanceSheet(f"Sub {index}", "12/31/2024")
+            bal_sheet.add_account("Cash", "asset", 100.0 * index)
+            bal_sheet.add_account("Common Stock", "equity", 100.0 * index)
+            inc_statement: IncomeStatement = IncomeStatement(f"Sub {index}", "12/31/2024")
+            inc_statement.add_account("Sales", "revenue", 10.0 * index)
+
+            self.statements[f"sub_{index}_bs"] = bal_sheet
+            self.statements[f"sub_{index}_is"] = inc_statement
+
+        self.expected: str = "\n".join(str(statement) for statement in self.statements.values())
+
+    def test_write(self) -> None:
+        for workers, use_threads, chunk_size in [(1, False, None), (3, True, None), (2, True, 5), (2, False, None)]:
+            stream: io.StringIO = io.StringIO()
+            write_reports(self.statements.values(), stream, workers, use_threads, chunk_size)
+
+            self.assertEqual(stream.getvalue(), self.expected)
+
+        with self.assertRaises(ValueError):
+            write_reports(self.statements.values(), io.StringIO(), workers=0)
+
+        # Every skeleton starts with the same pre-made templates, so they're only ever compiled once.
+        self.assertIs(FsSkeleton({}, "PyActy", "Balance Sheet", "12/31/2024").templates["account"],
+                      FsSkeleton.TEMPLATES["account"])
+
+    def test_save(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            for workers, use_threads in [(1, False), (2, False), (3, True)]:
+                paths: list[str] = save_reports(self.statements, os.path.join(directory, "reports"), workers,
+                                                use_threads)
+
+                self.assertEqual(len(paths), len(self.statements))
+
+                for path, statement in zip(paths, self.statements.values()):
+                    with open(path, encoding="utf-8") as infile:
+                        self.assertEqual(infile.read(), str(statement))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,130 @@
+"""
+test_FixedMoney.py
+
+FixedMoney should behave exactly like Money, so most of these mirror test_Money.py. The rest make sure the integer math
+doesn't drift like floats do.
+"""
+
+import unittest as ut
+
+from src.pyacty.fundamentals.FixedMoney import FixedMoney, SCALE
+from src.pyacty.fundamentals.Money import Money
+
+
+class TestFixedMoney(ut.TestCase):
+    bal_one: FixedMoney = FixedMoney(10_000.101)
+    bal_two: FixedMoney = FixedMoney(20_000.202, "₱")
+    bal_five: FixedMoney = FixedMoney(50_000.505, "₩")
+    bal_six: FixedMoney = FixedMoney(60_000.606, "¥")
+    bal_seven: FixedMoney = FixedMoney(10_000.554555555555555555)
+
+    def test_add(self) -> None:
+        self.assertEqual(self.bal_one + self.bal_two, 30_000.30)
+        self.assertEqual(self.bal_five + self.bal_six, 110_001.11)
+        self.assertIsInstance(self.bal_one + 1, FixedMoney)
+
+    def test_sub(self) -> None:
+        self.assertEqual(self.bal_one - 100, 9_900.10)
+        self.assertEqual(100 - self.bal_one, -9_900.10)
+
+    def test_mul_div(self) -> None:
+        self.assertEqual(self.bal_one * 10, 100_001.01)
+        self.assertEqual(10 * self.bal_one, 100_001.01)
+        self.assertEqual(self.bal_one / 2, 5_000.05)
+        self.assertEqual(self.bal_one / FixedMoney(2), 5_000.05)
+        self.assertEqual(self.bal_one // 10, 1_000)
+        self.assertEqual(100_000 // self.bal_one, 9)
+        self.assertEqual(self.bal_one % 10, 0.10)
+        self.assertEqual(self.bal_one ** 2, 100_002_020.01)
+
+        with self.assertRaises(ZeroDivisionError):
+            _ = self.bal_one / 0
+
+    def test_comparisons(self) -> None:
+        self.assertGreater(self.bal_two, self.bal_one)
+        self.assertGreaterEqual(self.bal_one, 10_000.10)
+        self.assertLess(15_000, self.bal_two)
+        self.assertLessEqual(20_000.20, self.bal_two)
+        self.assertNotEqual(self.bal_one, 10_000.101)
+        self.assertNotEqual(self.bal_one, None)
+
+    def test_rounded_values(self) -> None:
+        self.assertEqual(self.bal_one.rounded_value, 10_000.10)
+        self.assertEqual(self.bal_two.rounded_value, 20_000.20)
+        self.assertEqual(self.bal_five.rounded_value, 50_000.51)
+        self.assertEqual(self.bal_six.rounded_value, 60_000.61)
+        self.assertEqual(self.bal_seven.rounded_value, 10_000.56)
+        self.assertEqual(FixedMoney(-1.2356).rounded_value, Money(-1.2356).rounded_value)
+        self.assertEqual(FixedMoney(-1.2354).rounded_value, Money(-1.2354).rounded_value)
+        # -123.55 cents has a remainder of exactly 0.45 of a cent, so it rounds up. Money gets -1.24 because
+        # -1.2355 * 100 comes out as -123.55000000000001 in floats.
+        self.assertEqual(FixedMoney(-1.2355).rounded_value, -1.23)
+
+        FixedMoney.ieee_754_rounding = True
+
+        try:
+            self.assertEqual(self.bal_five.rounded_value, 50_000.50)
+            self.assertEqual(FixedMoney(0.125).rounded_value, round(0.125, 2))
+
+        finally:
+            FixedMoney.ieee_754_rounding = False
+
+    def test_half_up_boundary(self) -> None:
+        # Exactly 0.45 of a cent rounds up, just like it does with Money. These are values Money can represent closely
+        # enough to land on the boundary itself, since something like 1.0045 * 100 comes out as 100.4499... in floats.
+        for value in [0.0145, 2.0045, 10.0045, 12.3445, 99.9945, -2.0045]:
+            self.assertEqual(FixedMoney(value).rounded_value, Money(value).rounded_value, value)
+
+        self.assertEqual(FixedMoney(2.0045).cents, 201)
+        self.assertEqual(FixedMoney(2.00449).cents, 200)
+        self.assertEqual(FixedMoney.from_units(SCALE + 45 * SCALE // 10_000).rounded_value, 1.01)
+
+    def test_money_interop(self) -> None:
+        self.assertIsInstance(self.bal_one, Money)
+        self.assertEqual(Money(1.5) + FixedMoney(1.5), 3)
+        self.assertEqual(FixedMoney(1.5) + Money(1.5), 3)
+        self.assertEqual(FixedMoney(Money(2.25)).units, 2 * SCALE + SCALE // 4)
+
+    def test_no_drift(self) -> None:
+        running_float: Money = Money()
+        running_fixed: FixedMoney = FixedMoney()
+
+        for _ in range(10_000):
+            running_float += 0.01
+            running_fixed += 0.01
+
+        self.assertNotEqual(running_float.value, 100.0)
+        self.assertEqual(running_fixed.value, 100.0)
+        self.assertEqual(running_fixed.units, 100 * SCALE)
+
+    def test_in_place(self) -> None:
+        running_total: FixedMoney = FixedMoney(100)
+        same_object: FixedMoney = running_total
+
+        running_total += 50
+        running_total -= FixedMoney(25)
+        running_total *= 2
+        running_total /= 10
+
+        self.assertIs(running_total, same_object)
+        self.assertEqual(running_total.units, 25 * SCALE)
+
+    def test_hash(self) -> None:
+        self.assertEqual(FixedMoney(10.001), Money(9.999))
+        self.assertEqual(hash(FixedMoney(10.001)), hash(Money(9.999)))
+        self.assertFalse(hasattr(self.bal_one, "__dict__"))
+
+    def test_format(self) -> None:
+        show_decimals: bool = Money.show_decimals
+        Money.show_decimals = True
+
+        try:
+            self.assertEqual(str(self.bal_two), "₱20,000.20")
+            self.assertEqual(str(self.bal_seven), "$10,000.56")
+
+        finally:
+            Money.show_decimals = show_decimals
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -141,5 +141,47 @@ class TestMoney(ut.TestCase):
         self.assertEqual(self.bal_six.__str__(), "¥60,000.61")
         self.assertEqual(self.bal_seven.__str__(), "$10,000.56")
 
+    def test_in_place(self) -> None:
+        running_total: Money = Money(100)
+        same_object: Money = running_total
+
+        running_total += 50
+        running_total -= Money(25)
+        running_total *= 2
+        running_total /= 10
+
+        self.assertIs(running_total, same_object)
+        self.assertEqual(running_total, 25)
+
+    def test_hash(self) -> None:
+        self.assertEqual(Money(10.001), Money(9.999))
+        self.assertEqual(hash(Money(10.001)), hash(Money(9.999)))
+        self.assertEqual(hash(Money(10)), hash(10))
+
+        totals: dict[Money:str] = {Money(10.001): "ten"}
+        self.assertEqual(totals[Money(10)], "ten")
+        self.assertEqual(totals[10], "ten")
+
+    def test_slots(self) -> None:
+        self.assertFalse(hasattr(self.bal_one, "__dict__"))
+
+    def test_cached(self) -> None:
+        zero: Money = Money.cached(0)
+
+        self.assertIs(zero, Money.cached(0.0))
+        self.assertIsNot(Money.cached(0.5), Money.cached(0.5))
+
+        # Cached objects are shared, so the in-place operators must create a new object instead of changing them.
+        running_total: Money = zero
+        running_total += 5
+
+        self.assertIsNot(running_total, zero)
+        self.assertEqual(running_total, 5)
+        self.assertEqual(zero, 0)
+
+        with self.assertRaises(AttributeError):
+            zero.value = 5
+
+
 if __name__ == "__main__":
-    ut.main()
\ No newline at end of file
+    ut.main()
@@ -0,0 +1,99 @@
+"""
+test_MoneyArray.py
+
+A MoneyArray should give the same answers as doing the same math one Money object at a time.
+"""
+
+import random
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.fundamentals.FixedMoney import FixedMoney
+from src.pyacty.fundamentals.Money import Money
+from src.pyacty.fundamentals.MoneyArray import MoneyArray
+
+
+class TestMoneyArray(ut.TestCase):
+    balances: MoneyArray = MoneyArray([10_000.101, 20_000.202, 50_000.505, 10_000.554555555555555555])
+
+    def test_elementwise(self) -> None:
+        self.assertTrue(np.all(self.balances + 100 == [10_100.10, 20_100.20, 50_100.51, 10_100.56]))
+        self.assertTrue(np.all(self.balances * 10 == [100_001.01, 200_002.02, 500_005.05, 100_005.55]))
+        self.assertTrue(np.all(self.balances - self.balances == 0))
+        self.assertTrue(np.all(self.balances // 10 == [1_000, 2_000, 5_000, 1_000]))
+        self.assertTrue(np.all(100 - self.balances < 0))
+
+    def test_reductions(self) -> None:
+        total: Money = self.balances.sum()
+
+        self.assertIsInstance(total, Money)
+        self.assertEqual(total, 90_001.36)
+        self.assertEqual(self.balances.max(), 50_000.51)
+        self.assertEqual(self.balances.min(), 10_000.10)
+        self.assertEqual(self.balances.cumsum()[-1], 90_001.36)
+
+        grid: MoneyArray = MoneyArray([[1, 2], [3, 4]])
+        self.assertTrue(np.all(grid.sum(axis=0) == [4, 6]))
+
+    def test_rounding_matches_money(self) -> None:
+        generator: random.Random = random.Random(0)
+        values: list[float] = [generator.uniform(-1_000, 1_000) for _ in range(10_000)]
+        array: MoneyArray = MoneyArray(values)
+
+        self.assertEqual(array.rounded_value.tolist(), [Money(value).rounded_value for value in values])
+
+        Money.ieee_754_rounding = True
+
+        try:
+            self.assertEqual(array.rounded_value.tolist(), [Money(value).rounded_value for value in values])
+
+        finally:
+            Money.ieee_754_rounding = False
+
+    def test_scalar_interop(self) -> None:
+        self.assertIsInstance(Money(1) + self.balances, MoneyArray)
+        self.assertIsInstance(self.balances + Money(1), MoneyArray)
+        self.assertIsInstance(np.ones(4) + self.balances, MoneyArray)
+        self.assertIsInstance(self.balances[0], Money)
+        self.assertIsInstance(self.balances[1:], MoneyArray)
+        self.assertEqual(MoneyArray([Money(1.5), 2]).value.tolist(), [1.5, 2.0])
+        self.assertEqual([money.rounded_value for money in self.balances], self.balances.rounded_value.tolist())
+
+    def test_fixed_money_interop(self) -> None:
+        fixed: FixedMoney = FixedMoney(10_000.10)
+
+        # FixedMoney hands every operation with a MoneyArray to the MoneyArray, just like Money does.
+        for result, expected in [(fixed + self.balances, Money(10_000.10) + self.balances),
+                                 (fixed - self.balances, Money(10_000.10) - self.balances),
+                                 (fixed * self.balances, Money(10_000.10) * self.balances),
+                                 (fixed / self.balances, Money(10_000.10) / self.balances),
+                                 (self.balances - fixed, self.balances - Money(10_000.10))]:
+            self.assertIsInstance(result, MoneyArray)
+            self.assertTrue(np.all(result == expected))
+
+        self.assertEqual((fixed == self.balances).tolist(), [True, False, False, False])
+        self.assertEqual((fixed != self.balances).tolist(), [False, True, True, True])
+        self.assertEqual((fixed < self.balances).tolist(), [False, True, True, True])
+        self.assertEqual((fixed >= self.balances).tolist(), [True, False, False, False])
+
+        running_total: FixedMoney | MoneyArray = FixedMoney(1)
+        running_total += self.balances
+
+        self.assertIsInstance(running_total, MoneyArray)
+        self.assertTrue(np.all(running_total == self.balances + 1))
+
+    def test_format(self) -> None:
+        show_decimals: bool = Money.show_decimals
+        Money.show_decimals = True
+
+        try:
+            self.assertEqual(MoneyArray([1_234.5, 0.125], "€").formatted, ["€1,234.50", "€0.13"])
+            self.assertEqual(str(MoneyArray([1, 2])), "[$1.00, $2.00]")
+
+        finally:
+            Money.show_decimals = show_decimals
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,71 @@
+"""
+test_Journal.py
+"""
+
+import unittest as ut
+
+import numpy as np
+
+from src.pyacty.ledger.Journal import Journal
+
+
+class TestJournal(ut.TestCase):
+    def test_add_entry(self) -> None:
+        journal: Journal = Journal()
+        journal.add_entry([("Cash", "debit", 100.10), ("Revenue", "credit", 100.10)])
+        journal.add_entries([
+            [("Rent Expense", "debit", 40.0), ("Cash", "Credit", 40.0)],
+            [("Cash", "debit", 0.1), ("Cash", "debit", 0.2), ("Revenue", "credit", 0.3)]
+        ])
+
+        self.assertEqual(len(journal), 7)
+        self.assertEqual(journal.entries, 3)
+        self.assertEqual(journal.net_changes(), {"Cash": 60.4, "Revenue": -100.4, "Rent Expense": 40.0})
+
+        with self.assertRaises(ValueError):
+            journal.add_entry([("Cash", "debit", 100.0), ("Revenue", "credit", 99.99)])
+
+        with self.assertRaises(ValueError):
+            journal.add_entry([("Cash", "debit", -5.0), ("Revenue", "credit", -5.0)])
+
+        with self.assertRaises(ValueError):
+            journal.add_entry([("Cash", "dr", 5.0), ("Revenue", "credit", 5.0)])
+
+        with self.assertRaises(ValueError):
+            journal.add_entry([])
+
+        # Rejected entries aren't added at all.
+        self.assertEqual(len(journal), 7)
+
+        journal.clear()
+
+        self.assertEqual(journal.net_units(), {})
+
+    def test_add_batch(self) -> None:
+        lines: int = 1_000_000
+        entry: np.ndarray = np.arange(lines) // 2
+        account: np.ndarray = np.where(np.arange(lines) % 2 == 0, "Cash", "Revenue")
+        amount: np.ndarray = np.where(np.arange(lines) % 2 == 0, 0.01, -0.01)
+
+        journal: Journal = Journal()
+        journal.add_batch(entry, account, amount)
+        journal.add_entry([("Cash", "credit", 5.0), ("Revenue", "debit", 5.0)])
+
+        self.assertEqual(len(journal), lines + 2)
+        self.assertEqual(journal.entries, lines // 2 + 1)
+        self.assertEqual(journal.net_changes(), {"Cash": 4_995.0, "Revenue": -4_995.0})
+
+        # One unbalanced entry rejects the whole batch.
+        amount[7] = -0.02
+
+        with self.assertRaises(ValueError):
+            journal.add_batch(entry, account, amount)
+
+        with self.assertRaises(ValueError):
+            journal.add_batch(entry[:3], account, amount)
+
+        self.assertEqual(len(journal), lines + 2)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,111 @@
+"""
+test_Ledger.py
+"""
+
+import unittest as ut
+
+from src.pyacty.ledger.Journal import Journal
+from src.pyacty.ledger.Ledger import Ledger
+from src.pyacty.ledger.TrialBalance import TrialBalance
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+
+
+class TestLedger(ut.TestCase):
+    def setUp(self) -> None:
+        self.bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        self.inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        self.ledger: Ledger = Ledger(self.bal_sheet, self.inc_statement)
+
+        self.ledger.open_account("Cash", "asset", 1_000.0)
+        self.ledger.open_account("Accounts Payable", "liability")
+        self.ledger.open_account("Common Stock", "equity", 1_000.0)
+        self.ledger.open_account("Treasury Stock", "equity", contra=True)
+        self.ledger.open_account("Sales", "revenue")
+        self.ledger.open_account("Rent", "expense")
+
+    def test_post(self) -> None:
+        journal: Journal = Journal()
+        journal.add_entry([("Cash", "debit", 500.0), ("Sales", "credit", 500.0)])
+        journal.add_entry([("Rent", "debit", 200.0), ("Accounts Payable", "credit", 200.0)])
+        journal.add_entry([("Treasury Stock", "debit", 100.0), ("Cash", "credit", 100.0)])
+
+        self.assertEqual(self.ledger.post(journal), 5)
+        self.assertEqual(len(journal), 0)
+
+        # Debits increase debit accounts and credits increase credit accounts.
+        self.assertEqual(self.bal_sheet.fs["asset"]["Cash"]["bal"], 1_400.0)
+        self.assertEqual(self.bal_sheet.fs["liability"]["Accounts Payable"]["bal"], 200.0)
+        self.assertEqual(self.bal_sheet.fs["equity"]["Treasury Stock"]["bal"], 100.0)
+        self.assertEqual(self.inc_statement.net_income(), 300.0)
+        self.assertEqual(self.bal_sheet.verify_totals(), {})
+
+        journal.add_entry([("Cash", "credit", 50.0), ("Accounts Payable", "debit", 50.0)])
+        self.ledger.post(journal)
+
+        self.assertEqual(self.bal_sheet.fs["liability"]["Accounts Payable"]["bal"], 150.0)
+        self.assertEqual(self.ledger.batches_posted, 2)
+        self.assertEqual(self.ledger.entries_posted, 4)
+        self.assertEqual(self.ledger.lines_posted, 8)
+        self.assertEqual(self.ledger.accounts_updated, 7)
+        self.assertGreater(self.ledger.lines_per_second, 0)
+
+    def test_errors(self) -> None:
+        journal: Journal = Journal()
+        journal.add_entry([("Cash", "debit", 500.0), ("Gift Cards", "credit", 500.0)])
+
+        # Nothing is posted when an account is missing.
+        with self.assertRaises(KeyError):
+            self.ledger.post(journal)
+
+        self.assertEqual(self.bal_sheet.fs["asset"]["Cash"]["bal"], 1_000.0)
+        self.assertEqual(self.ledger.batches_posted, 0)
+
+        self.ledger.open_account("Gift Cards", "liability")
+        self.ledger.post(journal)
+
+        self.assertEqual(self.bal_sheet.fs["liability"]["Gift Cards"]["bal"], 500.0)
+
+        with self.assertRaises(ValueError):
+            self.ledger.open_account("Sales", "asset")
+
+        with self.assertRaises(ValueError):
+            self.ledger.open_account("Dividends", "distribution")
+
+    def test_close(self) -> None:
+        journals: list[Journal] = []
+
+        for period in range(1, 13):
+            journal: Journal = Journal()
+            journal.add_entry([("Cash", "debit", 100.0 * period), ("Sales", "credit", 100.0 * period)])
+            journal.add_entry([("Rent", "debit", 250.0), ("Cash", "credit", 250.0)])
+            journals.append(journal)
+
+        results: list[tuple[TrialBalance, float]] = list(self.ledger.run_periods(journals))
+
+        self.assertTrue(all(trial_balance.balanced for trial_balance, _ in results))
+        self.assertEqual([net_income for _, net_income in results], [100.0 * period - 250.0 for period in range(1, 13)])
+        self.assertEqual(self.ledger.periods_closed, 12)
+        # Only the journals themselves count as postings, not the closing entries.
+        self.assertEqual(self.ledger.batches_posted, 12)
+        self.assertEqual(self.ledger.entries_posted, 24)
+        self.assertEqual(self.ledger.lines_posted, 48)
+
+        # The temporary accounts are zeroed out and everything they earned is in retained earnings.
+        self.assertEqual(self.inc_statement.total_accounts(), {"revenue": 0.0, "expense": 0.0})
+        self.assertEqual(self.bal_sheet.fs["equity"]["Retained Earnings"]["bal"], 7_800.0 - 3_000.0)
+        self.assertEqual(self.bal_sheet.fs["asset"]["Cash"]["bal"], 1_000.0 + 4_800.0)
+        self.assertEqual(self.ledger.trial_balance().total_debits, 5_800.0)
+
+        # A loss is debited to retained earnings, and closing an empty period does nothing.
+        self.inc_statement.fs["expense"]["Rent"]["bal"] = 6_000.0
+        self.bal_sheet.fs["asset"]["Cash"]["bal"] -= 6_000.0
+
+        self.assertEqual(self.ledger.close_period(), -6_000.0)
+        self.assertEqual(self.bal_sheet.fs["equity"]["Retained Earnings"]["bal"], -1_200.0)
+        self.assertEqual(self.ledger.close_period(), 0.0)
+        self.assertTrue(self.ledger.trial_balance().balanced)
+
+
+if __name__ == "__main__":
+    ut.main()
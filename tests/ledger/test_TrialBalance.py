@@ -0,0 +1,38 @@
+"""
+test_TrialBalance.py
+"""
+
+import unittest as ut
+
+from src.pyacty.ledger.TrialBalance import TrialBalance
+from src.pyacty.statements.BalanceSheet import BalanceSheet
+from src.pyacty.statements.IncomeStatement import IncomeStatement
+
+
+class TestTrialBalance(ut.TestCase):
+    def test_from_statements(self) -> None:
+        bal_sheet: BalanceSheet = BalanceSheet("PyActy", "12/31/2024")
+        bal_sheet.add_account("Cash", "asset", 1_000.10)
+        bal_sheet.add_account("Common Stock", "equity", 900.0)
+        bal_sheet.add_account("Treasury Stock", "equity", 100.0, contra=True)
+        inc_statement: IncomeStatement = IncomeStatement("PyActy", "12/31/2024")
+        inc_statement.add_account("Sales", "revenue", 300.20)
+        inc_statement.add_account("Rent", "expense", 100.10)
+
+        trial_balance: TrialBalance = TrialBalance.from_statements([bal_sheet, inc_statement])
+
+        self.assertEqual(len(trial_balance), 5)
+        self.assertEqual(list(trial_balance)[2], ("Treasury Stock", "equity", 100.0, 0.0))
+        self.assertEqual(trial_balance.total_debits, 1_200.20)
+        self.assertEqual(trial_balance.total_credits, 1_200.20)
+        self.assertTrue(trial_balance.balanced)
+
+        # A negative balance goes in the opposite column.
+        trial_balance.add_row("Overdraft", "asset", -0.01, "debit")
+
+        self.assertEqual(trial_balance.rows[-1], ("Overdraft", "asset", 0.0, 0.01))
+        self.assertFalse(trial_balance.balanced)
+
+
+if __name__ == "__main__":
+    ut.main()